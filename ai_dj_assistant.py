@@ -4,14 +4,25 @@ AI DJ Assistant using Gemini API
 Provides intelligent auto mixing, key-mixing, and fader effects
 """
 
+import asyncio
+import functools
 import json
+import re
 import time
-import random
 import threading
-from typing import Dict, List, Optional, Callable, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+try:
+    # pydantic (used by the Gemini SDK for schemas) requires this on < 3.12
+    from typing_extensions import TypedDict
+except ImportError:
+    from typing import TypedDict
+
 try:
     import google.generativeai as genai
 
@@ -22,6 +33,160 @@ except ImportError:
         "Warning: google-generativeai not installed. AI features will use mock implementation."
     )
 
+GEMINI_MODEL = "gemini-pro"
+
+# Static instructions shared by every request, sent as the system instruction
+DJ_SYSTEM_INSTRUCTION = """
+You are a professional DJ AI assistant. Each request starts with a task line.
+
+Task: TRACK ANALYSIS
+Based on the track name, provide estimates for:
+1. Tempo (BPM) - typical range 60-200
+2. Musical key (C, C#, D, D#, E, F, F#, G, G#, A, A#, B)
+3. Energy level (0.0 to 1.0, where 0 is calm and 1 is high energy)
+4. Genre (Electronic, House, Techno, Trance, Hip-Hop, Rock, Pop, etc.)
+5. Mood (Energetic, Calm, Dark, Uplifting, Melancholic, etc.)
+6. Estimated duration in seconds (typical 180-300 for most tracks)
+
+Respond with ONLY a JSON object in this exact format:
+{
+    "tempo": 120.0,
+    "key": "C",
+    "energy": 0.5,
+    "genre": "Electronic",
+    "mood": "Neutral",
+    "duration": 180.0
+}
+
+Task: TRACK ANALYSIS BATCH
+Analyze every track in the given list as described for TRACK ANALYSIS.
+Respond with ONLY a JSON array holding one such object per track, in the
+same order as the list.
+
+Task: MIXING ADVICE
+Provide mixing advice for transitioning between the two tracks given
+(crossfader 0.0 = full left, 1.0 = full right) and explain your reasoning.
+Consider:
+- Key compatibility for harmonic mixing
+- Tempo matching and transition timing
+- Energy flow between tracks
+- Genre compatibility
+
+Respond with ONLY a JSON object:
+{
+    "crossfader_position": 0.5,
+    "deck1_volume": 1.0,
+    "deck2_volume": 1.0,
+    "transition_duration": 10.0,
+    "effects_suggestion": "Slow fade",
+    "reasoning": "Explanation of mixing decision"
+}
+"""
+
+
+class TrackAnalysisSchema(TypedDict):
+    """Response schema Gemini must follow for a track analysis"""
+
+    tempo: float
+    key: str
+    energy: float
+    genre: str
+    mood: str
+    duration: float
+
+
+class MixingAdviceSchema(TypedDict):
+    """Response schema Gemini must follow for mixing advice"""
+
+    crossfader_position: float
+    deck1_volume: float
+    deck2_volume: float
+    transition_duration: float
+    effects_suggestion: str
+    reasoning: str
+
+
+# Constrain generation to JSON matching the schemas above
+TRACK_ANALYSIS_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": TrackAnalysisSchema,
+}
+TRACK_BATCH_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": list[TrackAnalysisSchema],
+}
+MIXING_ADVICE_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": MixingAdviceSchema,
+}
+
+# Complete numeric fields in partially streamed mixing advice JSON
+_ADVICE_FIELD_RE = re.compile(
+    r'"(crossfader_position|transition_duration)"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]'
+)
+
+# Keyword sets used by the mock analysis to guess tempo, energy and genre
+_HOUSE_KW = frozenset({"house", "deep", "tech"})
+_TECHNO_KW = frozenset({"techno", "hardstyle"})
+_TRANCE_KW = frozenset({"trance", "uplifting"})
+_HIPHOP_KW = frozenset({"hip-hop", "rap", "trap"})
+_HIGH_ENERGY_KW = frozenset({"energy", "power", "hard", "intense"})
+_LOW_ENERGY_KW = frozenset({"chill", "calm", "ambient", "deep"})
+_HOUSE_GENRE_KW = frozenset({"house", "deep"})
+_HIPHOP_GENRE_KW = frozenset({"hip-hop", "rap"})
+
+# Mock tempo (BPM) and energy ranges, one row per keyword bucket above
+_MOCK_TEMPO_RANGES = np.array(
+    [[120, 130], [130, 150], [130, 140], [70, 100], [110, 140]], dtype=np.float64
+)
+_MOCK_ENERGY_RANGES = np.array([[0.7, 1.0], [0.1, 0.4], [0.4, 0.8]])
+
+# Words, plus hyphenated compounds such as "hip-hop"
+_WORD_RE = re.compile(r"[a-z]+")
+_COMPOUND_RE = re.compile(r"[a-z]+-[a-z]+")
+
+# Simplified harmonic mixing rules
+_COMPATIBLE_KEYS = {
+    "C": frozenset({"C", "F", "G", "Am", "Dm", "Em"}),
+    "C#": frozenset({"C#", "F#", "G#", "A#m", "D#m", "Fm"}),
+    "D": frozenset({"D", "G", "A", "Bm", "Em", "F#m"}),
+    "D#": frozenset({"D#", "G#", "A#", "Cm", "Fm", "Gm"}),
+    "E": frozenset({"E", "A", "B", "C#m", "F#m", "G#m"}),
+    "F": frozenset({"F", "A#", "C", "Dm", "Gm", "Am"}),
+    "F#": frozenset({"F#", "B", "C#", "D#m", "G#m", "A#m"}),
+    "G": frozenset({"G", "C", "D", "Em", "Am", "Bm"}),
+    "G#": frozenset({"G#", "C#", "D#", "Fm", "A#m", "Cm"}),
+    "A": frozenset({"A", "D", "E", "F#m", "Bm", "C#m"}),
+    "A#": frozenset({"A#", "D#", "F", "Gm", "Cm", "Dm"}),
+    "B": frozenset({"B", "E", "F#", "G#m", "C#m", "D#m"}),
+}
+
+MUSICAL_KEYS = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_KEY_INDEX = {key: i for i, key in enumerate(MUSICAL_KEYS)}
+
+# _KEY_COMPAT_MATRIX[i, j] is True when MUSICAL_KEYS[j] mixes well after [i]
+_KEY_COMPAT_MATRIX = np.array(
+    [[key2 in _COMPATIBLE_KEYS[key1] for key2 in MUSICAL_KEYS] for key1 in MUSICAL_KEYS]
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _key_compatibility(key1: str, key2: str) -> Mapping[str, str]:
+    """Cached, read-only compatibility verdict for a pair of keys"""
+    if key2 in _COMPATIBLE_KEYS.get(key1, ()):
+        result = {
+            "compatibility": "Excellent",
+            "advice": f"{key1} and {key2} are harmonically compatible",
+            "action": "Mix freely - keys work well together",
+        }
+    else:
+        result = {
+            "compatibility": "Caution",
+            "advice": f"{key1} and {key2} may clash harmonically",
+            "action": "Consider using effects or quick transition",
+        }
+    return MappingProxyType(result)
+
 
 @dataclass
 class AITrackAnalysis:
@@ -55,6 +220,15 @@ class AIDJAssistant:
         self.model = None
         self.is_configured = False
         self.track_analyses: Dict[str, AITrackAnalysis] = {}
+        self._analysis_sources: Dict[str, Optional[str]] = {}
+
+        # Column arrays mirroring track_analyses for vectorized playlist queries
+        self._name_to_row: Dict[str, int] = {}
+        self._row_names: List[str] = []
+        self._tempo_arr = np.empty(16, dtype=np.float64)
+        self._energy_arr = np.empty(16, dtype=np.float64)
+        self._key_idx_arr = np.empty(16, dtype=np.int64)
+        self._rng = np.random.default_rng()
         self.mixing_history: List[Dict] = []
         self.callbacks: Dict[str, Callable] = {}
 
@@ -68,7 +242,9 @@ class AIDJAssistant:
                 return False
 
             genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel("gemini-pro")
+            self.model = genai.GenerativeModel(
+                GEMINI_MODEL, system_instruction=DJ_SYSTEM_INSTRUCTION
+            )
             self.api_key = api_key
             self.is_configured = True
             return True
@@ -90,53 +266,170 @@ class AIDJAssistant:
 
     def analyze_track(self, track_name: str, file_path: str = None) -> AITrackAnalysis:
         """Analyze a track for AI mixing decisions"""
+        cached = self._get_cached_analysis(track_name, file_path)
+        if cached:
+            return cached
+
+        analysis = self._analyze_uncached([track_name], file_path)[0]
+        self._analysis_sources[track_name] = file_path
+        return analysis
+
+    def analyze_tracks_batch(self, track_names: List[str]) -> List[AITrackAnalysis]:
+        """Analyze a playlist of tracks using a single Gemini request"""
+        missing = [
+            name
+            for name in dict.fromkeys(track_names)
+            if not self._get_cached_analysis(name, None)
+        ]
+        if missing:
+            self._analyze_uncached(missing)
+            for name in missing:
+                self._analysis_sources[name] = None
+
+        return [self.track_analyses[name] for name in track_names]
+
+    def _analyze_uncached(
+        self, track_names: List[str], file_path: str = None
+    ) -> List[AITrackAnalysis]:
+        """Analyze tracks with Gemini when configured, otherwise with the mock"""
         if self.is_configured and GEMINI_AVAILABLE:
-            return self._analyze_track_with_ai(track_name, file_path)
-        else:
-            return self._analyze_track_mock(track_name, file_path)
+            return self._analyze_tracks_with_ai(track_names)
+        return self._analyze_tracks_mock_batch(track_names)
 
-    def _analyze_track_with_ai(
+    async def aanalyze_track(
         self, track_name: str, file_path: str = None
     ) -> AITrackAnalysis:
-        """Use Gemini AI to analyze track characteristics"""
-        try:
-            # Extract track info from filename/path for AI analysis
-            prompt = f"""
-            Analyze this music track for DJ mixing: "{track_name}"
-            
-            Based on the track name, provide estimates for:
-            1. Tempo (BPM) - typical range 60-200
-            2. Musical key (C, C#, D, D#, E, F, F#, G, G#, A, A#, B)
-            3. Energy level (0.0 to 1.0, where 0 is calm and 1 is high energy)
-            4. Genre (Electronic, House, Techno, Trance, Hip-Hop, Rock, Pop, etc.)
-            5. Mood (Energetic, Calm, Dark, Uplifting, Melancholic, etc.)
-            6. Estimated duration in seconds (typical 180-300 for most tracks)
-            
-            Respond with ONLY a JSON object in this exact format:
-            {{
-                "tempo": 120.0,
-                "key": "C",
-                "energy": 0.5,
-                "genre": "Electronic",
-                "mood": "Neutral",
-                "duration": 180.0
-            }}
+        """Analyze a track without blocking the event loop"""
+        cached = self._get_cached_analysis(track_name, file_path)
+        if cached:
+            return cached
+
+        if self.is_configured and GEMINI_AVAILABLE:
+            analysis = await self._aanalyze_track_with_ai(track_name, file_path)
+        else:
+            analysis = self._analyze_track_mock(track_name, file_path)
+        self._analysis_sources[track_name] = file_path
+        return analysis
+
+    def _get_cached_analysis(
+        self, track_name: str, file_path: Optional[str]
+    ) -> Optional[AITrackAnalysis]:
+        """
+        Return the stored analysis for a track, if any
+        A different file loaded under the same name (e.g. a deck) is a miss
+        """
+        analysis = self.track_analyses.get(track_name)
+        if analysis and file_path in (None, self._analysis_sources.get(track_name)):
+            return analysis
+        return None
+
+    async def aanalyze_tracks(self, track_names: List[str]) -> List[AITrackAnalysis]:
+        """Analyze several tracks concurrently, preserving input order"""
+        return list(
+            await asyncio.gather(*(self.aanalyze_track(name) for name in track_names))
+        )
+
+    def _build_track_prompt(self, track_name: str) -> str:
+        """Build the per-request Gemini prompt for analyzing a single track"""
+        return f"""
+            Task: TRACK ANALYSIS
+            Track: "{track_name}"
             """
 
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+    def _build_batch_prompt(self, track_names: List[str]) -> str:
+        """Build the per-request Gemini prompt for analyzing several tracks"""
+        return f"""
+            Task: TRACK ANALYSIS BATCH
+            Tracks: {json.dumps(track_names)}
+            """
+
+    def _parse_track_analysis(self, track_name: str, text: str) -> AITrackAnalysis:
+        """Parse a Gemini track analysis response and record it"""
+        return self._record_track_analysis(track_name, json.loads(text.strip()))
 
-            analysis = AITrackAnalysis(
-                tempo=float(result.get("tempo", 120.0)),
-                key=str(result.get("key", "C")),
-                energy=float(result.get("energy", 0.5)),
-                genre=str(result.get("genre", "Electronic")),
-                mood=str(result.get("mood", "Neutral")),
-                duration=float(result.get("duration", 180.0)),
+    def _record_track_analysis(
+        self, track_name: str, result: Dict[str, Any]
+    ) -> AITrackAnalysis:
+        """Convert one analysis object from Gemini and record it"""
+        analysis = AITrackAnalysis(
+            tempo=float(result.get("tempo", 120.0)),
+            key=str(result.get("key", "C")),
+            energy=float(result.get("energy", 0.5)),
+            genre=str(result.get("genre", "Electronic")),
+            mood=str(result.get("mood", "Neutral")),
+            duration=float(result.get("duration", 180.0)),
+        )
+
+        self._store_analysis(track_name, analysis)
+        return analysis
+
+    @staticmethod
+    def _parse_json_objects(text: str) -> List[Any]:
+        """
+        Leniently extract the objects of a JSON array response
+        Markdown fences or prose around the array are ignored, and if the
+        array as a whole is malformed each element is decoded on its own so
+        one bad entry does not discard the rest (bad entries become None)
+        """
+        start = text.find("[")
+        end = text.rfind("]")
+        if start == -1 or end < start:
+            raise ValueError("No JSON array in response")
+
+        body = text[start : end + 1]
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError:
+            pass
+
+        decoder = json.JSONDecoder()
+        items: List[Any] = []
+        pos = 1
+        while True:
+            pos = body.find("{", pos)
+            if pos == -1:
+                return items
+            try:
+                item, pos = decoder.raw_decode(body, pos)
+            except json.JSONDecodeError:
+                item = None
+                pos += 1
+                # Skip to the next element of the array
+                next_pos = body.find("},", pos)
+                pos = len(body) if next_pos == -1 else next_pos + 2
+            items.append(item)
+
+    def _analyze_tracks_with_ai(self, track_names: List[str]) -> List[AITrackAnalysis]:
+        """Use Gemini AI to analyze several tracks in one request"""
+        try:
+            # Extract track info from filenames for AI analysis
+            response = self.model.generate_content(
+                self._build_batch_prompt(track_names),
+                generation_config=TRACK_BATCH_CONFIG,
             )
+            items = self._parse_json_objects(response.text)
+        except Exception as e:
+            print(f"AI track analysis failed, using mock: {e}")
+            items = []
 
-            self.track_analyses[track_name] = analysis
-            return analysis
+        analyses = []
+        for i, track_name in enumerate(track_names):
+            try:
+                analyses.append(self._record_track_analysis(track_name, items[i]))
+            except (IndexError, TypeError, ValueError, AttributeError):
+                analyses.append(self._analyze_track_mock(track_name))
+        return analyses
+
+    async def _aanalyze_track_with_ai(
+        self, track_name: str, file_path: str = None
+    ) -> AITrackAnalysis:
+        """Use Gemini AI to analyze a single track without blocking"""
+        try:
+            response = await self.model.generate_content_async(
+                self._build_track_prompt(track_name),
+                generation_config=TRACK_ANALYSIS_CONFIG,
+            )
+            return self._parse_track_analysis(track_name, response.text)
 
         except Exception as e:
             print(f"AI track analysis failed, using mock: {e}")
@@ -146,58 +439,130 @@ class AIDJAssistant:
         self, track_name: str, file_path: str = None
     ) -> AITrackAnalysis:
         """Mock track analysis for testing"""
+        return self._analyze_tracks_mock_batch([track_name])[0]
+
+    def _analyze_tracks_mock_batch(
+        self, track_names: List[str]
+    ) -> List[AITrackAnalysis]:
+        """Mock analysis for several tracks, drawing all random values at once"""
+        buckets = [self._mock_buckets(name) for name in track_names]
+        tempo_rows, energy_rows, genres = zip(*buckets)
+        tempo_ranges = _MOCK_TEMPO_RANGES[list(tempo_rows)]
+        energy_ranges = _MOCK_ENERGY_RANGES[list(energy_rows)]
+        count = len(track_names)
+
+        tempos = np.round(self._rng.uniform(*tempo_ranges.T), 1).tolist()
+        energies = np.round(self._rng.uniform(*energy_ranges.T), 2).tolist()
+        durations = self._rng.uniform(180, 300, size=count).tolist()
+        keys = self._rng.integers(len(MUSICAL_KEYS), size=count).tolist()
+
+        analyses = [
+            AITrackAnalysis(
+                tempo=tempo,
+                key=MUSICAL_KEYS[key],
+                energy=energy,
+                genre=genre,
+                mood=(
+                    "Energetic"
+                    if energy > 0.6
+                    else "Calm" if energy < 0.3 else "Balanced"
+                ),
+                duration=duration,
+            )
+            for tempo, key, energy, genre, duration in zip(
+                tempos, keys, energies, genres, durations
+            )
+        ]
+
+        for track_name, analysis in zip(track_names, analyses):
+            self._store_analysis(track_name, analysis)
+        return analyses
+
+    @staticmethod
+    def _mock_buckets(track_name: str) -> Tuple[int, int, str]:
+        """Pick mock tempo/energy range rows and a genre from name keywords"""
         # Generate pseudo-realistic analysis based on track name
         name_lower = track_name.lower()
 
+        tokens = set(_WORD_RE.findall(name_lower))
+        tokens.update(_COMPOUND_RE.findall(name_lower))
+
         # Guess tempo based on keywords
-        if any(word in name_lower for word in ["house", "deep", "tech"]):
-            tempo = random.uniform(120, 130)
-        elif any(word in name_lower for word in ["techno", "hardstyle"]):
-            tempo = random.uniform(130, 150)
-        elif any(word in name_lower for word in ["trance", "uplifting"]):
-            tempo = random.uniform(130, 140)
-        elif any(word in name_lower for word in ["hip-hop", "rap", "trap"]):
-            tempo = random.uniform(70, 100)
+        if tokens & _HOUSE_KW:
+            tempo_row = 0
+        elif tokens & _TECHNO_KW:
+            tempo_row = 1
+        elif tokens & _TRANCE_KW:
+            tempo_row = 2
+        elif tokens & _HIPHOP_KW:
+            tempo_row = 3
         else:
-            tempo = random.uniform(110, 140)
-
-        # Guess key
-        keys = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        key = random.choice(keys)
+            tempo_row = 4
 
         # Guess energy based on keywords
-        if any(word in name_lower for word in ["energy", "power", "hard", "intense"]):
-            energy = random.uniform(0.7, 1.0)
-        elif any(word in name_lower for word in ["chill", "calm", "ambient", "deep"]):
-            energy = random.uniform(0.1, 0.4)
+        if tokens & _HIGH_ENERGY_KW:
+            energy_row = 0
+        elif tokens & _LOW_ENERGY_KW:
+            energy_row = 1
         else:
-            energy = random.uniform(0.4, 0.8)
+            energy_row = 2
 
         # Guess genre
-        if any(word in name_lower for word in ["house", "deep"]):
+        if tokens & _HOUSE_GENRE_KW:
             genre = "House"
-        elif any(word in name_lower for word in ["techno"]):
+        elif "techno" in tokens:
             genre = "Techno"
-        elif any(word in name_lower for word in ["trance"]):
+        elif "trance" in tokens:
             genre = "Trance"
-        elif any(word in name_lower for word in ["hip-hop", "rap"]):
+        elif tokens & _HIPHOP_GENRE_KW:
             genre = "Hip-Hop"
         else:
             genre = "Electronic"
 
-        analysis = AITrackAnalysis(
-            tempo=round(tempo, 1),
-            key=key,
-            energy=round(energy, 2),
-            genre=genre,
-            mood=(
-                "Energetic" if energy > 0.6 else "Calm" if energy < 0.3 else "Balanced"
-            ),
-            duration=random.uniform(180, 300),
-        )
+        return tempo_row, energy_row, genre
 
+    def _store_analysis(self, track_name: str, analysis: AITrackAnalysis) -> None:
+        """Record an analysis and mirror it into the column arrays"""
         self.track_analyses[track_name] = analysis
-        return analysis
+
+        row = self._name_to_row.get(track_name)
+        if row is None:
+            row = len(self._row_names)
+            if row == len(self._tempo_arr):
+                self._tempo_arr = np.resize(self._tempo_arr, row * 2)
+                self._energy_arr = np.resize(self._energy_arr, row * 2)
+                self._key_idx_arr = np.resize(self._key_idx_arr, row * 2)
+            self._name_to_row[track_name] = row
+            self._row_names.append(track_name)
+
+        self._tempo_arr[row] = analysis.tempo
+        self._energy_arr[row] = analysis.energy
+        self._key_idx_arr[row] = _KEY_INDEX.get(analysis.key, -1)
+
+    def find_best_next_track(self, current_track: str) -> Optional[str]:
+        """
+        Pick the analyzed track that mixes best after current_track
+        Scores every track at once on tempo gap, energy gap and key clash
+        """
+        row = self._name_to_row.get(current_track)
+        count = len(self._row_names)
+        if row is None or count < 2:
+            return None
+
+        tempo = self._tempo_arr[:count]
+        energy = self._energy_arr[:count]
+        keys = self._key_idx_arr[:count]
+
+        # Tracks with an unknown key (index -1) are never key-compatible
+        compatible = np.zeros(count, dtype=bool)
+        if keys[row] >= 0:
+            known = keys >= 0
+            compatible[known] = _KEY_COMPAT_MATRIX[keys[row], keys[known]]
+
+        score = np.abs(tempo - tempo[row]) + 10.0 * np.abs(energy - energy[row])
+        score[~compatible] += 20.0
+        score[row] = np.inf
+        return self._row_names[int(np.argmin(score))]
 
     def get_auto_mixing_advice(
         self, deck1_track: str, deck2_track: str, current_position: float = 0.5
@@ -212,21 +577,30 @@ class AIDJAssistant:
                 deck1_track, deck2_track, current_position
             )
 
-    def _get_auto_mixing_advice_with_ai(
-        self, deck1_track: str, deck2_track: str, current_position: float
+    async def aget_auto_mixing_advice(
+        self, deck1_track: str, deck2_track: str, current_position: float = 0.5
     ) -> AIMixingAdvice:
-        """Use Gemini AI to generate mixing advice"""
-        try:
-            track1_analysis = self.track_analyses.get(deck1_track)
-            track2_analysis = self.track_analyses.get(deck2_track)
-
-            if not track1_analysis:
-                track1_analysis = self.analyze_track(deck1_track)
-            if not track2_analysis:
-                track2_analysis = self.analyze_track(deck2_track)
+        """Get auto mixing advice without blocking the event loop"""
+        if self.is_configured and GEMINI_AVAILABLE:
+            return await self._aget_auto_mixing_advice_with_ai(
+                deck1_track, deck2_track, current_position
+            )
+        else:
+            return self._get_auto_mixing_advice_mock(
+                deck1_track, deck2_track, current_position
+            )
 
-            prompt = f"""
-            You are a professional DJ AI assistant. Provide mixing advice for transitioning between these two tracks:
+    def _build_mixing_prompt(
+        self,
+        deck1_track: str,
+        deck2_track: str,
+        track1_analysis: AITrackAnalysis,
+        track2_analysis: AITrackAnalysis,
+        current_position: float,
+    ) -> str:
+        """Build the per-request Gemini prompt for mixing advice"""
+        return f"""
+            Task: MIXING ADVICE
             
             DECK 1 (Left): {deck1_track}
             - Tempo: {track1_analysis.tempo} BPM
@@ -242,37 +616,131 @@ class AIDJAssistant:
             - Genre: {track2_analysis.genre}
             - Mood: {track2_analysis.mood}
             
-            Current crossfader position: {current_position} (0.0 = full left, 1.0 = full right)
-            
-            Provide optimal mixing settings and explain your reasoning. Consider:
-            - Key compatibility for harmonic mixing
-            - Tempo matching and transition timing
-            - Energy flow between tracks
-            - Genre compatibility
-            
-            Respond with ONLY a JSON object:
-            {{
-                "crossfader_position": 0.5,
-                "deck1_volume": 1.0,
-                "deck2_volume": 1.0,
-                "transition_duration": 10.0,
-                "effects_suggestion": "Slow fade",
-                "reasoning": "Explanation of mixing decision"
-            }}
+            Current crossfader position: {current_position}
             """
 
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+    def _parse_mixing_advice(self, text: str) -> AIMixingAdvice:
+        """Parse a Gemini mixing advice response"""
+        result = json.loads(text.strip())
+
+        return AIMixingAdvice(
+            crossfader_position=float(result.get("crossfader_position", 0.5)),
+            deck1_volume=float(result.get("deck1_volume", 1.0)),
+            deck2_volume=float(result.get("deck2_volume", 1.0)),
+            transition_duration=float(result.get("transition_duration", 10.0)),
+            effects_suggestion=str(result.get("effects_suggestion", "None")),
+            reasoning=str(result.get("reasoning", "AI mixing advice")),
+        )
+
+    def _get_auto_mixing_advice_with_ai(
+        self, deck1_track: str, deck2_track: str, current_position: float
+    ) -> AIMixingAdvice:
+        """Use Gemini AI to generate mixing advice"""
+        try:
+            track1_analysis = self.track_analyses.get(deck1_track)
+            track2_analysis = self.track_analyses.get(deck2_track)
+
+            if not track1_analysis:
+                track1_analysis = self.analyze_track(deck1_track)
+            if not track2_analysis:
+                track2_analysis = self.analyze_track(deck2_track)
+
+            prompt = self._build_mixing_prompt(
+                deck1_track,
+                deck2_track,
+                track1_analysis,
+                track2_analysis,
+                current_position,
+            )
+            response = self.model.generate_content(
+                prompt, generation_config=MIXING_ADVICE_CONFIG
+            )
+            return self._parse_mixing_advice(response.text)
+
+        except Exception as e:
+            print(f"AI mixing advice failed, using mock: {e}")
+            return self._get_auto_mixing_advice_mock(
+                deck1_track, deck2_track, current_position
+            )
+
+    async def _aget_auto_mixing_advice_with_ai(
+        self, deck1_track: str, deck2_track: str, current_position: float
+    ) -> AIMixingAdvice:
+        """Async variant of _get_auto_mixing_advice_with_ai"""
+        try:
+            # Analyze both decks concurrently when either is missing
+            track1_analysis, track2_analysis = await asyncio.gather(
+                self.aanalyze_track(deck1_track),
+                self.aanalyze_track(deck2_track),
+            )
+
+            prompt = self._build_mixing_prompt(
+                deck1_track,
+                deck2_track,
+                track1_analysis,
+                track2_analysis,
+                current_position,
+            )
+            response = await self.model.generate_content_async(
+                prompt, generation_config=MIXING_ADVICE_CONFIG
+            )
+            return self._parse_mixing_advice(response.text)
+
+        except Exception as e:
+            print(f"AI mixing advice failed, using mock: {e}")
+            return self._get_auto_mixing_advice_mock(
+                deck1_track, deck2_track, current_position
+            )
+
+    async def _astream_mixing_advice(
+        self,
+        deck1_track: str,
+        deck2_track: str,
+        transition_params: asyncio.Future,
+        current_position: float = 0.5,
+    ) -> AIMixingAdvice:
+        """
+        Stream mixing advice from Gemini
+        Resolves transition_params with (crossfader_position,
+        transition_duration) as soon as both fields have arrived, so the
+        transition can start before the rest of the response is decoded
+        """
+        if not (self.is_configured and GEMINI_AVAILABLE):
+            return self._get_auto_mixing_advice_mock(
+                deck1_track, deck2_track, current_position
+            )
 
-            return AIMixingAdvice(
-                crossfader_position=float(result.get("crossfader_position", 0.5)),
-                deck1_volume=float(result.get("deck1_volume", 1.0)),
-                deck2_volume=float(result.get("deck2_volume", 1.0)),
-                transition_duration=float(result.get("transition_duration", 10.0)),
-                effects_suggestion=str(result.get("effects_suggestion", "None")),
-                reasoning=str(result.get("reasoning", "AI mixing advice")),
+        try:
+            track1_analysis, track2_analysis = await asyncio.gather(
+                self.aanalyze_track(deck1_track),
+                self.aanalyze_track(deck2_track),
+            )
+
+            prompt = self._build_mixing_prompt(
+                deck1_track,
+                deck2_track,
+                track1_analysis,
+                track2_analysis,
+                current_position,
+            )
+            response = await self.model.generate_content_async(
+                prompt, generation_config=MIXING_ADVICE_CONFIG, stream=True
             )
 
+            text = ""
+            async for chunk in response:
+                text += chunk.text
+                if not transition_params.done():
+                    fields = dict(_ADVICE_FIELD_RE.findall(text))
+                    if len(fields) == 2:
+                        transition_params.set_result(
+                            (
+                                float(fields["crossfader_position"]),
+                                float(fields["transition_duration"]),
+                            )
+                        )
+            return self._parse_mixing_advice(text)
+
         except Exception as e:
             print(f"AI mixing advice failed, using mock: {e}")
             return self._get_auto_mixing_advice_mock(
@@ -323,50 +791,95 @@ class AIDJAssistant:
             reasoning=reasoning,
         )
 
-    def start_auto_mixing(self, deck1_track: str, deck2_track: str) -> None:
-        """Start automated mixing between two tracks"""
-
-        def auto_mix_worker():
-            advice = self.get_auto_mixing_advice(deck1_track, deck2_track)
-
-            # Record mixing decision
-            self.mixing_history.append(
-                {
-                    "timestamp": time.time(),
-                    "deck1": deck1_track,
-                    "deck2": deck2_track,
-                    "advice": advice,
-                    "type": "auto_mix",
-                }
-            )
-
-            print(f"[AI AUTO MIX] {advice.reasoning}")
-            print(
-                f"[AI AUTO MIX] Transitioning over {advice.transition_duration:.1f} seconds"
-            )
-            print(f"[AI AUTO MIX] Effect: {advice.effects_suggestion}")
+    def start_auto_mixing(
+        self, deck1_track: str, deck2_track: str
+    ) -> Optional[asyncio.Task]:
+        """
+        Start automated mixing between two tracks
+        Scheduled as a task on the running event loop when called from async
+        code; otherwise the transition runs on its own loop in a daemon thread
+        """
+        coro = self._auto_mix(deck1_track, deck2_track)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            thread = threading.Thread(target=asyncio.run, args=(coro,), daemon=True)
+            thread.start()
+            return None
+        return loop.create_task(coro)
+
+    async def _auto_mix(self, deck1_track: str, deck2_track: str) -> None:
+        """Stream mixing advice and animate the crossfader transition"""
+        loop = asyncio.get_running_loop()
+        transition_params = loop.create_future()
+        advice_task = asyncio.ensure_future(
+            self._astream_mixing_advice(deck1_track, deck2_track, transition_params)
+        )
 
-            # Animate transition
-            start_pos = 0.5
+        # Start as soon as the transition fields are in, or the whole advice
+        await asyncio.wait(
+            {transition_params, advice_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if transition_params.done():
+            target_pos, duration = transition_params.result()
+        else:
+            advice = advice_task.result()
             target_pos = advice.crossfader_position
-            steps = int(advice.transition_duration * 2)  # 2 updates per second
-
-            for i in range(steps + 1):
-                progress = i / steps
-                current_pos = start_pos + (target_pos - start_pos) * progress
-
-                # Trigger callbacks to update mixer
-                self._trigger_callback("crossfader_change", current_pos)
-                self._trigger_callback("volume_change", "deck1", advice.deck1_volume)
-                self._trigger_callback("volume_change", "deck2", advice.deck2_volume)
+            duration = advice.transition_duration
+
+        print(f"[AI AUTO MIX] Transitioning over {duration:.1f} seconds")
+
+        # Animate transition along a precomputed ramp
+        start_pos = 0.5
+        steps = max(int(duration * 2), 1)  # 2 updates per second
+        ramp = np.linspace(start_pos, target_pos, steps + 1)
+        step_time = duration / steps
+
+        # Schedule each step against the loop clock so sleeps do not drift
+        start_time = loop.time()
+        advice_applied = False
+        for i, current_pos in enumerate(ramp):
+            await asyncio.sleep(max(0.0, start_time + i * step_time - loop.time()))
+            self._trigger_callback("crossfader_change", float(current_pos))
+
+            # Apply the rest of the advice once the stream has finished
+            if not advice_applied and advice_task.done():
+                self._apply_mixing_advice(
+                    deck1_track, deck2_track, advice_task.result()
+                )
+                advice_applied = True
+
+        advice = await advice_task
+        if not advice_applied:
+            self._apply_mixing_advice(deck1_track, deck2_track, advice)
+        self._set_advice_volumes(advice)
+
+        print(f"[AI AUTO MIX] Transition complete at position {target_pos:.2f}")
+
+    def _apply_mixing_advice(
+        self, deck1_track: str, deck2_track: str, advice: AIMixingAdvice
+    ) -> None:
+        """Record and report completed mixing advice during a transition"""
+        self.mixing_history.append(
+            {
+                "timestamp": time.time(),
+                "deck1": deck1_track,
+                "deck2": deck2_track,
+                "advice": advice,
+                "type": "auto_mix",
+            }
+        )
 
-                time.sleep(advice.transition_duration / steps)
+        print(f"[AI AUTO MIX] {advice.reasoning}")
+        print(f"[AI AUTO MIX] Effect: {advice.effects_suggestion}")
 
-            print(f"[AI AUTO MIX] Transition complete at position {target_pos:.2f}")
+        # Volumes are constant during the ramp, so set them now and at the end
+        self._set_advice_volumes(advice)
 
-        # Run in background thread
-        thread = threading.Thread(target=auto_mix_worker, daemon=True)
-        thread.start()
+    def _set_advice_volumes(self, advice: AIMixingAdvice) -> None:
+        """Trigger volume callbacks for both decks from mixing advice"""
+        self._trigger_callback("volume_change", "deck1", advice.deck1_volume)
+        self._trigger_callback("volume_change", "deck2", advice.deck2_volume)
 
     def get_key_mixing_advice(
         self, deck1_track: str, deck2_track: str
@@ -393,36 +906,11 @@ class AIDJAssistant:
             "suggested_action": key_compatibility["action"],
         }
 
-    def _check_key_compatibility(self, key1: str, key2: str) -> Dict[str, str]:
+    @staticmethod
+    def _check_key_compatibility(key1: str, key2: str) -> Dict[str, str]:
         """Check harmonic compatibility between two keys"""
-        # Simplified harmonic mixing rules
-        compatible_keys = {
-            "C": ["C", "F", "G", "Am", "Dm", "Em"],
-            "C#": ["C#", "F#", "G#", "A#m", "D#m", "Fm"],
-            "D": ["D", "G", "A", "Bm", "Em", "F#m"],
-            "D#": ["D#", "G#", "A#", "Cm", "Fm", "Gm"],
-            "E": ["E", "A", "B", "C#m", "F#m", "G#m"],
-            "F": ["F", "A#", "C", "Dm", "Gm", "Am"],
-            "F#": ["F#", "B", "C#", "D#m", "G#m", "A#m"],
-            "G": ["G", "C", "D", "Em", "Am", "Bm"],
-            "G#": ["G#", "C#", "D#", "Fm", "A#m", "Cm"],
-            "A": ["A", "D", "E", "F#m", "Bm", "C#m"],
-            "A#": ["A#", "D#", "F", "Gm", "Cm", "Dm"],
-            "B": ["B", "E", "F#", "G#m", "C#m", "D#m"],
-        }
-
-        if key2 in compatible_keys.get(key1, []):
-            return {
-                "compatibility": "Excellent",
-                "advice": f"{key1} and {key2} are harmonically compatible",
-                "action": "Mix freely - keys work well together",
-            }
-        else:
-            return {
-                "compatibility": "Caution",
-                "advice": f"{key1} and {key2} may clash harmonically",
-                "action": "Consider using effects or quick transition",
-            }
+        # Copy the cached read-only result so callers can't alter the cache
+        return dict(_key_compatibility(key1, key2))
 
     def get_fader_effects_suggestion(
         self, current_position: float, track1_energy: float, track2_energy: float
@@ -5,9 +5,23 @@ Provides real-time audio effects including EQ, filters, and reverb
 """
 
 import numpy as np
-from typing import Optional, Tuple
+from scipy import signal
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 @dataclass
 class EQSettings:
@@ -39,6 +53,47 @@ class ReverbSettings:
     dry_level: float = 0.7  # 0.0 to 1.0
 
 
+EQ_CROSSOVERS_HZ = (250, 1000, 4000, 8000)  # Band edges between EQ bands
+Q15_ONE = 1 << 15  # Fixed-point scale for reverb coefficients
+FLOAT_FULL_SCALE = 32767.0  # int16 level of a full-scale (1.0) float sample
+
+# Explicit kernel signature so Numba compiles at import, not on the first block
+REVERB_KERNEL_SIGNATURE = (
+    "Tuple((int32[::1], int64))(int32[::1], int16[::1], int64, int64, int64, int64)"
+)
+
+
+@njit(REVERB_KERNEL_SIGNATURE, cache=True, boundscheck=False)
+def _reverb_kernel(audio, buf, pos, dry_q15, wet_q15, feedback_q15):
+    """
+    Run the delay/feedback reverb loop over a block of samples
+    Uses Q15 fixed-point coefficients on an int16 delay line; returns the
+    processed block (int32) and the new delay buffer position
+    """
+    size = buf.shape[0]
+    result = np.empty(audio.shape[0], dtype=np.int32)
+
+    for i in range(audio.shape[0]):
+        sample = int(audio[i])
+
+        # Get delayed signal from buffer
+        delayed = int(buf[pos])
+
+        # Mix dry and wet signals
+        result[i] = (sample * dry_q15 + delayed * wet_q15) >> 15
+
+        # Update delay buffer with feedback, saturating to int16
+        fed_back = sample + ((delayed * feedback_q15) >> 15)
+        buf[pos] = min(max(fed_back, -32768), 32767)
+
+        # Advance buffer position
+        pos += 1
+        if pos == size:
+            pos = 0
+
+    return result, pos
+
+
 class AudioEffects:
     """Audio effects processor for real-time audio manipulation"""
 
@@ -50,8 +105,18 @@ class AudioEffects:
 
         # Reverb delay buffers
         self.reverb_buffer_size = int(sample_rate * 0.05)  # 50ms
-        self.reverb_buffer = np.zeros(self.reverb_buffer_size)
+        self.reverb_buffer = np.zeros(self.reverb_buffer_size, dtype=np.int16)
         self.reverb_buffer_pos = 0
+        self._update_reverb_coefficients()
+
+        # Linkwitz-Riley crossover band filters and their stream state
+        self._eq_band_sos = self._design_eq_bands()
+        self._eq_band_zi: List[Optional[np.ndarray]] = [None] * len(self._eq_band_sos)
+        self._eq_neutral = True
+
+        # Biquad filter coefficients (second-order sections) and stream state
+        self._filter_sos: Optional[np.ndarray] = None
+        self._filter_zi: Optional[np.ndarray] = None
 
     def set_eq(
         self,
@@ -68,6 +133,13 @@ class AudioEffects:
         self.eq.mid_high = np.clip(mid_high, 0.0, 2.0)
         self.eq.high = np.clip(high, 0.0, 2.0)
 
+        self._eq_neutral = all(
+            gain == 1.0 for gain in (low, mid_low, mid, mid_high, high)
+        )
+        if self._eq_neutral:
+            # Bypassed bands start from silence when the EQ is engaged again
+            self._eq_band_zi = [None] * len(self._eq_band_sos)
+
     def set_filter(
         self, filter_type: str, cutoff_freq: float = 1000.0, resonance: float = 1.0
     ) -> None:
@@ -78,6 +150,8 @@ class AudioEffects:
         self.filter.filter_type = filter_type
         self.filter.cutoff_freq = cutoff_freq
         self.filter.resonance = resonance
+        self._filter_sos = self._design_filter()
+        self._filter_zi = None
 
     def set_reverb(
         self,
@@ -91,76 +165,133 @@ class AudioEffects:
         self.reverb.damping = np.clip(damping, 0.0, 1.0)
         self.reverb.wet_level = np.clip(wet_level, 0.0, 1.0)
         self.reverb.dry_level = np.clip(dry_level, 0.0, 1.0)
+        self._update_reverb_coefficients()
+
+    def _update_reverb_coefficients(self) -> None:
+        """Precompute the Q15 fixed-point reverb mix and feedback gains"""
+        feedback = self.reverb.room_size * 0.7
+        damping_factor = 1.0 - self.reverb.damping * 0.5
+        self._reverb_q15 = (
+            int(self.reverb.dry_level * Q15_ONE),
+            int(self.reverb.wet_level * Q15_ONE),
+            int(feedback * damping_factor * Q15_ONE),
+        )
+        # Fully dry reverb leaves the signal untouched and can be skipped
+        self._reverb_neutral = self._reverb_q15[:2] == (Q15_ONE, 0)
+
+    def _design_eq_bands(self) -> List[np.ndarray]:
+        """
+        Design one filter chain per EQ band from 4th-order Linkwitz-Riley
+        crossovers (two cascaded 2nd-order Butterworth sections)
+        Lower bands get an all-pass per higher crossover so the phase of all
+        bands lines up and the unweighted sum is flat
+        """
+        nyquist = self.sample_rate / 2
+        crossovers = [min(f, nyquist * 0.9) for f in EQ_CROSSOVERS_HZ]
+
+        def linkwitz_riley(freq: float, btype: str) -> np.ndarray:
+            sos = signal.butter(2, freq, btype=btype, fs=self.sample_rate, output="sos")
+            return np.vstack([sos, sos])
+
+        def allpass(freq: float) -> np.ndarray:
+            a = signal.butter(2, freq, fs=self.sample_rate, output="sos")[0, 3:]
+            return np.array([[a[2], a[1], a[0], a[0], a[1], a[2]]])
+
+        bands = []
+        for band in range(len(crossovers) + 1):
+            sections = []
+            for i, freq in enumerate(crossovers):
+                if i < band:
+                    sections.append(linkwitz_riley(freq, "highpass"))
+                elif i == band:
+                    sections.append(linkwitz_riley(freq, "lowpass"))
+                else:
+                    sections.append(allpass(freq))
+            bands.append(np.vstack(sections))
+        return bands
 
     def apply_eq(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Apply equalizer to audio data
-        This is a simplified EQ using spectral processing
+        Splits the signal into 5 bands with IIR crossovers, weights each band
+        by its gain and sums them; filter state carries across buffers
         """
         if len(audio_data) == 0:
             return audio_data
+        return self._eq_stage(audio_data).astype(audio_data.dtype, copy=False)
+
+    def _eq_stage(self, audio_data: np.ndarray) -> np.ndarray:
+        """Run the EQ bands and return the float64 sum without casting back"""
+        gains = (
+            self.eq.low,
+            self.eq.mid_low,
+            self.eq.mid,
+            self.eq.mid_high,
+            self.eq.high,
+        )
+
+        result = np.zeros(audio_data.shape)
+        for band, (sos, gain) in enumerate(zip(self._eq_band_sos, gains)):
+            zi = self._eq_band_zi[band]
+            zi_shape = (sos.shape[0], 2) + audio_data.shape[1:]
+            if zi is None or zi.shape != zi_shape:
+                zi = np.zeros(zi_shape)
+
+            band_data, self._eq_band_zi[band] = signal.sosfilt(
+                sos, audio_data, axis=0, zi=zi
+            )
+            band_data *= gain
+            result += band_data
+
+        return result
+
+    def _design_filter(self) -> Optional[np.ndarray]:
+        """
+        Design biquad coefficients for the current filter settings
+        Uses the RBJ audio EQ cookbook formulas so resonance maps to Q
+        """
+        if self.filter.filter_type == "none":
+            return None
+
+        nyquist = self.sample_rate / 2
+        cutoff = float(np.clip(self.filter.cutoff_freq, 1.0, nyquist * 0.99))
+        q = max(float(self.filter.resonance), 1e-3)
 
-        # Perform FFT
-        fft_data = np.fft.rfft(audio_data)
-        frequencies = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
-
-        # Apply EQ gains to frequency bands
-        for i, freq in enumerate(frequencies):
-            if freq < 250:
-                fft_data[i] *= self.eq.low
-            elif freq < 1000:
-                fft_data[i] *= self.eq.mid_low
-            elif freq < 4000:
-                fft_data[i] *= self.eq.mid
-            elif freq < 8000:
-                fft_data[i] *= self.eq.mid_high
-            else:
-                fft_data[i] *= self.eq.high
-
-        # Inverse FFT
-        result = np.fft.irfft(fft_data, len(audio_data))
-        return result.astype(audio_data.dtype)
+        w0 = 2 * np.pi * cutoff / self.sample_rate
+        cos_w0 = np.cos(w0)
+        alpha = np.sin(w0) / (2 * q)
+
+        if self.filter.filter_type == "lowpass":
+            b = [(1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2]
+        elif self.filter.filter_type == "highpass":
+            b = [(1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2]
+        else:
+            # Band-pass with constant 0 dB peak gain at the cutoff
+            b = [alpha, 0.0, -alpha]
+        a = [1 + alpha, -2 * cos_w0, 1 - alpha]
+
+        return np.array([b + a]) / a[0]
 
     def apply_filter(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Apply filter to audio data
-        Simplified filter implementation using spectral processing
+        Second-order IIR (biquad) filter; state is kept between calls so
+        consecutive buffers of a stream join without discontinuities
         """
-        if self.filter.filter_type == "none" or len(audio_data) == 0:
+        if self._filter_sos is None or len(audio_data) == 0:
             return audio_data
+        return self._filter_stage(audio_data).astype(audio_data.dtype, copy=False)
+
+    def _filter_stage(self, audio_data: np.ndarray) -> np.ndarray:
+        """Run the biquad filter and return its float64 output"""
+        zi_shape = (self._filter_sos.shape[0], 2) + audio_data.shape[1:]
+        if self._filter_zi is None or self._filter_zi.shape != zi_shape:
+            self._filter_zi = np.zeros(zi_shape)
 
-        # Perform FFT
-        fft_data = np.fft.rfft(audio_data)
-        frequencies = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
-
-        # Apply filter
-        cutoff = self.filter.cutoff_freq
-        q = self.filter.resonance
-
-        for i, freq in enumerate(frequencies):
-            if self.filter.filter_type == "lowpass":
-                # Low-pass: attenuate frequencies above cutoff
-                if freq > cutoff:
-                    attenuation = 1.0 / (1.0 + ((freq - cutoff) / (cutoff / q)) ** 2)
-                    fft_data[i] *= attenuation
-            elif self.filter.filter_type == "highpass":
-                # High-pass: attenuate frequencies below cutoff
-                if freq < cutoff:
-                    attenuation = 1.0 / (1.0 + ((cutoff - freq) / (cutoff / q)) ** 2)
-                    fft_data[i] *= attenuation
-            elif self.filter.filter_type == "bandpass":
-                # Band-pass: keep frequencies near cutoff
-                distance = abs(freq - cutoff)
-                bandwidth = cutoff / q
-                if distance > bandwidth / 2:
-                    attenuation = 1.0 / (
-                        1.0 + ((distance - bandwidth / 2) / bandwidth) ** 2
-                    )
-                    fft_data[i] *= attenuation
-
-        # Inverse FFT
-        result = np.fft.irfft(fft_data, len(audio_data))
-        return result.astype(audio_data.dtype)
+        result, self._filter_zi = signal.sosfilt(
+            self._filter_sos, audio_data, axis=0, zi=self._filter_zi
+        )
+        return result
 
     def apply_reverb(self, audio_data: np.ndarray) -> np.ndarray:
         """
@@ -169,34 +300,29 @@ class AudioEffects:
         """
         if len(audio_data) == 0:
             return audio_data
+        float_audio = np.issubdtype(audio_data.dtype, np.floating)
+        result = self._reverb_stage(audio_data, float_audio)
+        return result.astype(audio_data.dtype, copy=False)
 
-        result = np.zeros_like(audio_data, dtype=np.float32)
-        audio_float = audio_data.astype(np.float32)
-
-        # Calculate reverb parameters
-        feedback = self.reverb.room_size * 0.7
-        damping_factor = 1.0 - self.reverb.damping * 0.5
-
-        for i in range(len(audio_data)):
-            # Get delayed signal from buffer
-            delayed = self.reverb_buffer[self.reverb_buffer_pos]
-
-            # Mix dry and wet signals
-            dry = audio_float[i] * self.reverb.dry_level
-            wet = delayed * self.reverb.wet_level
-            result[i] = dry + wet
-
-            # Update delay buffer with feedback
-            self.reverb_buffer[self.reverb_buffer_pos] = (
-                audio_float[i] + delayed * feedback * damping_factor
-            )
-
-            # Advance buffer position
-            self.reverb_buffer_pos = (
-                self.reverb_buffer_pos + 1
-            ) % self.reverb_buffer_size
-
-        return result.astype(audio_data.dtype)
+    def _reverb_stage(self, audio_data: np.ndarray, float_audio: bool) -> np.ndarray:
+        """
+        Run the reverb kernel on a block
+        Returns int32 samples, or float32 in [-1, 1] when float_audio is set
+        """
+        # Quantize to the int16 sample range used by the delay line; float
+        # audio is full scale at 1.0
+        if float_audio:
+            audio_data = np.rint(audio_data * FLOAT_FULL_SCALE)
+        elif np.issubdtype(audio_data.dtype, np.floating):
+            audio_data = np.rint(audio_data)
+        audio_int = np.clip(audio_data, -32768, 32767).astype(np.int32)
+
+        result, self.reverb_buffer_pos = _reverb_kernel(
+            audio_int, self.reverb_buffer, self.reverb_buffer_pos, *self._reverb_q15
+        )
+        if float_audio:
+            return result.astype(np.float32) * np.float32(1.0 / FLOAT_FULL_SCALE)
+        return result
 
     def process(self, audio_data: np.ndarray) -> np.ndarray:
         """
@@ -206,26 +332,38 @@ class AudioEffects:
         if len(audio_data) == 0:
             return audio_data
 
-        # Convert to float for processing
-        processed = audio_data.astype(np.float32)
+        # Nothing to do when every effect is neutral
+        if self._eq_neutral and self._filter_sos is None and self._reverb_neutral:
+            return audio_data
 
-        # Apply effects in order
-        processed = self.apply_eq(processed)
-        processed = self.apply_filter(processed)
-        processed = self.apply_reverb(processed)
+        # Apply effects in order, skipping neutral stages; each stage returns
+        # a new array in its working precision, so only the result is cast
+        processed = audio_data
+        if not self._eq_neutral:
+            processed = self._eq_stage(processed)
+        if self._filter_sos is not None:
+            processed = self._filter_stage(processed)
+        if not self._reverb_neutral:
+            float_audio = np.issubdtype(audio_data.dtype, np.floating)
+            processed = self._reverb_stage(processed, float_audio)
 
         # Clip to prevent overflow
-        processed = np.clip(processed, -32768, 32767)
+        np.clip(processed, -32768, 32767, out=processed)
 
-        return processed.astype(audio_data.dtype)
+        return processed.astype(audio_data.dtype, copy=False)
 
     def reset(self) -> None:
         """Reset all effects to default values"""
         self.eq = EQSettings()
         self.filter = FilterSettings()
         self.reverb = ReverbSettings()
-        self.reverb_buffer = np.zeros(self.reverb_buffer_size)
+        self.reverb_buffer = np.zeros(self.reverb_buffer_size, dtype=np.int16)
         self.reverb_buffer_pos = 0
+        self._update_reverb_coefficients()
+        self._eq_band_zi = [None] * len(self._eq_band_sos)
+        self._eq_neutral = True
+        self._filter_sos = None
+        self._filter_zi = None
 
     def get_eq_settings(self) -> EQSettings:
         """Get current EQ settings"""
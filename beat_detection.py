@@ -4,23 +4,127 @@ Beat Detection and BPM Analysis for DJ Mixer
 Provides beat detection, BPM calculation, and auto-sync functionality
 """
 
+import math
 import numpy as np
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from scipy.signal import find_peaks
+from typing import Callable, Dict, Tuple, Optional
+from dataclasses import dataclass, replace
+import hashlib
 import time
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 @dataclass
 class BeatInfo:
     """Information about detected beats"""
 
     bpm: float
-    beat_positions: List[float]  # Beat positions in seconds
-    beat_grid: List[float]  # Quantized beat grid
+    beat_positions: np.ndarray  # Beat positions in seconds
+    beat_grid: np.ndarray  # Quantized beat grid
     confidence: float  # Detection confidence (0.0 to 1.0)
     first_beat: float  # Position of first beat in seconds
 
 
+# Envelope frames handled per parallel work item in the energy kernels
+ENERGY_CHUNK_FRAMES = 256
+
+# Energy kernels specialized per (window_size, hop_size), shared by detectors
+_energy_kernels: Dict[Tuple[int, int], Callable] = {}
+
+
+def _make_frame_energy(window_size: int, hop_size: int) -> Callable:
+    """
+    Build an envelope kernel with the window and hop baked in as compile-time
+    constants, so the block loops have fixed trip counts LLVM can unroll
+    """
+    blocks_per_window = window_size // hop_size
+    remainder = window_size - blocks_per_window * hop_size
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def frame_energy(audio):
+        """
+        Sum of squares of every hop_size-spaced window of audio
+        Squares are summed once per hop-sized block and each window adds up
+        its blocks, so every sample is read about once instead of per overlap
+        """
+        num_frames = (audio.shape[0] - window_size) // hop_size + 1
+        energy = np.empty(num_frames, dtype=np.float32)
+        num_chunks = (num_frames + ENERGY_CHUNK_FRAMES - 1) // ENERGY_CHUNK_FRAMES
+
+        for chunk in prange(num_chunks):
+            first = chunk * ENERGY_CHUNK_FRAMES
+            last = min(first + ENERGY_CHUNK_FRAMES, num_frames)
+
+            # Energy of each hop-sized block covered by this chunk's windows
+            blocks = np.empty(last - first + blocks_per_window - 1, dtype=np.float32)
+            for b in range(blocks.shape[0]):
+                start = (first + b) * hop_size
+                total = np.float32(0.0)
+                for j in range(hop_size):
+                    total += audio[start + j] * audio[start + j]
+                blocks[b] = total
+
+            for frame in range(first, last):
+                total = np.float32(0.0)
+                for b in range(blocks_per_window):
+                    total += blocks[frame - first + b]
+                start = (frame + blocks_per_window) * hop_size
+                for j in range(remainder):
+                    total += audio[start + j] * audio[start + j]
+                energy[frame] = total
+
+        return energy
+
+    return frame_energy
+
+
+def _get_frame_energy(window_size: int, hop_size: int) -> Callable:
+    """Return the energy kernel for a window/hop, building it on first use"""
+    key = (window_size, hop_size)
+    if key not in _energy_kernels:
+        _energy_kernels[key] = _make_frame_energy(window_size, hop_size)
+    return _energy_kernels[key]
+
+
+@njit(cache=True)
+def _smooth_boxcar(x, k):
+    """
+    Moving average of x over k samples, centred, repeating the edge values
+    Keeps a single running sum, so the cost does not depend on k
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=x.dtype)
+    if n == 0:
+        return out
+
+    pad = k // 2
+    acc = np.float64(0.0)
+    for j in range(-pad, k - pad):
+        acc += np.float64(x[min(max(j, 0), n - 1)])
+
+    for i in range(n):
+        out[i] = acc / k
+        # Slide the window: add the entering sample, drop the leaving one;
+        # accumulate in float64 so float32 input does not drift below zero
+        acc += np.float64(x[min(i + k - pad, n - 1)])
+        acc -= np.float64(x[max(i - pad, 0)])
+
+    return out
+
+
 class BeatDetector:
     """Beat detection and BPM analysis"""
 
@@ -29,6 +133,24 @@ class BeatDetector:
         self.min_bpm = 60
         self.max_bpm = 200
 
+        # Envelope framing shared by every analysis stage
+        self._window_size = int(sample_rate * 0.05)  # 50ms windows
+        self._hop_size = self._window_size // 4
+        self._frame_rate = sample_rate / self._hop_size  # envelope frames/s
+        self._min_beat_distance_frames = int(self._frame_rate * 0.3)  # 0.3s
+        self._frame_energy = (
+            _get_frame_energy(self._window_size, self._hop_size)
+            if NUMBA_AVAILABLE
+            else None
+        )
+
+        # Recent analyses keyed by an audio fingerprint, oldest evicted first
+        self._cache: Dict[tuple, BeatInfo] = {}
+        self.max_cache_size = 8
+
+        # Reused float32 buffer for stereo to mono mixdown
+        self._mono_buf: Optional[np.ndarray] = None
+
     def detect_beats(self, audio_data: np.ndarray, duration: float) -> BeatInfo:
         """
         Detect beats in audio data and calculate BPM
@@ -43,26 +165,62 @@ class BeatDetector:
         if len(audio_data) == 0:
             return BeatInfo(
                 bpm=120.0,
-                beat_positions=[],
-                beat_grid=[],
+                beat_positions=np.empty(0),
+                beat_grid=np.empty(0),
                 confidence=0.0,
                 first_beat=0.0,
             )
 
-        # Convert to mono if stereo
+        cache_key = self._cache_key(audio_data, duration)
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            cached = self._analyze(audio_data, duration)
+            # Cached arrays are shared between results, so freeze them
+            cached.beat_positions.flags.writeable = False
+            cached.beat_grid.flags.writeable = False
+            if len(self._cache) >= self.max_cache_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[cache_key] = cached
+
+        return replace(cached)
+
+    @staticmethod
+    def _cache_key(audio_data: np.ndarray, duration: float) -> tuple:
+        """Fingerprint of the audio: shape, dtype and a digest of every sample"""
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(audio_data).tobytes(), digest_size=16
+        ).digest()
+        return (audio_data.shape, audio_data.dtype.str, round(duration, 3), digest)
+
+    def clear_cache(self) -> None:
+        """Forget cached beat analyses"""
+        self._cache.clear()
+
+    def _analyze(self, audio_data: np.ndarray, duration: float) -> BeatInfo:
+        """Run the full beat detection pipeline on non-empty audio"""
+        # Convert to mono if stereo; analysis runs in single precision
         if len(audio_data.shape) > 1:
-            audio_mono = np.mean(audio_data, axis=1)
+            num_samples, channels = audio_data.shape
+            if self._mono_buf is None or self._mono_buf.shape[0] != num_samples:
+                self._mono_buf = np.empty(num_samples, dtype=np.float32)
+            audio_mono = np.sum(
+                audio_data, axis=1, dtype=np.float32, out=self._mono_buf
+            )
+            audio_mono *= 1.0 / channels
         else:
-            audio_mono = audio_data
+            audio_mono = audio_data.astype(np.float32, copy=False)
 
         # Calculate energy envelope
         energy = self._calculate_energy_envelope(audio_mono)
 
         # Find peaks in energy (potential beats)
-        beat_positions = self._find_peaks(energy, duration)
+        beat_positions = self._find_peaks(energy)
 
-        # Calculate BPM from beat positions
-        bpm = self._calculate_bpm(beat_positions)
+        # Estimate BPM from the envelope's periodicity, falling back to the
+        # intervals between detected beats when the audio is too short
+        bpm = self._estimate_tempo_acf(energy)
+        if bpm is None:
+            bpm = self._calculate_bpm(beat_positions)
 
         # Generate beat grid
         beat_grid = self._generate_beat_grid(bpm, duration, beat_positions)
@@ -71,7 +229,7 @@ class BeatDetector:
         confidence = self._calculate_confidence(beat_positions, bpm)
 
         # Find first beat
-        first_beat = beat_positions[0] if beat_positions else 0.0
+        first_beat = float(beat_positions[0]) if len(beat_positions) else 0.0
 
         return BeatInfo(
             bpm=bpm,
@@ -84,54 +242,91 @@ class BeatDetector:
     def _calculate_energy_envelope(self, audio_data: np.ndarray) -> np.ndarray:
         """Calculate energy envelope of audio signal"""
         # Use overlapping windows
-        window_size = int(self.sample_rate * 0.05)  # 50ms windows
-        hop_size = window_size // 4
+        window_size = self._window_size
 
-        num_frames = (len(audio_data) - window_size) // hop_size + 1
-        energy = np.zeros(num_frames)
+        if len(audio_data) < window_size:
+            return np.zeros(0, dtype=np.float32)
 
-        for i in range(num_frames):
-            start = i * hop_size
-            end = start + window_size
-            frame = audio_data[start:end]
-            energy[i] = np.sum(frame**2)
+        audio_data = audio_data.astype(np.float32, copy=False)
+        if self._frame_energy is not None:
+            # Single pass summing squares per hop block
+            energy = self._frame_energy(audio_data)
+        else:
+            # View every hop-th window without copying, then sum squares
+            frames = np.lib.stride_tricks.sliding_window_view(audio_data, window_size)[
+                :: self._hop_size
+            ]
+            energy = np.einsum("ij,ij->i", frames, frames)
 
-        # Smooth energy curve
+        # Smooth energy curve with a running-sum moving average
         kernel_size = 5
-        kernel = np.ones(kernel_size) / kernel_size
-        energy = np.convolve(energy, kernel, mode="same")
+        energy = _smooth_boxcar(energy, kernel_size)
 
         return energy
 
-    def _find_peaks(self, energy: np.ndarray, duration: float) -> List[float]:
+    def _find_peaks(self, energy: np.ndarray) -> np.ndarray:
         """Find peaks in energy envelope (potential beats)"""
         if len(energy) == 0:
-            return []
+            return np.empty(0)
 
-        # Calculate adaptive threshold
-        threshold = np.mean(energy) + 0.5 * np.std(energy)
+        # Robust threshold from median and median absolute deviation (scaled to
+        # match a standard deviation) so loud transients do not raise it
+        median = np.median(energy)
+        mad = np.median(np.abs(energy - median))
+        threshold = median + 0.5 * 1.4826 * mad
 
         # Find peaks above threshold
-        peaks = []
-        min_distance = int(len(energy) / duration * 0.3)  # Minimum 0.3s between beats
-
-        for i in range(1, len(energy) - 1):
-            if (
-                energy[i] > threshold
-                and energy[i] > energy[i - 1]
-                and energy[i] > energy[i + 1]
-            ):
-                # Check minimum distance from last peak
-                if not peaks or i - peaks[-1] >= min_distance:
-                    peaks.append(i)
+        peaks, _ = find_peaks(
+            energy, height=threshold, distance=max(self._min_beat_distance_frames, 1)
+        )
 
         # Convert peak indices to time positions
-        hop_size = int(self.sample_rate * 0.05) // 4
-        beat_positions = [p * hop_size / self.sample_rate for p in peaks]
+        return peaks / self._frame_rate
 
-        return beat_positions
+    def _estimate_tempo_acf(self, energy: np.ndarray) -> Optional[float]:
+        """
+        Estimate BPM from the autocorrelation of the energy envelope
+        Returns None when the envelope is shorter than two beats at min_bpm
+        """
+        frame_rate = self._frame_rate
+        lag_min = int(60 * frame_rate / self.max_bpm)
+        lag_max = int(60 * frame_rate / self.min_bpm)
+        if len(energy) < 2 * lag_max:
+            return None
+
+        # Wiener-Khinchin: autocorrelation is the inverse FFT of the power
+        # spectrum; zero-padding to 2N avoids circular wrap-around
+        # Log-compress first so a single loud transient cannot dominate
+        env = np.log1p(energy)
+        env -= env.mean()
+        spectrum = np.fft.rfft(env, n=2 * len(env))
+        acf = np.fft.irfft(spectrum * np.conj(spectrum))[: len(env)]
+
+        lag = lag_min + int(np.argmax(acf[lag_min : lag_max + 1]))
+        if acf[lag] <= 0:
+            return None
+
+        # On long, steady tracks multiples of the beat period correlate almost
+        # as well as the period itself; prefer the shortest such lag
+        for divisor in (4, 3, 2):
+            centre = int(round(lag / divisor))
+            if centre - 1 < lag_min:
+                continue
+            candidate = centre - 1 + int(np.argmax(acf[centre - 1 : centre + 2]))
+            if acf[candidate] >= 0.9 * acf[lag]:
+                lag = candidate
+                break
+
+        # Refine the lag between frames with a parabola through the peak
+        prev, peak, nxt = acf[lag - 1], acf[lag], acf[lag + 1]
+        denominator = prev - 2 * peak + nxt
+        if denominator < 0:
+            lag += 0.5 * (prev - nxt) / denominator
+
+        bpm = max(self.min_bpm, min(self.max_bpm, 60 * frame_rate / float(lag)))
+        return round(bpm, 2)
 
-    def _calculate_bpm(self, beat_positions: List[float]) -> float:
+    def _calculate_bpm(self, beat_positions: np.ndarray) -> float:
         """Calculate BPM from beat positions"""
         if len(beat_positions) < 2:
             return 120.0  # Default BPM
@@ -141,42 +336,36 @@ class BeatDetector:
 
         # Remove outliers
         median_interval = np.median(intervals)
-        valid_intervals = [
-            i for i in intervals if 0.5 * median_interval < i < 1.5 * median_interval
+        valid_intervals = intervals[
+            (intervals > 0.5 * median_interval) & (intervals < 1.5 * median_interval)
         ]
 
-        if not valid_intervals:
+        if valid_intervals.size == 0:
             return 120.0
 
         # Calculate BPM from average interval
-        avg_interval = np.mean(valid_intervals)
+        avg_interval = float(valid_intervals.mean())
         bpm = 60.0 / avg_interval
 
         # Clamp to reasonable range
-        bpm = np.clip(bpm, self.min_bpm, self.max_bpm)
+        bpm = max(self.min_bpm, min(self.max_bpm, bpm))
 
         return round(bpm, 2)
 
     def _generate_beat_grid(
-        self, bpm: float, duration: float, beat_positions: List[float]
-    ) -> List[float]:
+        self, bpm: float, duration: float, beat_positions: np.ndarray
+    ) -> np.ndarray:
         """Generate quantized beat grid based on BPM"""
-        if bpm == 0:
-            return []
+        if bpm <= 0:
+            return np.empty(0)
 
         beat_interval = 60.0 / bpm
-        first_beat = beat_positions[0] if beat_positions else 0.0
-
-        # Generate grid
-        grid = []
-        t = first_beat
-        while t < duration:
-            grid.append(t)
-            t += beat_interval
+        first_beat = beat_positions[0] if len(beat_positions) else 0.0
 
-        return grid
+        # Evenly spaced grid; no drift from repeatedly adding the interval
+        return np.arange(first_beat, duration, beat_interval)
 
-    def _calculate_confidence(self, beat_positions: List[float], bpm: float) -> float:
+    def _calculate_confidence(self, beat_positions: np.ndarray, bpm: float) -> float:
         """Calculate confidence in beat detection"""
         if len(beat_positions) < 2:
             return 0.0
@@ -186,8 +375,9 @@ class BeatDetector:
         expected_interval = 60.0 / bpm
 
         # Calculate deviation from expected interval
-        deviations = [abs(i - expected_interval) / expected_interval for i in intervals]
-        avg_deviation = np.mean(deviations)
+        avg_deviation = (
+            float(np.mean(np.abs(intervals - expected_interval))) / expected_interval
+        )
 
         # Convert to confidence (lower deviation = higher confidence)
         confidence = 1.0 - min(avg_deviation, 1.0)
@@ -220,7 +410,7 @@ class AutoSync:
         tempo_ratio = track2_bpm / track1_bpm
 
         # Calculate pitch adjustment (in semitones)
-        pitch_adjustment = 12 * np.log2(tempo_ratio)
+        pitch_adjustment = 12 * math.log2(tempo_ratio)
 
         # Check if sync is reasonable (within ±12% tempo change)
         sync_possible = abs(tempo_ratio - 1.0) <= 0.12
@@ -250,20 +440,19 @@ class AutoSync:
         Returns:
             Position in track2 (seconds) where beats align
         """
-        if not track1_beat.beat_grid or not track2_beat.beat_grid:
+        if len(track1_beat.beat_grid) == 0 or len(track2_beat.beat_grid) == 0:
             return 0.0
 
-        # Find nearest beat in track1 to current position
-        track1_next_beat = min(
-            [b for b in track1_beat.beat_grid if b >= current_position],
-            default=track1_beat.beat_grid[-1],
+        # Find nearest beat in track1 to current position (last beat if past it);
+        # the grid is sorted, so its index is also the beat number minus one
+        grid1 = np.asarray(track1_beat.beat_grid)
+        next_index = min(
+            int(np.searchsorted(grid1, current_position, side="left")), len(grid1) - 1
         )
 
         # Find phase within measure (assuming 4/4 time)
         beats_per_measure = 4
-        track1_beat_num = len(
-            [b for b in track1_beat.beat_grid if b <= track1_next_beat]
-        )
+        track1_beat_num = next_index + 1
         phase_in_measure = track1_beat_num % beats_per_measure
 
         # Find corresponding beat in track2 with same phase
@@ -296,13 +485,13 @@ class AutoSync:
         beats_per_phrase = 16
         next_phrase_boundary = current_position
 
-        if track1_beat.beat_grid:
-            future_beats = [b for b in track1_beat.beat_grid if b > current_position]
-            if future_beats:
-                beats_ahead = len(future_beats)
-                beats_to_phrase = beats_per_phrase - (beats_ahead % beats_per_phrase)
-                if beats_to_phrase < len(future_beats):
-                    next_phrase_boundary = future_beats[beats_to_phrase]
+        grid1 = np.asarray(track1_beat.beat_grid)
+        first_future = int(np.searchsorted(grid1, current_position, side="right"))
+        beats_ahead = len(grid1) - first_future
+        if beats_ahead > 0:
+            beats_to_phrase = beats_per_phrase - (beats_ahead % beats_per_phrase)
+            if beats_to_phrase < beats_ahead:
+                next_phrase_boundary = float(grid1[first_future + beats_to_phrase])
 
         return {
             "sync_info": sync_info,
@@ -4,20 +4,22 @@ Demo of AI-driven DJ features
 Shows the new functionality in action
 """
 
-import time
-from ai_dj_assistant import AIDJAssistant
+_BAR = "=" * 60
+_DASH = "-" * 40
 
 
 def demo_ai_features():
     """Demonstrate all AI features"""
+    from ai_dj_assistant import AIDJAssistant
+
     print("🎵 AI-Driven DJ Mixer Demo")
-    print("=" * 60)
+    print(_BAR)
     print("This demo shows the new AI-powered features:")
     print("1. Intelligent track analysis")
     print("2. Auto mixing with AI advice")
     print("3. Harmonic key mixing")
     print("4. Smart fader effects")
-    print("=" * 60)
+    print(_BAR)
 
     # Initialize AI assistant (mock mode for demo)
     ai = AIDJAssistant()
@@ -32,7 +34,7 @@ def demo_ai_features():
     ]
 
     print("\n📊 FEATURE 1: Intelligent Track Analysis")
-    print("-" * 40)
+    print(_DASH)
 
     analyses = {}
     for track in demo_tracks:
@@ -49,7 +51,7 @@ def demo_ai_features():
     print(f"\n✅ Analyzed {len(demo_tracks)} tracks successfully!")
 
     print("\n🎛️ FEATURE 2: AI Auto Mixing")
-    print("-" * 40)
+    print(_DASH)
 
     # Demo auto mixing between different track combinations
     combinations = [
@@ -69,7 +71,7 @@ def demo_ai_features():
         print(f"   💡 Reasoning: {advice.reasoning}")
 
     print("\n🎼 FEATURE 3: Harmonic Key Mixing")
-    print("-" * 40)
+    print(_DASH)
 
     for track1, track2 in combinations:
         key_advice = ai.get_key_mixing_advice(track1, track2)
@@ -83,7 +85,7 @@ def demo_ai_features():
         print(f"   🎛️ Action: {key_advice['suggested_action']}")
 
     print("\n🎚️ FEATURE 4: Smart Fader Effects")
-    print("-" * 40)
+    print(_DASH)
 
     for track1, track2 in combinations:
         track1_analysis = analyses[track1]
@@ -106,27 +108,27 @@ def demo_ai_features():
         print(f"   💡 {effects['reasoning']}")
 
     print("\n📈 AI ASSISTANT STATUS")
-    print("-" * 40)
+    print(_DASH)
     status = ai.get_ai_status()
     print(f"🔧 Configured: {'Yes' if status['configured'] else 'No (Demo Mode)'}")
     print(f"🤖 Gemini Available: {'Yes' if status['gemini_available'] else 'No'}")
     print(f"📊 Tracks Analyzed: {status['tracks_analyzed']}")
     print(f"🎛️ Mixing History: {status['mixing_history_count']}")
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("✅ AI-Driven DJ Features Demo Complete!")
     print("\n💡 To use with real Gemini AI:")
     print("   1. Get a Gemini API key from Google AI Studio")
     print("   2. Enter it in the GUI's AI Assistant section")
     print("   3. Click 'Configure AI' to enable full AI features")
     print("\n🎵 Features work in mock mode for testing without API key")
-    print("=" * 60)
+    print(_BAR)
 
 
 def demo_gui_features():
     """Show what the GUI now includes"""
     print("\n🖥️ NEW GUI FEATURES")
-    print("-" * 40)
+    print(_DASH)
     print("The DJ Mixer GUI now includes:")
     print()
     print("🤖 AI Assistant Section:")
@@ -4,28 +4,49 @@ Comprehensive demo of all advanced DJ Mixer features
 Demonstrates audio effects, beat detection, MIDI, recording, playlists, and waveforms
 """
 
-import time
+import contextlib
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from enhanced_mixer import EnhancedDJMixer
 from test_mixer import MockDJMixer
 from audio_effects import EffectsPresets
-from playlist_manager import PlaylistTrack
+
+_BAR = "=" * 70
+
+PRESET_NAMES = tuple(
+    name
+    for name in (
+        "bass_boost",
+        "treble_boost",
+        "vocal_enhance",
+        "club_sound",
+        "telephone_effect",
+    )
+    if hasattr(EffectsPresets, name)
+)
+
+
+def _is_interactive() -> bool:
+    """Whether to pause for Enter between demos (off for --auto or CI)"""
+    return (
+        "--auto" not in sys.argv[1:]
+        and os.environ.get("DJ_DEMO_NONINTERACTIVE") != "1"
+        and sys.stdin.isatty()
+    )
 
 
 def print_section(title):
     """Print a section header"""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    sys.stdout.write(f"\n{_BAR}\n  {title}\n{_BAR}\n")
 
 
-def demo_audio_effects():
+def demo_audio_effects(mixer):
     """Demo audio effects features"""
     print_section("1. AUDIO EFFECTS DEMO")
 
-    mixer = EnhancedDJMixer()
-    mixer.initialize()
-
     # Load a mock track
     print("\nLoading track to deck1...")
     mixer.load_track("deck1", "mock_track.mp3", analyze_beats=False)
@@ -56,29 +77,17 @@ def demo_audio_effects():
 
     # Show presets
     print("\n--- Effect Presets ---")
-    presets = [
-        "bass_boost",
-        "treble_boost",
-        "vocal_enhance",
-        "club_sound",
-        "telephone_effect",
-    ]
-    for preset_name in presets:
-        preset_method = getattr(EffectsPresets, preset_name)
-        preset = preset_method()
+    for preset_name in PRESET_NAMES:
         print(f"  {preset_name.replace('_', ' ').title()}: Available")
 
-    mixer.cleanup()
+    mixer.reset_state()
     print("\n✓ Audio effects demo complete")
 
 
-def demo_beat_detection():
+def demo_beat_detection(mixer):
     """Demo beat detection and auto-sync"""
     print_section("2. BEAT DETECTION & AUTO-SYNC DEMO")
 
-    mixer = EnhancedDJMixer()
-    mixer.initialize()
-
     # Load two tracks
     print("\nLoading tracks...")
     mixer.load_track("deck1", "track1.mp3", analyze_beats=True)
@@ -106,17 +115,14 @@ def demo_beat_detection():
         print(f"Sync Possible: {'Yes' if sync_info['sync_possible'] else 'No'}")
         print(f"Message: {sync_info['message']}")
 
-    mixer.cleanup()
+    mixer.reset_state()
     print("\n✓ Beat detection demo complete")
 
 
-def demo_midi_controller():
+def demo_midi_controller(mixer):
     """Demo MIDI controller support"""
     print_section("3. MIDI CONTROLLER DEMO")
 
-    mixer = EnhancedDJMixer()
-    mixer.initialize()
-
     # Connect MIDI (using mock)
     print("\nConnecting MIDI controller...")
     if mixer.connect_midi(use_mock=True):
@@ -148,17 +154,14 @@ def demo_midi_controller():
     mixer.midi_controller.simulate_control_change(1, 96)  # ~75%
     print(f"  Deck1 volume: {mixer.get_track_volume('deck1'):.2f}")
 
-    mixer.cleanup()
+    mixer.reset_state()
     print("\n✓ MIDI controller demo complete")
 
 
-def demo_recording():
+def demo_recording(mixer):
     """Demo recording and export functionality"""
     print_section("4. RECORDING & EXPORT DEMO")
 
-    mixer = EnhancedDJMixer()
-    mixer.initialize()
-
     # Start recording
     print("\nStarting recording...")
     mixer.start_recording("demo_recording.wav")
@@ -174,9 +177,8 @@ def demo_recording():
 
     # Simulate some recording time
     print("\nRecording for 2 seconds...")
-    for i in range(2):
-        time.sleep(1)
-        duration = mixer.recorder.get_recording_duration()
+    for target in (1.0, 2.0):
+        duration = mixer.recorder.wait_for_duration(target)
         print(f"  Duration: {duration:.1f}s")
 
     # Stop recording
@@ -190,17 +192,14 @@ def demo_recording():
     for fmt in formats:
         print(f"  ✓ {fmt}")
 
-    mixer.cleanup()
+    mixer.reset_state()
     print("\n✓ Recording demo complete")
 
 
-def demo_playlist_management():
+def demo_playlist_management(mixer):
     """Demo playlist management"""
     print_section("5. PLAYLIST MANAGEMENT DEMO")
 
-    mixer = EnhancedDJMixer()
-    mixer.initialize()
-
     # Create playlist
     print("\nCreating playlist...")
     playlist = mixer.create_playlist("My DJ Set")
@@ -209,22 +208,13 @@ def demo_playlist_management():
     # Add tracks
     print("\n--- Adding Tracks ---")
     tracks_data = [
-        {"title": "House Track", "artist": "DJ Mix", "bpm": 128.0, "key": "Am"},
-        {"title": "Techno Beat", "artist": "Electronic", "bpm": 135.0, "key": "Dm"},
-        {"title": "Deep Bass", "artist": "Bass Master", "bpm": 120.0, "key": "Cm"},
-        {"title": "Trance Anthem", "artist": "Uplifter", "bpm": 140.0, "key": "F#m"},
+        ("/path/to/track1.mp3", "House Track", "DJ Mix", 128.0, "Am", 240.0),
+        ("/path/to/track2.mp3", "Techno Beat", "Electronic", 135.0, "Dm", 240.0),
+        ("/path/to/track3.mp3", "Deep Bass", "Bass Master", 120.0, "Cm", 240.0),
+        ("/path/to/track4.mp3", "Trance Anthem", "Uplifter", 140.0, "F#m", 240.0),
     ]
 
-    for i, track_data in enumerate(tracks_data, 1):
-        track = PlaylistTrack(
-            path=f"/path/to/track{i}.mp3",
-            title=track_data["title"],
-            artist=track_data["artist"],
-            bpm=track_data["bpm"],
-            key=track_data["key"],
-            duration=240.0,
-        )
-        playlist.add_track(track)
+    for track in playlist.add_tracks_from_tuples(tracks_data):
         print(f"  Added: {track.title} ({track.bpm} BPM, {track.key})")
 
     # Show playlist info
@@ -256,7 +246,7 @@ def demo_playlist_management():
     prev_track = playlist.previous_track()
     print(f"  Previous: {prev_track.title}")
 
-    mixer.cleanup()
+    mixer.reset_state()
     print("\n✓ Playlist management demo complete")
 
 
@@ -272,10 +262,20 @@ def demo_waveform_display():
     duration = 3.0  # 3 seconds
     samples = int(sample_rate * duration)
 
-    # Create audio with varying amplitude
-    t = np.linspace(0, duration, samples)
-    audio = np.sin(2 * np.pi * 440 * t) * np.sin(2 * np.pi * 2 * t)
-    audio = (audio * 10000).astype(np.int16)
+    # Create audio with varying amplitude (float32, computed in place)
+    t = np.linspace(0, duration, samples, dtype=np.float32)
+    carrier = np.empty(samples, dtype=np.float32)
+    np.multiply(t, np.float32(2 * np.pi * 440), out=carrier)
+    np.sin(carrier, out=carrier)
+    t *= np.float32(2 * np.pi * 2)
+    np.sin(t, out=t)
+    carrier *= t
+
+    # Scale to int16 range (|x| <= 10000, so no clipping pass is needed)
+    carrier *= np.float32(10000)
+    np.rint(carrier, out=carrier)
+    audio = np.empty(samples, dtype=np.int16)
+    np.copyto(audio, carrier, casting="unsafe")
 
     # Generate waveform
     print("\n--- Generating Waveform ---")
@@ -322,13 +322,15 @@ def demo_web_interface():
     """Demo web interface setup"""
     print_section("7. WEB INTERFACE DEMO")
 
-    print("\nWeb interface features:")
-    print("  ✓ Flask-based REST API")
-    print("  ✓ WebSocket for real-time updates")
-    print("  ✓ Modern, responsive HTML/CSS/JavaScript UI")
-    print("  ✓ Remote control capabilities")
+    out = [
+        "\nWeb interface features:",
+        "  ✓ Flask-based REST API",
+        "  ✓ WebSocket for real-time updates",
+        "  ✓ Modern, responsive HTML/CSS/JavaScript UI",
+        "  ✓ Remote control capabilities",
+    ]
 
-    print("\n--- API Endpoints ---")
+    out.append("\n--- API Endpoints ---")
     endpoints = [
         "GET  /api/status - Get mixer status",
         "POST /api/initialize - Initialize mixer",
@@ -340,43 +342,38 @@ def demo_web_interface():
         "POST /api/crossfader - Set crossfader",
         "POST /api/master-volume - Set master volume",
     ]
+    out.extend(f"  {endpoint}" for endpoint in endpoints)
 
-    for endpoint in endpoints:
-        print(f"  {endpoint}")
-
-    print("\n--- WebSocket Events ---")
+    out.append("\n--- WebSocket Events ---")
     events = [
         "connect - Client connected",
         "disconnect - Client disconnected",
         "status_update - Real-time status broadcast",
         "request_status - Request current status",
     ]
-
-    for event in events:
-        print(f"  {event}")
-
-    print("\nTo start web interface:")
-    print("  from web_interface import DJMixerWebServer, create_web_templates")
-    print("  from test_mixer import MockDJMixer")
-    print("  ")
-    print("  create_web_templates()")
-    print("  mixer = MockDJMixer()")
-    print("  mixer.initialize()")
-    print("  server = DJMixerWebServer(mixer, port=5000)")
-    print("  server.start()")
-    print("  ")
-    print("  Then open: http://localhost:5000")
-
-    print("\n✓ Web interface demo complete")
+    out.extend(f"  {event}" for event in events)
+
+    out += [
+        "\nTo start web interface:",
+        "  from web_interface import DJMixerWebServer, create_web_templates",
+        "  from test_mixer import MockDJMixer",
+        "  ",
+        "  create_web_templates()",
+        "  mixer = MockDJMixer()",
+        "  mixer.initialize()",
+        "  server = DJMixerWebServer(mixer, port=5000)",
+        "  server.start()",
+        "  ",
+        "  Then open: http://localhost:5000",
+        "\n✓ Web interface demo complete",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def demo_comprehensive_status():
+def demo_comprehensive_status(mixer):
     """Demo comprehensive mixer status"""
     print_section("8. COMPREHENSIVE MIXER STATUS")
 
-    mixer = EnhancedDJMixer()
-    mixer.initialize()
-
     # Setup mixer state
     print("\nSetting up mixer...")
     mixer.load_track("deck1", "track1.mp3")
@@ -423,54 +420,115 @@ def demo_comprehensive_status():
         print(f"  Tracks: {status['playlist']['track_count']}")
         print(f"  Current: #{status['playlist']['current_index'] + 1}")
 
-    mixer.cleanup()
+    mixer.reset_state()
     print("\n✓ Comprehensive status demo complete")
 
 
-def main():
-    """Run all demos"""
-    print("=" * 70)
-    print("  DJ MIXER - COMPREHENSIVE FEATURES DEMONSTRATION")
-    print("=" * 70)
-    print("\nThis demo showcases all advanced features:")
-    print("  1. Real-time Audio Effects (EQ, Filters, Reverb)")
-    print("  2. Beat Detection and Auto-Sync")
-    print("  3. MIDI Controller Support")
-    print("  4. Recording and Export")
-    print("  5. Playlist Management")
-    print("  6. Visual Waveform Display")
-    print("  7. Web-Based Interface")
-    print("  8. Comprehensive Status Monitoring")
-
-    input("\nPress Enter to start demos...")
+DEMOS = (
+    demo_audio_effects,
+    demo_beat_detection,
+    demo_midi_controller,
+    demo_recording,
+    demo_playlist_management,
+    demo_waveform_display,
+    demo_web_interface,
+    demo_comprehensive_status,
+)
 
-    try:
-        demo_audio_effects()
-        input("\nPress Enter to continue to next demo...")
 
-        demo_beat_detection()
-        input("\nPress Enter to continue to next demo...")
+# Demos that don't drive a mixer
+_STANDALONE_DEMOS = frozenset({demo_waveform_display, demo_web_interface})
+
+
+def _run_demo(demo, mixer):
+    """Run a demo, passing the shared mixer to the ones that use it"""
+    if demo in _STANDALONE_DEMOS:
+        demo()
+    else:
+        demo(mixer)
+
 
-        demo_midi_controller()
-        input("\nPress Enter to continue to next demo...")
+def _run_demo_captured(demo) -> str:
+    """
+    Run a demo with its own mixer and return what the demo printed
+    The worker mixer's setup and cleanup messages are discarded
+    """
+    if demo in _STANDALONE_DEMOS:
+        mixer = None
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            mixer = EnhancedDJMixer()
+            mixer.initialize()
 
-        demo_recording()
-        input("\nPress Enter to continue to next demo...")
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            _run_demo(demo, mixer)
+    finally:
+        if mixer is not None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                mixer.cleanup()
+    return buffer.getvalue()
+
+
+def run_demos_parallel():
+    """
+    Run the demos in worker processes, printing output in demo order
+    Matches a serial run except that no mixer setup or cleanup messages
+    are printed
+    """
+    workers = min(len(DEMOS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for output in executor.map(_run_demo_captured, DEMOS):
+            sys.stdout.write(output)
 
-        demo_playlist_management()
-        input("\nPress Enter to continue to next demo...")
 
-        demo_waveform_display()
-        input("\nPress Enter to continue to next demo...")
+def main():
+    """Run all demos (pass --parallel to run them in worker processes)"""
+    sys.stdout.write(
+        "\n".join(
+            [
+                _BAR,
+                "  DJ MIXER - COMPREHENSIVE FEATURES DEMONSTRATION",
+                _BAR,
+                "\nThis demo showcases all advanced features:",
+                "  1. Real-time Audio Effects (EQ, Filters, Reverb)",
+                "  2. Beat Detection and Auto-Sync",
+                "  3. MIDI Controller Support",
+                "  4. Recording and Export",
+                "  5. Playlist Management",
+                "  6. Visual Waveform Display",
+                "  7. Web-Based Interface",
+                "  8. Comprehensive Status Monitoring",
+            ]
+        )
+        + "\n"
+    )
 
-        demo_web_interface()
-        input("\nPress Enter to continue to final demo...")
+    parallel = "--parallel" in sys.argv[1:]
+    interactive = not parallel and _is_interactive()
+    pause = input if interactive else (lambda prompt="": None)
 
-        demo_comprehensive_status()
+    pause("\nPress Enter to start demos...")
 
-        print("\n" + "=" * 70)
+    mixer = None
+    try:
+        if parallel:
+            run_demos_parallel()
+        else:
+            # One mixer is initialized up front and reset between demos
+            mixer = EnhancedDJMixer()
+            mixer.initialize()
+            for i, demo in enumerate(DEMOS):
+                if i == len(DEMOS) - 1:
+                    pause("\nPress Enter to continue to final demo...")
+                elif i > 0:
+                    pause("\nPress Enter to continue to next demo...")
+                _run_demo(demo, mixer)
+
+        print("\n" + _BAR)
         print("  ALL DEMOS COMPLETED SUCCESSFULLY!")
-        print("=" * 70)
+        print(_BAR)
         print("\n✓ All advanced features demonstrated")
         print("\nNext steps:")
         print("  - Integrate these features into the GUI (dj_gui.py)")
@@ -485,6 +543,9 @@ def main():
         import traceback
 
         traceback.print_exc()
+    finally:
+        if mixer is not None:
+            mixer.cleanup()
 
 
 if __name__ == "__main__":
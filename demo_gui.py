@@ -5,11 +5,21 @@ This demonstrates the GUI functionality with mock audio
 """
 
 import tkinter as tk
-from tkinter import messagebox
 import threading
-import time
+from itertools import cycle
 from dj_gui import DJMixerGUI
 
+# Demo tracks handed out in turn by "Load Track"
+_DEMO_TRACKS = cycle(
+    (
+        "demo_house_track.mp3",
+        "demo_techno_beat.wav",
+        "demo_vocal_sample.ogg",
+        "demo_bass_drop.flac",
+        "demo_ambient_pad.wav",
+    )
+)
+
 
 class DemoGUI(DJMixerGUI):
     """Demo version of the GUI with mock functionality"""
@@ -37,18 +47,8 @@ class DemoGUI(DJMixerGUI):
 
     def load_track(self, deck_name, file_var):
         """Mock track loading for demo"""
-        demo_tracks = [
-            "demo_house_track.mp3",
-            "demo_techno_beat.wav",
-            "demo_vocal_sample.ogg",
-            "demo_bass_drop.flac",
-            "demo_ambient_pad.wav",
-        ]
-
         # Simulate file selection
-        import random
-
-        selected_track = random.choice(demo_tracks)
+        selected_track = next(_DEMO_TRACKS)
         file_var.set(selected_track)
         self.log_message(
             f"✓ Demo track {selected_track} loaded into {deck_name.upper()}"
@@ -57,32 +57,21 @@ class DemoGUI(DJMixerGUI):
     def play_track(self, deck_name):
         """Mock track playing for demo"""
         self.log_message(
-            f"▶️ Playing {deck_name.upper()} - {getattr(self, f'{deck_name}_file').get()}"
+            f"▶️ Playing {deck_name.upper()} - {self._deck_file_vars[deck_name].get()}"
         )
 
         # Simulate playing status
-        if deck_name == "deck1":
-            self.deck1_status.set("PLAYING")
-        else:
-            self.deck2_status.set("PLAYING")
+        self._set_if_changed(self._deck_status_vars[deck_name], "PLAYING")
 
     def stop_track(self, deck_name):
         """Mock track stopping for demo"""
         self.log_message(f"⏹ Stopped {deck_name.upper()}")
-
-        if deck_name == "deck1":
-            self.deck1_status.set("STOPPED")
-        else:
-            self.deck2_status.set("STOPPED")
+        self._set_if_changed(self._deck_status_vars[deck_name], "STOPPED")
 
     def pause_track(self, deck_name):
         """Mock track pausing for demo"""
         self.log_message(f"⏸ Paused {deck_name.upper()}")
-
-        if deck_name == "deck1":
-            self.deck1_status.set("PAUSED")
-        else:
-            self.deck2_status.set("PAUSED")
+        self._set_if_changed(self._deck_status_vars[deck_name], "PAUSED")
 
 
 def run_demo():
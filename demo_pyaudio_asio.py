@@ -7,16 +7,18 @@ Demonstrates the new PyAudio integration and ASIO device selection
 
 from enhanced_mixer import EnhancedDJMixer
 
+_BAR = "=" * 70
+
 
 def demo_pyaudio_asio():
     """Demo PyAudio with ASIO support."""
-    print("=" * 70)
+    print(_BAR)
     print("DJ Mixer - PyAudio with ASIO Driver Support Demo")
-    print("=" * 70)
+    print(_BAR)
 
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("1. Standard PyAudio Mode (Default Output)")
-    print("=" * 70)
+    print(_BAR)
 
     # Create mixer with PyAudio
     mixer = EnhancedDJMixer(use_pyaudio=True, use_asio=False)
@@ -54,9 +56,9 @@ def demo_pyaudio_asio():
         mixer.cleanup()
         print("\n✓ Standard PyAudio mode demo complete")
 
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("2. PyAudio with ASIO Mode")
-    print("=" * 70)
+    print(_BAR)
 
     # Create mixer with ASIO preference
     mixer_asio = EnhancedDJMixer(use_pyaudio=True, use_asio=True)
@@ -94,9 +96,9 @@ def demo_pyaudio_asio():
         mixer_asio.cleanup()
         print("\n✓ ASIO mode demo complete")
 
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("3. Comparison: pygame vs PyAudio Mode")
-    print("=" * 70)
+    print(_BAR)
 
     print("\n--- pygame Mode (Original) ---")
     mixer_pygame = EnhancedDJMixer(use_pyaudio=False)
@@ -118,9 +120,9 @@ def demo_pyaudio_asio():
     print("  ✓ Better multi-device routing")
     mixer_pyaudio.cleanup()
 
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("Key Benefits of PyAudio with ASIO")
-    print("=" * 70)
+    print(_BAR)
     print(
         """
   1. Professional Audio Interfaces
@@ -145,9 +147,9 @@ def demo_pyaudio_asio():
 """
     )
 
-    print("=" * 70)
+    print(_BAR)
     print("Usage Examples")
-    print("=" * 70)
+    print(_BAR)
     print(
         """
   # Use PyAudio with default output
@@ -169,9 +171,9 @@ def demo_pyaudio_asio():
 """
     )
 
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("✓ PyAudio/ASIO Demo Complete")
-    print("=" * 70)
+    print(_BAR)
 
 
 if __name__ == "__main__":
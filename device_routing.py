@@ -4,12 +4,24 @@ Advanced Device Routing for DJ Mixer
 Provides PyAudio integration for better device control and routing
 """
 
-from typing import Dict, List, Optional, Tuple
+import os
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import numpy as np
 
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Environment variables holding preferred output device indices
+MAIN_DEVICE_ENV = "DJ_MAIN_DEVICE"
+HEADPHONE_DEVICE_ENV = "DJ_HEADPHONE_DEVICE"
+ZONE2_DEVICE_ENV = "DJ_ZONE2_DEVICE"
+ZONE3_DEVICE_ENV = "DJ_ZONE3_DEVICE"
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AudioDevice:
     """Information about an audio device"""
 
@@ -23,7 +35,7 @@ class AudioDevice:
     is_default_output: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DeviceRoute:
     """Audio routing configuration"""
 
@@ -39,6 +51,12 @@ class AudioDeviceManager:
     def __init__(self):
         self.pyaudio_instance = None
         self.available_devices: List[AudioDevice] = []
+        self._devices_by_index: Dict[int, AudioDevice] = {}
+        self._device_names_lower: List[str] = []
+        self._output_devices: Optional[Tuple[AudioDevice, ...]] = None
+        self._asio_devices: Tuple[AudioDevice, ...] = ()
+        self._default_output: Optional[AudioDevice] = None
+        self._headphone_candidates: List[AudioDevice] = []
         self.routes: Dict[str, DeviceRoute] = {}
         self.initialized = False
         self.use_mock = False
@@ -112,6 +130,7 @@ class AudioDeviceManager:
                 host_api="Core Audio (Mock)",
             ),
         ]
+        self._index_devices()
         self.initialized = True
         print("[MOCK] Audio devices initialized")
         return True
@@ -121,65 +140,114 @@ class AudioDeviceManager:
         if not self.pyaudio_instance:
             return
 
-        import pyaudio
-
         self.available_devices = []
-        device_count = self.pyaudio_instance.get_device_count()
+        pa = self.pyaudio_instance
 
-        default_input = self.pyaudio_instance.get_default_input_device_info()
-        default_output = self.pyaudio_instance.get_default_output_device_info()
+        default_input = pa.get_default_input_device_info()
+        default_output = pa.get_default_output_device_info()
 
-        for i in range(device_count):
+        # Walk devices per host API; the host API info is fetched once and
+        # supplies both the name and the device count
+        for api_index in range(pa.get_host_api_count()):
             try:
-                info = self.pyaudio_instance.get_device_info_by_index(i)
-
-                # Get host API name
-                host_api_info = self.pyaudio_instance.get_host_api_info_by_index(
-                    info["hostApi"]
-                )
-
-                device = AudioDevice(
-                    index=i,
-                    name=info["name"],
-                    max_input_channels=info["maxInputChannels"],
-                    max_output_channels=info["maxOutputChannels"],
-                    default_sample_rate=info["defaultSampleRate"],
-                    host_api=host_api_info["name"],
-                    is_default_input=(i == default_input["index"]),
-                    is_default_output=(i == default_output["index"]),
-                )
-
-                self.available_devices.append(device)
+                api_info = pa.get_host_api_info_by_index(api_index)
             except Exception as e:
-                print(f"Error getting device {i}: {e}")
+                print(f"Error getting host API {api_index}: {e}")
+                continue
+
+            for api_device in range(api_info["deviceCount"]):
+                try:
+                    info = pa.get_device_info_by_host_api_device_index(
+                        api_index, api_device
+                    )
+                    i = info["index"]
+
+                    device = AudioDevice(
+                        index=i,
+                        name=info["name"],
+                        max_input_channels=info["maxInputChannels"],
+                        max_output_channels=info["maxOutputChannels"],
+                        default_sample_rate=info["defaultSampleRate"],
+                        host_api=api_info["name"],
+                        is_default_input=(i == default_input["index"]),
+                        is_default_output=(i == default_output["index"]),
+                    )
+
+                    self.available_devices.append(device)
+                except Exception as e:
+                    print(
+                        f"Error getting device {api_device} of host API "
+                        f"{api_index}: {e}"
+                    )
+
+        self.available_devices.sort(key=lambda d: d.index)
+        self._index_devices()
+
+    def _index_devices(self) -> None:
+        """Rebuild lookup tables after the device list changes"""
+        self._devices_by_index = {d.index: d for d in self.available_devices}
+        self._device_names_lower = [d.name.lower() for d in self.available_devices]
+        self._output_devices = None
+        self._asio_devices = tuple(
+            d for d in self.available_devices if "ASIO" in d.host_api.upper()
+        )
+        self._default_output = next(
+            (d for d in self.available_devices if d.is_default_output), None
+        )
+        self._headphone_candidates = [
+            d
+            for d, name in zip(self.available_devices, self._device_names_lower)
+            if "headphone" in name and d.max_output_channels > 0
+        ]
 
-    def get_devices(self, output_only: bool = True) -> List[AudioDevice]:
-        """Get list of available audio devices"""
+    def refresh_devices(self) -> None:
+        """Re-enumerate devices (after hot-plugging hardware)"""
+        if self.use_mock:
+            self._index_devices()
+        else:
+            self._enumerate_devices()
+
+    def get_devices(self, output_only: bool = True) -> Sequence[AudioDevice]:
+        """Get available audio devices (output devices as a cached tuple)"""
         if output_only:
-            return [d for d in self.available_devices if d.max_output_channels > 0]
+            if self._output_devices is None:
+                self._output_devices = tuple(
+                    d for d in self.available_devices if d.max_output_channels > 0
+                )
+            return self._output_devices
         return self.available_devices
 
     def get_device_by_index(self, index: int) -> Optional[AudioDevice]:
         """Get device by index"""
-        for device in self.available_devices:
-            if device.index == index:
-                return device
-        return None
+        return self._devices_by_index.get(index)
 
     def get_device_by_name(self, name: str) -> Optional[AudioDevice]:
         """Get device by name (partial match)"""
         name_lower = name.lower()
-        for device in self.available_devices:
-            if name_lower in device.name.lower():
+        for device, device_name in zip(
+            self.available_devices, self._device_names_lower
+        ):
+            if name_lower in device_name:
                 return device
         return None
 
     def get_default_output_device(self) -> Optional[AudioDevice]:
         """Get default output device"""
-        for device in self.available_devices:
-            if device.is_default_output:
-                return device
-        return None
+        return self._default_output
+
+    def _device_from_env(self, var: str) -> Optional[AudioDevice]:
+        """Get the output device whose index is set in an environment variable"""
+        value = os.environ.get(var)
+        if not value:
+            return None
+        try:
+            device = self._devices_by_index.get(int(value))
+        except ValueError:
+            device = None
+        if device is None or device.max_output_channels <= 0:
+            print(f"Ignoring {var}={value}: not an output device index")
+            return None
+        return device
 
     def add_route(
         self, source: str, device_index: int, channels: Optional[List[int]] = None
@@ -194,8 +262,12 @@ class AudioDeviceManager:
             channels = [0, 1]
 
         # Validate channels
-        if max(channels) >= device.max_output_channels:
-            print(f"Channel {max(channels)} not available on device {device.name}")
+        if not channels:
+            print(f"No channels given for route {source}")
+            return False
+        highest = max(channels)
+        if highest >= device.max_output_channels:
+            print(f"Channel {highest} not available on device {device.name}")
             return False
 
         route = DeviceRoute(
@@ -234,13 +306,15 @@ class AudioDeviceManager:
         """Get route for a source"""
         return self.routes.get(source)
 
-    def get_all_routes(self) -> Dict[str, DeviceRoute]:
-        """Get all configured routes"""
-        return self.routes.copy()
+    def get_all_routes(self) -> Mapping[str, DeviceRoute]:
+        """Get a read-only view of all configured routes"""
+        return MappingProxyType(self.routes)
 
     def setup_default_routing(self) -> bool:
         """Setup default routing configuration"""
-        default_device = self.get_default_output_device()
+        default_device = (
+            self._device_from_env(MAIN_DEVICE_ENV) or self.get_default_output_device()
+        )
         if not default_device:
             return False
 
@@ -258,24 +332,35 @@ class AudioDeviceManager:
         - Master to main outputs
         - Headphone cue to separate output
         """
-        devices = self.get_devices()
-
-        if len(devices) < 2:
-            print("Not enough output devices for DJ routing")
-            return self.setup_default_routing()
-
-        # Find suitable devices
-        main_device = self.get_default_output_device()
-        headphone_device = None
-
-        # Look for headphone or secondary output
-        for device in devices:
-            if "headphone" in device.name.lower() or device.index != main_device.index:
-                headphone_device = device
-                break
-
-        if not headphone_device:
-            headphone_device = devices[1] if len(devices) > 1 else main_device
+        main_device = self._device_from_env(MAIN_DEVICE_ENV)
+        headphone_device = self._device_from_env(HEADPHONE_DEVICE_ENV)
+
+        # Only search the device list for outputs not given explicitly
+        if main_device is None or headphone_device is None:
+            devices = self.get_devices()
+
+            if len(devices) < 2:
+                print("Not enough output devices for DJ routing")
+                return self.setup_default_routing()
+
+            if main_device is None:
+                main_device = self.get_default_output_device() or devices[0]
+                # Keep master off an explicitly chosen headphone output
+                if headphone_device and main_device.index == headphone_device.index:
+                    main_device = next(
+                        d for d in devices if d.index != headphone_device.index
+                    )
+
+            # Prefer a headphone output, then any secondary output
+            if headphone_device is None:
+                headphone_device = next(
+                    (
+                        d
+                        for d in self._headphone_candidates
+                        if d.index != main_device.index
+                    ),
+                    None,
+                ) or next(d for d in devices if d.index != main_device.index)
 
         # Setup routes
         self.add_route("master", main_device.index, [0, 1])
@@ -295,13 +380,25 @@ class AudioDeviceManager:
         - Zone 2: Deck 1 only
         - Zone 3: Deck 2 only
         """
-        devices = self.get_devices()
+        preferred = [
+            self._device_from_env(var)
+            for var in (MAIN_DEVICE_ENV, ZONE2_DEVICE_ENV, ZONE3_DEVICE_ENV)
+        ]
 
-        if len(devices) < 3:
-            print("Not enough devices for multi-zone routing")
-            return self.setup_dj_routing()
+        if None in preferred:
+            devices = self.get_devices()
+
+            if len(devices) < 3:
+                print("Not enough devices for multi-zone routing")
+                return self.setup_dj_routing()
+
+            # Fill unset zones in order from the devices not already chosen
+            chosen = {p.index for p in preferred if p is not None}
+            spare = iter([d for d in devices if d.index not in chosen])
+            devices = [p or next(spare) for p in preferred]
+        else:
+            devices = preferred
 
-        # Use first 3 available devices
         self.add_route("master", devices[0].index, [0, 1])
         self.add_route("zone2_deck1", devices[1].index, [0, 1])
         self.add_route("zone3_deck2", devices[2].index, [0, 1])
@@ -316,22 +413,17 @@ class AudioDeviceManager:
 
     def get_asio_devices(self) -> List[AudioDevice]:
         """Get ASIO-compatible devices"""
-        return [d for d in self.available_devices if "ASIO" in d.host_api.upper()]
+        return list(self._asio_devices)
 
     def get_routing_info(self) -> dict:
         """Get routing configuration information"""
-        info = {
+        devices_by_index = self._devices_by_index
+        return {
             "initialized": self.initialized,
             "mock_mode": self.use_mock,
             "device_count": len(self.available_devices),
             "route_count": len(self.routes),
-            "devices": [],
-            "routes": [],
-        }
-
-        # Add device info
-        for device in self.available_devices:
-            info["devices"].append(
+            "devices": [
                 {
                     "index": device.index,
                     "name": device.name,
@@ -340,21 +432,20 @@ class AudioDeviceManager:
                     "host_api": device.host_api,
                     "default": device.is_default_output,
                 }
-            )
-
-        # Add route info
-        for source, route in self.routes.items():
-            device = self.get_device_by_index(route.device_index)
-            info["routes"].append(
+                for device in self.available_devices
+            ],
+            "routes": [
                 {
                     "source": source,
-                    "device": device.name if device else "Unknown",
+                    "device": getattr(
+                        devices_by_index.get(route.device_index), "name", "Unknown"
+                    ),
                     "channels": route.channels,
                     "enabled": route.enabled,
                 }
-            )
-
-        return info
+                for source, route in self.routes.items()
+            ],
+        }
 
     def cleanup(self) -> None:
         """Cleanup PyAudio resources"""
@@ -365,6 +456,12 @@ class AudioDeviceManager:
                 print(f"Error during PyAudio cleanup: {e}")
 
         self.pyaudio_instance = None
+        self._devices_by_index = {}
+        self._device_names_lower = []
+        self._output_devices = None
+        self._asio_devices = ()
+        self._default_output = None
+        self._headphone_candidates = []
         self.initialized = False
 
         if self.use_mock:
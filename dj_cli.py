@@ -5,9 +5,21 @@ Provides interactive control over the mixer functionality
 """
 
 import cmd
-from pathlib import Path
+import os
+from typing import Optional
 from dj_mixer import DJMixer
 
+# File extensions listed by the 'list' command
+_AUDIO_EXTS = frozenset({".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a"})
+
+# Crossfader zones, indexed by (pos >= 0.3) + (pos > 0.7)
+_ZONE_LABELS = ("LEFT", "CENTER", "RIGHT")
+
+
+def _crossfader_zone(pos: float) -> str:
+    """Label a crossfader position as LEFT, CENTER or RIGHT"""
+    return _ZONE_LABELS[(pos >= 0.3) + (pos > 0.7)]
+
 
 class DJMixerCLI(cmd.Cmd):
     """Interactive command-line interface for DJ Mixer"""
@@ -28,6 +40,25 @@ class DJMixerCLI(cmd.Cmd):
         super().__init__()
         self.mixer = DJMixer()
         self.initialized = False
+        # Track used by the last successful track command; commands given
+        # without a track name fall back to it
+        self._last_track: Optional[str] = None
+        # Bound do_* handlers by command name, so onecmd skips getattr
+        self._fast_dispatch = {
+            name[3:]: getattr(self, name)
+            for name in self.get_names()
+            if name.startswith("do_")
+        }
+
+    def onecmd(self, line):
+        """Run a command through the prebuilt handler table"""
+        command, arg, line = self.parseline(line)
+        handler = self._fast_dispatch.get(command) if line else None
+        if handler is None:
+            # Empty lines, unknown commands and the like
+            return super().onecmd(line)
+        self.lastcmd = "" if line == "EOF" else line
+        return handler(arg)
 
     def do_init(self, args):
         """Initialize the DJ mixer audio system"""
@@ -45,97 +76,108 @@ class DJMixerCLI(cmd.Cmd):
             print("Please initialize the mixer first with 'init'")
             return
 
-        parts = args.split()
-        if len(parts) < 2:
+        track_name, _, file_path = args.partition(" ")
+        file_path = file_path.strip()  # Handle paths with spaces
+        if not file_path:
             print("Usage: load <track_name> <file_path>")
             return
 
-        track_name = parts[0]
-        file_path = " ".join(parts[1:])  # Handle paths with spaces
-
         if self.mixer.load_track(track_name, file_path):
+            self._last_track = track_name
             print(f"✓ Loaded track '{track_name}' from {file_path}")
         else:
             print(f"✗ Failed to load track '{track_name}'")
 
     def do_play(self, args):
-        """Play a track: play <track_name> [loops] [fade_ms]"""
+        """Play a track: play <track_name> [loops] [fade_ms] (default: last track)"""
         if not self.initialized:
             print("Please initialize the mixer first with 'init'")
             return
 
-        parts = args.split()
-        if len(parts) < 1:
+        track_name, _, rest = args.partition(" ")
+        track_name = track_name or self._last_track
+        if not track_name:
             print("Usage: play <track_name> [loops] [fade_ms]")
             return
 
-        track_name = parts[0]
-        loops = int(parts[1]) if len(parts) > 1 else 0
-        fade_ms = int(parts[2]) if len(parts) > 2 else 0
+        extras = rest.split()
+        loops = int(extras[0]) if extras else 0
+        fade_ms = int(extras[1]) if len(extras) > 1 else 0
 
         if self.mixer.play_track(track_name, loops, fade_ms):
+            self._last_track = track_name
             print(f"✓ Playing track '{track_name}'")
         else:
             print(f"✗ Failed to play track '{track_name}'")
 
     def do_stop(self, args):
-        """Stop a track: stop <track_name> [fade_ms]"""
+        """Stop a track: stop <track_name> [fade_ms] (default: last track)"""
         if not self.initialized:
             print("Please initialize the mixer first with 'init'")
             return
 
-        parts = args.split()
-        if len(parts) < 1:
+        track_name, _, rest = args.partition(" ")
+        track_name = track_name or self._last_track
+        if not track_name:
             print("Usage: stop <track_name> [fade_ms]")
             return
 
-        track_name = parts[0]
-        fade_ms = int(parts[1]) if len(parts) > 1 else 0
+        extras = rest.split()
+        fade_ms = int(extras[0]) if extras else 0
 
-        self.mixer.stop_track(track_name, fade_ms)
+        if self.mixer.stop_track(track_name, fade_ms):
+            self._last_track = track_name
         print(f"✓ Stopped track '{track_name}'")
 
     def do_pause(self, args):
-        """Pause a track: pause <track_name>"""
+        """Pause a track: pause <track_name> (default: last track)"""
         if not self.initialized:
             print("Please initialize the mixer first with 'init'")
             return
 
-        if not args:
+        track_name = args or self._last_track
+        if not track_name:
             print("Usage: pause <track_name>")
             return
 
-        self.mixer.pause_track(args)
-        print(f"✓ Paused track '{args}'")
+        if self.mixer.pause_track(track_name):
+            self._last_track = track_name
+        print(f"✓ Paused track '{track_name}'")
 
     def do_unpause(self, args):
-        """Unpause a track: unpause <track_name>"""
+        """Unpause a track: unpause <track_name> (default: last track)"""
         if not self.initialized:
             print("Please initialize the mixer first with 'init'")
             return
 
-        if not args:
+        track_name = args or self._last_track
+        if not track_name:
             print("Usage: unpause <track_name>")
             return
 
-        self.mixer.unpause_track(args)
-        print(f"✓ Unpaused track '{args}'")
+        if self.mixer.unpause_track(track_name):
+            self._last_track = track_name
+        print(f"✓ Unpaused track '{track_name}'")
 
     def do_volume(self, args):
-        """Set track volume: volume <track_name> <level>"""
+        """Set track volume: volume [track_name] <level> (default: last track)"""
         if not self.initialized:
             print("Please initialize the mixer first with 'init'")
             return
 
-        parts = args.split()
-        if len(parts) < 2:
+        track_name, _, level = args.partition(" ")
+        level = level.lstrip().partition(" ")[0]
+        if not level:
+            # A lone argument is the level for the last track
+            track_name, level = self._last_track, track_name
+        if not track_name or not level:
             print("Usage: volume <track_name> <level> (0.0 to 1.0)")
             return
 
-        track_name = parts[0]
         try:
-            volume = float(parts[1])
+            volume = float(level)
             if self.mixer.set_track_volume(track_name, volume):
+                self._last_track = track_name
                 print(f"✓ Set volume for '{track_name}' to {volume:.2f}")
             else:
                 print(
@@ -171,19 +213,13 @@ class DJMixerCLI(cmd.Cmd):
 
         if not args:
             pos = self.mixer.get_crossfader()
-            print(
-                f"Current crossfader position: {pos:.2f} ({'LEFT' if pos < 0.3 else 'RIGHT' if pos > 0.7 else 'CENTER'})"
-            )
+            print(f"Current crossfader position: {pos:.2f} ({_crossfader_zone(pos)})")
             return
 
         try:
             position = float(args)
             if self.mixer.set_crossfader(position):
-                pos_desc = (
-                    "LEFT"
-                    if position < 0.3
-                    else "RIGHT" if position > 0.7 else "CENTER"
-                )
+                pos_desc = _crossfader_zone(position)
                 print(f"✓ Set crossfader to {position:.2f} ({pos_desc})")
             else:
                 print(f"✗ Failed to set crossfader (invalid position: {position:.2f})")
@@ -198,13 +234,12 @@ class DJMixerCLI(cmd.Cmd):
             print("Please initialize the mixer first with 'init'")
             return
 
-        parts = args.split()
-        if len(parts) < 2:
+        left_track, _, right_track = args.partition(" ")
+        right_track = right_track.lstrip().partition(" ")[0]
+        if not right_track:
             print("Usage: cross <left_track> <right_track>")
             return
 
-        left_track = parts[0]
-        right_track = parts[1]
         if self.mixer.apply_crossfader(left_track, right_track):
             pos = self.mixer.get_crossfader()
             print(
@@ -227,43 +262,46 @@ class DJMixerCLI(cmd.Cmd):
         print(f"Master Volume: {self.mixer.get_master_volume():.2f}")
         print(f"Crossfader: {self.mixer.get_crossfader():.2f}")
 
-        tracks = self.mixer.get_loaded_tracks()
-        if tracks:
+        # One call for every track's (volume, playing) pair
+        tracks = self.mixer.get_track_states()
+        if not tracks:
+            print("\nNo tracks loaded")
+        else:
             print(f"\nLoaded Tracks ({len(tracks)}):")
             print("-" * 30)
-            for track_name in tracks:
-                volume = self.mixer.get_track_volume(track_name)
-                playing = (
-                    "PLAYING" if self.mixer.is_track_playing(track_name) else "STOPPED"
-                )
-                print(f"  {track_name}: Vol={volume:.2f} [{playing}]")
-        else:
-            print("\nNo tracks loaded")
+            for track_name, (volume, playing) in tracks.items():
+                state = "PLAYING" if playing else "STOPPED"
+                print(f"  {track_name}: Vol={volume:.2f} [{state}]")
         print("═" * 50 + "\n")
 
     def do_list(self, args):
         """List audio files in current directory"""
-        audio_extensions = {".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a"}
-        current_dir = Path(".")
-
-        audio_files = []
-        for file_path in current_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in audio_extensions:
-                audio_files.append(file_path.name)
+        # Extension is folded to lower case once per entry, before the stat
+        with os.scandir(".") as entries:
+            audio_files = [
+                entry.name
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTS
+                and entry.is_file()
+            ]
+        audio_files.sort()
 
         if audio_files:
-            print(f"\nAudio files in current directory ({len(audio_files)}):")
-            print("-" * 40)
-            for i, filename in enumerate(sorted(audio_files), 1):
-                print(f"  {i:2d}. {filename}")
-            print()
+            lines = [
+                f"\nAudio files in current directory ({len(audio_files)}):",
+                "-" * 40,
+            ]
+            lines.extend(
+                f"  {i:2d}. {filename}" for i, filename in enumerate(audio_files, 1)
+            )
+            lines.append("")
+            print("\n".join(lines))
         else:
             print("No audio files found in current directory")
 
     def do_example(self, args):
         """Show example usage scenarios"""
-        print(
-            """
+        print("""
 Example Usage Scenarios:
 ═══════════════════════════
 
@@ -293,8 +331,7 @@ Example Usage Scenarios:
 
 5. Monitoring:
    DJ> status             # Show current state
-        """
-        )
+        """)
 
     def do_quit(self, args):
         """Quit the DJ mixer"""
@@ -5,13 +5,138 @@ Provides visual controls for all mixer functionality
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import threading
+from tkinter import ttk
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dj_mixer import DJMixer
 from ai_dj_assistant import AIDJAssistant
 
+# Slider-driven mixer calls run at most once per frame (~60 Hz)
+_THROTTLE_MS = 16
+
+# File dialog filters for loading tracks
+FILETYPES = (
+    ("Audio files", "*.mp3 *.wav *.ogg *.flac *.aac *.m4a"),
+    ("MP3 files", "*.mp3"),
+    ("WAV files", "*.wav"),
+    ("OGG files", "*.ogg"),
+    ("FLAC files", "*.flac"),
+    ("All files", "*.*"),
+)
+
+# Status pane rows as (key, caption); deck row keys are the deck names
+_DECK_ROWS = (("deck1", "DECK 1:"), ("deck2", "DECK 2:"))
+_STATUS_ROWS = (("master", "Master Volume:"), ("cross", "Crossfader:")) + _DECK_ROWS
+
+# Log entries held for the next idle flush; older ones are dropped first
+_LOG_QUEUE_MAX = 500
+
+
+def _messagebox():
+    """tkinter.messagebox, imported on first use rather than at startup"""
+    from tkinter import messagebox
+
+    return messagebox
+
+
+class DeckPanel(ttk.LabelFrame):
+    """Controls for one deck: track, transport buttons, volume and status
+
+    Button and slider callbacks are routed to the owning app's handlers so
+    subclasses such as the demo GUI can override them.
+    """
+
+    PADDING = 10
+
+    def __init__(self, parent, app, deck_name, title, file_var, status_var, vol_var):
+        super().__init__(parent, text=title, padding=self.PADDING)
+        self.app = app
+        self.deck_name = deck_name
+        self.file_var = file_var
+
+        # File display
+        file_frame = ttk.Frame(self)
+        file_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(file_frame, text="Track:").pack(anchor=tk.W)
+        file_label = ttk.Label(
+            file_frame,
+            textvariable=file_var,
+            background="white",
+            relief="sunken",
+            padding="5",
+        )
+        file_label.pack(fill=tk.X, pady=(2, 0))
+
+        # Load button
+        load_button = ttk.Button(self, text="Load Track", command=self.load)
+        load_button.pack(fill=tk.X, pady=(0, 10))
+
+        # Playback controls
+        control_frame = ttk.Frame(self)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+
+        play_button = ttk.Button(control_frame, text="Play", command=self.play)
+        play_button.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
+
+        pause_button = ttk.Button(control_frame, text="Pause", command=self.pause)
+        pause_button.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
+
+        stop_button = ttk.Button(control_frame, text="Stop", command=self.stop)
+        stop_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # Volume control
+        vol_frame = ttk.Frame(self)
+        vol_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(vol_frame, text="Volume:").pack(anchor=tk.W)
+        vol_scale = ttk.Scale(
+            vol_frame,
+            from_=0.0,
+            to=1.0,
+            variable=vol_var,
+        )
+        vol_scale.pack(fill=tk.X, pady=(2, 0))
+
+        self.vol_label = ttk.Label(vol_frame, text="1.00")
+        self.vol_label.pack(anchor=tk.W)
+
+        # The slider writes vol_var; that write is the only volume callback
+        self.vol_var = vol_var
+        vol_var.trace_add("write", self.on_volume)
+
+        # Status display
+        status_frame = ttk.Frame(self)
+        status_frame.pack(fill=tk.X)
+
+        ttk.Label(status_frame, text="Status:").pack(anchor=tk.W)
+        status_label = ttk.Label(
+            status_frame, textvariable=status_var, font=("Arial", 10, "bold")
+        )
+        status_label.pack(anchor=tk.W)
+
+    def load(self):
+        """Load a track into this deck"""
+        self.app.load_track(self.deck_name, self.file_var)
+
+    def play(self):
+        """Play this deck"""
+        self.app.play_track(self.deck_name)
+
+    def pause(self):
+        """Pause this deck"""
+        self.app.pause_track(self.deck_name)
+
+    def stop(self):
+        """Stop this deck"""
+        self.app.stop_track(self.deck_name)
+
+    def on_volume(self, *args):
+        """Volume variable written"""
+        self.app.on_deck_volume(self.deck_name, self.vol_var.get())
+
 
 class DJMixerGUI:
     """Main GUI application for the DJ Mixer"""
@@ -41,6 +166,43 @@ class DJMixerGUI:
         self.deck1_vol_var = tk.DoubleVar(value=1.0)
         self.deck2_vol_var = tk.DoubleVar(value=1.0)
 
+        # Per-deck variables, looked up by deck name
+        self._deck_file_vars = {"deck1": self.deck1_file, "deck2": self.deck2_file}
+        self._deck_status_vars = {
+            "deck1": self.deck1_status,
+            "deck2": self.deck2_status,
+        }
+        self._deck_vol_vars = {"deck1": self.deck1_vol_var, "deck2": self.deck2_vol_var}
+
+        # File-open dialog, created by _open_dialog on first use
+        self._file_dialog = None
+
+        # DeckPanel widgets by deck name, created in setup_ui
+        self.decks = {}
+        # Set while _show_deck_volume moves a slider for display only
+        self._showing_volume = False
+
+        # Last value written through _set_if_changed/_set_label_text, keyed
+        # by the Tk name of the variable or widget
+        self._shown = {}
+
+        # Set while a status refresh is queued with after_idle, along with
+        # the mixer snapshot it should use (None: read the mixer then)
+        self._status_update_pending = False
+        self._pending_snapshot = None
+
+        # Log entries waiting for the next idle flush
+        self._log_queue = deque(maxlen=_LOG_QUEUE_MAX)
+        self._log_flush_pending = False
+
+        # Single worker that reads and formats the status for the tick
+        self._status_executor = ThreadPoolExecutor(max_workers=1)
+        self._status_future = None
+        self._closing = False
+
+        # Latest (fn, args) per throttle key, waiting for its after() slot
+        self._throttled = {}
+
         # AI variables
         self.gemini_api_key = tk.StringVar()
         self.ai_status_var = tk.StringVar(value="AI: Not configured")
@@ -94,26 +256,20 @@ class DJMixerGUI:
         self.create_ai_section(main_frame, 2, 0)
 
         # Create deck sections (moved down)
-        self.create_deck_section(
-            main_frame,
-            "DECK 1",
-            3,
-            0,
-            self.deck1_file,
-            self.deck1_status,
-            self.deck1_vol_var,
-            "deck1",
-        )
-        self.create_deck_section(
-            main_frame,
-            "DECK 2",
-            3,
-            2,
-            self.deck2_file,
-            self.deck2_status,
-            self.deck2_vol_var,
-            "deck2",
-        )
+        for deck_name, title, col in (("deck1", "DECK 1", 0), ("deck2", "DECK 2", 2)):
+            deck = DeckPanel(
+                main_frame,
+                self,
+                deck_name,
+                title,
+                self._deck_file_vars[deck_name],
+                self._deck_status_vars[deck_name],
+                self._deck_vol_vars[deck_name],
+            )
+            deck.grid(
+                row=3, column=col, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S)
+            )
+            self.decks[deck_name] = deck
 
         # Create crossfader section (moved down)
         self.create_crossfader_section(main_frame, 3, 1)
@@ -124,90 +280,6 @@ class DJMixerGUI:
         # Create status display (moved down)
         self.create_status_section(main_frame, 5, 0)
 
-    def create_deck_section(
-        self, parent, title, row, col, file_var, status_var, vol_var, deck_name
-    ):
-        """Create a deck control section"""
-        # Main deck frame
-        deck_frame = ttk.LabelFrame(parent, text=title, padding="10")
-        deck_frame.grid(
-            row=row, column=col, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S)
-        )
-
-        # File display
-        file_frame = ttk.Frame(deck_frame)
-        file_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(file_frame, text="Track:").pack(anchor=tk.W)
-        file_label = ttk.Label(
-            file_frame,
-            textvariable=file_var,
-            background="white",
-            relief="sunken",
-            padding="5",
-        )
-        file_label.pack(fill=tk.X, pady=(2, 0))
-
-        # Load button
-        load_button = ttk.Button(
-            deck_frame,
-            text="Load Track",
-            command=lambda: self.load_track(deck_name, file_var),
-        )
-        load_button.pack(fill=tk.X, pady=(0, 10))
-
-        # Playback controls
-        control_frame = ttk.Frame(deck_frame)
-        control_frame.pack(fill=tk.X, pady=(0, 10))
-
-        play_button = ttk.Button(
-            control_frame, text="Play", command=lambda: self.play_track(deck_name)
-        )
-        play_button.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
-
-        pause_button = ttk.Button(
-            control_frame, text="Pause", command=lambda: self.pause_track(deck_name)
-        )
-        pause_button.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
-
-        stop_button = ttk.Button(
-            control_frame, text="Stop", command=lambda: self.stop_track(deck_name)
-        )
-        stop_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        # Volume control
-        vol_frame = ttk.Frame(deck_frame)
-        vol_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(vol_frame, text="Volume:").pack(anchor=tk.W)
-        vol_scale = ttk.Scale(
-            vol_frame,
-            from_=0.0,
-            to=1.0,
-            variable=vol_var,
-            command=lambda v: self.set_track_volume(deck_name, float(v)),
-        )
-        vol_scale.pack(fill=tk.X, pady=(2, 0))
-
-        vol_label = ttk.Label(vol_frame, text="1.00")
-        vol_label.pack(anchor=tk.W)
-
-        # Update volume label when scale changes
-        def update_vol_label(var, label):
-            label.config(text=f"{var.get():.2f}")
-
-        vol_var.trace("w", lambda *args: update_vol_label(vol_var, vol_label))
-
-        # Status display
-        status_frame = ttk.Frame(deck_frame)
-        status_frame.pack(fill=tk.X)
-
-        ttk.Label(status_frame, text="Status:").pack(anchor=tk.W)
-        status_label = ttk.Label(
-            status_frame, textvariable=status_var, font=("Arial", 10, "bold")
-        )
-        status_label.pack(anchor=tk.W)
-
     def create_crossfader_section(self, parent, row, col):
         """Create crossfader control section"""
         cross_frame = ttk.LabelFrame(parent, text="CROSSFADER", padding="10")
@@ -276,19 +348,14 @@ class DJMixerGUI:
             to=1.0,
             variable=self.master_vol_var,
             orient=tk.HORIZONTAL,
-            command=self.set_master_volume,
         )
         master_scale.pack(fill=tk.X, pady=(2, 0))
 
         self.master_vol_label = ttk.Label(vol_frame, text="1.00")
         self.master_vol_label.pack(anchor=tk.W)
 
-        # Update master volume label
-        self.master_vol_var.trace(
-            "w",
-            lambda *args: self.master_vol_label.config(
-                text=f"{self.master_vol_var.get():.2f}"
-            ),
+        self.master_vol_var.trace_add(
+            "write", lambda *args: self.on_master_volume(self.master_vol_var.get())
         )
 
     def create_ai_section(self, parent, row, col):
@@ -387,14 +454,8 @@ class DJMixerGUI:
 
         def ai_volume_callback(deck, volume):
             """AI callback to update volume"""
-            if deck == "deck1":
-                self.deck1_vol_var.set(volume)
-                if self.initialized:
-                    self.mixer.set_track_volume("deck1", volume)
-            elif deck == "deck2":
-                self.deck2_vol_var.set(volume)
-                if self.initialized:
-                    self.mixer.set_track_volume("deck2", volume)
+            if deck in self._deck_vol_vars:
+                self._deck_vol_vars[deck].set(volume)
 
         # Register callbacks with AI assistant
         self.ai_assistant.register_callback("crossfader_change", ai_crossfader_callback)
@@ -404,7 +465,7 @@ class DJMixerGUI:
         """Configure the AI assistant with the API key"""
         api_key = self.gemini_api_key.get().strip()
         if not api_key:
-            messagebox.showwarning("Warning", "Please enter a Gemini API key")
+            _messagebox().showwarning("Warning", "Please enter a Gemini API key")
             return
 
         success = self.ai_assistant.configure_gemini(api_key)
@@ -416,19 +477,23 @@ class DJMixerGUI:
             )
         else:
             self.ai_status_var.set("AI: Configuration failed ✗")
-            messagebox.showerror("Error", "Failed to configure AI. Check your API key.")
+            _messagebox().showerror(
+                "Error", "Failed to configure AI. Check your API key."
+            )
             self.log_message("✗ AI Assistant configuration failed")
 
     def start_auto_mix(self):
         """Start AI auto mixing"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         # Check if both decks have tracks
         loaded_tracks = self.mixer.get_loaded_tracks()
         if "deck1" not in loaded_tracks or "deck2" not in loaded_tracks:
-            messagebox.showwarning("Warning", "Please load tracks on both decks first")
+            _messagebox().showwarning(
+                "Warning", "Please load tracks on both decks first"
+            )
             return
 
         self.auto_mix_active.set(True)
@@ -455,12 +520,12 @@ class DJMixerGUI:
     def analyze_track_keys(self):
         """Analyze the keys of loaded tracks"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         loaded_tracks = self.mixer.get_loaded_tracks()
         if not loaded_tracks:
-            messagebox.showwarning("Warning", "Please load some tracks first")
+            _messagebox().showwarning("Warning", "Please load some tracks first")
             return
 
         self.log_message("🎼 Analyzing track keys...")
@@ -486,12 +551,14 @@ class DJMixerGUI:
     def get_key_mixing_advice(self):
         """Get AI advice for key mixing"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         loaded_tracks = self.mixer.get_loaded_tracks()
         if "deck1" not in loaded_tracks or "deck2" not in loaded_tracks:
-            messagebox.showwarning("Warning", "Please load tracks on both decks first")
+            _messagebox().showwarning(
+                "Warning", "Please load tracks on both decks first"
+            )
             return
 
         advice = self.ai_assistant.get_key_mixing_advice("deck1", "deck2")
@@ -513,7 +580,7 @@ Compatibility: {advice['compatibility']}
     def suggest_fader_effects(self):
         """Get AI suggestions for fader effects"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         # Get current energy levels
@@ -521,7 +588,7 @@ Compatibility: {advice['compatibility']}
         deck2_analysis = self.ai_assistant.track_analyses.get("deck2")
 
         if not deck1_analysis or not deck2_analysis:
-            messagebox.showinfo(
+            _messagebox().showinfo(
                 "Info", "Please analyze track keys first to get energy levels"
             )
             return
@@ -545,21 +612,23 @@ Optimal Speed: {effects_advice['optimal_speed']}
     def apply_ai_effects(self):
         """Apply AI-suggested effects"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         # Get AI mixing advice and apply it
         loaded_tracks = self.mixer.get_loaded_tracks()
         if "deck1" not in loaded_tracks or "deck2" not in loaded_tracks:
-            messagebox.showwarning("Warning", "Please load tracks on both decks first")
+            _messagebox().showwarning(
+                "Warning", "Please load tracks on both decks first"
+            )
             return
 
         advice = self.ai_assistant.get_auto_mixing_advice("deck1", "deck2")
 
         # Apply the advice
         self.crossfader_var.set(advice.crossfader_position)
-        self.deck1_vol_var.set(advice.deck1_volume)
-        self.deck2_vol_var.set(advice.deck2_volume)
+        self._show_deck_volume("deck1", advice.deck1_volume)
+        self._show_deck_volume("deck2", advice.deck2_volume)
 
         if self.initialized:
             self.mixer.set_crossfader(advice.crossfader_position)
@@ -595,18 +664,36 @@ Transition: {advice.transition_duration:.1f}s
             row=row, column=col, columnspan=3, padx=5, pady=5, sticky=(tk.W, tk.E)
         )
 
-        # Create text widget for status display
-        self.status_text = tk.Text(
-            status_frame, height=8, width=80, state=tk.DISABLED, wrap=tk.WORD
+        # Fixed status pane: one label per value, bound to a StringVar
+        self.status_pane = ttk.Frame(status_frame)
+        self.status_pane.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
+
+        ttk.Label(
+            self.status_pane, text="DJ MIXER STATUS", font=("Arial", 10, "bold")
+        ).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+        self._status_vars = {}
+        for row, (key, caption) in enumerate(_STATUS_ROWS, 1):
+            var = tk.StringVar(value="-")
+            ttk.Label(self.status_pane, text=caption).grid(
+                row=row, column=0, sticky=tk.W, padx=(0, 10)
+            )
+            ttk.Label(self.status_pane, textvariable=var, width=20).grid(
+                row=row, column=1, sticky=tk.W
+            )
+            self._status_vars[key] = var
+
+        # Scrolling log pane, appended to by log_message
+        self.log_pane = tk.Text(
+            status_frame, height=10, width=60, state=tk.DISABLED, wrap=tk.WORD
         )
-        self.status_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.log_pane.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Scrollbar for status text
+        # Scrollbar for the log
         scrollbar = ttk.Scrollbar(
-            status_frame, orient=tk.VERTICAL, command=self.status_text.yview
+            status_frame, orient=tk.VERTICAL, command=self.log_pane.yview
         )
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.status_text.config(yscrollcommand=scrollbar.set)
+        self.log_pane.config(yscrollcommand=scrollbar.set)
 
         self.update_status_display()
 
@@ -614,6 +701,7 @@ Transition: {advice.transition_duration:.1f}s
         """Initialize the DJ mixer"""
         if self.mixer.initialize():
             self.initialized = True
+            self.mixer.add_listener("track_state", self._on_track_state)
             self.status_label.config(
                 text="Mixer initialized successfully", foreground="green"
             )
@@ -622,27 +710,23 @@ Transition: {advice.transition_duration:.1f}s
             devices = self.mixer.get_audio_devices()
             self.log_message(f"Available devices: {', '.join(devices)}")
         else:
-            messagebox.showerror("Error", "Failed to initialize DJ Mixer")
+            _messagebox().showerror("Error", "Failed to initialize DJ Mixer")
             self.log_message("✗ Failed to initialize DJ Mixer")
 
     def load_track(self, deck_name, file_var):
         """Load a track into a deck"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
-        filetypes = [
-            ("Audio files", "*.mp3 *.wav *.ogg *.flac *.aac *.m4a"),
-            ("MP3 files", "*.mp3"),
-            ("WAV files", "*.wav"),
-            ("OGG files", "*.ogg"),
-            ("FLAC files", "*.flac"),
-            ("All files", "*.*"),
-        ]
-
-        filename = filedialog.askopenfilename(
-            title=f"Load track for {deck_name.upper()}", filetypes=filetypes
-        )
+        # The dialog is modal; don't run status ticks while it is open
+        self.root.after_cancel(self._tick_id)
+        try:
+            filename = self._open_dialog().show(
+                title=f"Load track for {deck_name.upper()}"
+            )
+        finally:
+            self._tick_id = self.root.after(1000, self._tick)
 
         if filename:
             if self.mixer.load_track(deck_name, filename):
@@ -657,21 +741,29 @@ Transition: {advice.transition_duration:.1f}s
                         f"🤖 AI analysis completed for {deck_name.upper()}"
                     )
             else:
-                messagebox.showerror(
+                _messagebox().showerror(
                     "Error", f"Failed to load track into {deck_name.upper()}"
                 )
                 self.log_message(f"✗ Failed to load track into {deck_name.upper()}")
 
+    def _open_dialog(self):
+        """Reusable file-open dialog, created on the first Load click"""
+        if self._file_dialog is None:
+            from tkinter import filedialog
+
+            self._file_dialog = filedialog.Open(self.root, filetypes=FILETYPES)
+        return self._file_dialog
+
     def play_track(self, deck_name):
         """Play a track"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         if self.mixer.play_track(deck_name):
             self.log_message(f"✓ Playing {deck_name.upper()}")
         else:
-            messagebox.showwarning(
+            _messagebox().showwarning(
                 "Warning", f"Cannot play {deck_name.upper()} - track not loaded"
             )
 
@@ -691,19 +783,73 @@ Transition: {advice.transition_duration:.1f}s
         self.mixer.stop_track(deck_name)
         self.log_message(f"⏹ Stopped {deck_name.upper()}")
 
+    def _set_if_changed(self, var, value):
+        """Set a Tk variable unless the GUI last set it to the same value
+
+        The comparison uses the locally cached value, so no Tcl round trip
+        is made; write through this method to keep the cache accurate.
+        """
+        key = str(var)
+        if key not in self._shown or self._shown[key] != value:
+            self._shown[key] = value
+            var.set(value)
+
+    def _set_label_text(self, label, text):
+        """Configure a label's text only when it differs from the last one"""
+        key = str(label)
+        if self._shown.get(key) != text:
+            self._shown[key] = text
+            label.config(text=text)
+
+    def _throttle(self, key, fn, *args):
+        """Call fn(*args) after _THROTTLE_MS; later calls for key replace it"""
+        pending = key in self._throttled
+        self._throttled[key] = (fn, args)
+        if not pending:
+            self.root.after(_THROTTLE_MS, self._run_throttled, key)
+
+    def _run_throttled(self, key):
+        """Make the latest call queued for key"""
+        fn, args = self._throttled.pop(key)
+        fn(*args)
+        self.request_status_update()
+
+    def on_deck_volume(self, deck_name, value):
+        """Deck volume changed: update the readout and the mixer"""
+        volume = float(value)
+        self._set_label_text(self.decks[deck_name].vol_label, f"{volume:.2f}")
+        if not self._showing_volume:
+            self.set_track_volume(deck_name, volume)
+
+    def on_master_volume(self, value):
+        """Master volume changed: update the readout and the mixer"""
+        volume = float(value)
+        self._set_label_text(self.master_vol_label, f"{volume:.2f}")
+        self.set_master_volume(volume)
+
+    def _show_deck_volume(self, deck_name, volume):
+        """Move a deck's volume slider and readout without touching the mixer"""
+        self._showing_volume = True
+        try:
+            self._deck_vol_vars[deck_name].set(volume)
+        finally:
+            self._showing_volume = False
+
     def set_track_volume(self, deck_name, volume):
         """Set track volume"""
         if not self.initialized:
             return
 
-        self.mixer.set_track_volume(deck_name, volume)
+        self._throttle(
+            ("volume", deck_name), self.mixer.set_track_volume, deck_name, volume
+        )
 
     def set_master_volume(self, volume):
         """Set master volume"""
         if not self.initialized:
             return
 
-        self.mixer.set_master_volume(float(volume))
+        self._throttle("master", self.mixer.set_master_volume, float(volume))
 
     def update_crossfader(self, value):
         """Update crossfader position display"""
@@ -715,96 +861,175 @@ Transition: {advice.transition_duration:.1f}s
         else:
             desc = "CENTER"
 
-        self.cross_pos_label.config(text=f"{pos:.2f} ({desc})")
+        self._set_label_text(self.cross_pos_label, f"{pos:.2f} ({desc})")
 
         if self.initialized:
-            self.mixer.set_crossfader(pos)
+            self._throttle("cross", self.mixer.set_crossfader, pos)
 
     def apply_crossfader(self):
         """Apply crossfader between deck1 and deck2"""
         if not self.initialized:
-            messagebox.showwarning("Warning", "Please initialize the mixer first")
+            _messagebox().showwarning("Warning", "Please initialize the mixer first")
             return
 
         self.mixer.apply_crossfader("deck1", "deck2")
         pos = self.mixer.get_crossfader()
         self.log_message(f"Applied crossfader at position {pos:.2f}")
 
-    def update_status_display(self):
-        """Update the status display"""
+    def _snapshot(self):
+        """Read the mixer state shown by the status displays in one pass"""
+        return {
+            "master": self.mixer.get_master_volume(),
+            "cross": self.mixer.get_crossfader(),
+            "tracks": self.mixer.get_track_states(),
+        }
+
+    def request_status_update(self, snapshot=None):
+        """Refresh the status block on the next idle, once per event burst
+
+        A snapshot already taken by the caller is reused; otherwise the
+        refresh reads the mixer itself.
+        """
+        self._pending_snapshot = snapshot
+        if not self._status_update_pending:
+            self._status_update_pending = True
+            self.root.after_idle(self._do_status_update)
+
+    def _do_status_update(self):
+        """Run the status refresh queued by request_status_update"""
+        self._status_update_pending = False
+        snapshot, self._pending_snapshot = self._pending_snapshot, None
+        if self._visible:
+            self.update_status_display(snapshot)
+
+    def update_status_display(self, snapshot=None):
+        """Update the status pane"""
         if not self.initialized:
             return
+        if snapshot is None:
+            snapshot = self._snapshot()
+        self._apply_status(self._format_status(snapshot))
+
+    @staticmethod
+    def _format_status(snapshot):
+        """Render a mixer snapshot as {status row key: text}"""
+        status = {
+            "master": f"{snapshot['master']:.2f}",
+            "cross": f"{snapshot['cross']:.2f}",
+        }
+        tracks = snapshot["tracks"]
+        for key, _ in _DECK_ROWS:
+            if key in tracks:
+                volume, playing = tracks[key]
+                state = "PLAYING" if playing else "STOPPED"
+                status[key] = f"Vol={volume:.2f} [{state}]"
+            else:
+                status[key] = "No track loaded"
+        return status
 
-        # Clear current status
-        self.status_text.config(state=tk.NORMAL)
-        self.status_text.delete(1.0, tk.END)
-
-        # Add current status
-        status_lines = []
-        status_lines.append("═" * 50)
-        status_lines.append("DJ MIXER STATUS")
-        status_lines.append("═" * 50)
-        status_lines.append(f"Master Volume: {self.mixer.get_master_volume():.2f}")
-        status_lines.append(f"Crossfader: {self.mixer.get_crossfader():.2f}")
-
-        tracks = self.mixer.get_loaded_tracks()
-        if tracks:
-            status_lines.append(f"\nLoaded Tracks ({len(tracks)}):")
-            status_lines.append("-" * 30)
-            for track_name in tracks:
-                volume = self.mixer.get_track_volume(track_name)
-                playing = (
-                    "PLAYING" if self.mixer.is_track_playing(track_name) else "STOPPED"
-                )
-                status_lines.append(f"  {track_name}: Vol={volume:.2f} [{playing}]")
-        else:
-            status_lines.append("\nNo tracks loaded")
+    def _apply_status(self, status):
+        """Show formatted status, setting only the labels that changed"""
+        for key, text in status.items():
+            self._set_if_changed(self._status_vars[key], text)
+
+    def start_status_updater(self):
+        """Schedule the periodic status refresh on the Tk event loop"""
+        # Status work is skipped while the window is minimized or withdrawn
+        self._visible = True
+        self.root.bind("<Map>", self._on_map, add="+")
+        self.root.bind("<Unmap>", self._on_unmap, add="+")
+        self._tick_id = self.root.after(1000, self._tick)
+
+    def _on_map(self, event):
+        """Window shown again: resume status updates"""
+        # Bindings on the root also fire for its child widgets
+        if event.widget is self.root and not self._visible:
+            self._visible = True
+            self.request_status_update()
+
+    def _on_unmap(self, event):
+        """Window minimized or withdrawn: pause status updates"""
+        if event.widget is self.root:
+            self._visible = False
+
+    def _tick(self):
+        """Refresh the status once a second
+
+        Play/stop/pause changes are pushed through the mixer listener; the
+        tick catches tracks that end on their own and the master section.
+        """
+        future = self._status_future
+        if self.initialized and self._visible and (future is None or future.done()):
+            # Read and format in the worker; only the widget update runs here
+            future = self._status_executor.submit(self._snapshot_and_format)
+            future.add_done_callback(self._on_status_formatted)
+            self._status_future = future
+        self._tick_id = self.root.after(1000, self._tick)
+
+    def _snapshot_and_format(self):
+        """Worker: take a mixer snapshot and render the status text"""
+        snapshot = self._snapshot()
+        return snapshot, self._format_status(snapshot)
+
+    def _on_status_formatted(self, future):
+        """Worker done callback: hand the result to the Tk thread"""
+        if self._closing:
+            # run() is waiting on the executor and mainloop has exited
+            return
+        try:
+            self.root.after(0, self._apply_status_future, future)
+        except (tk.TclError, RuntimeError):
+            # GUI has been destroyed
+            pass
 
-        status_lines.append("═" * 50)
+    def _apply_status_future(self, future):
+        """Apply a worker's snapshot and status text on the Tk thread"""
+        try:
+            snapshot, status = future.result()
+        except Exception as e:
+            # Skip this tick; the next one takes a fresh snapshot
+            print(f"Status update failed: {e}")
+            return
+        if self.initialized:
+            self.update_track_status(snapshot)
+            self._apply_status(status)
 
-        self.status_text.insert(tk.END, "\n".join(status_lines))
-        self.status_text.config(state=tk.DISABLED)
+    def _on_track_state(self, deck_name, playing):
+        """Mixer listener: reflect a deck's play state immediately"""
+        status_var = self._deck_status_vars.get(deck_name)
+        if status_var is not None:
+            self._set_if_changed(status_var, "PLAYING" if playing else "STOPPED")
+        self.request_status_update()
 
-    def start_status_updater(self):
-        """Start background thread for status updates"""
-
-        def update_loop():
-            while True:
-                if self.initialized:
-                    # Update track status
-                    try:
-                        self.root.after(0, self.update_track_status)
-                        self.root.after(0, self.update_status_display)
-                    except (tk.TclError, RuntimeError):
-                        # GUI has been destroyed, stop updating
-                        break
-                time.sleep(1)  # Update every second
-
-        update_thread = threading.Thread(target=update_loop, daemon=True)
-        update_thread.start()
-
-    def update_track_status(self):
+    def update_track_status(self, snapshot=None):
         """Update track playing status"""
         if self.initialized:
-            if self.mixer.is_track_playing("deck1"):
-                self.deck1_status.set("PLAYING")
-            else:
-                self.deck1_status.set("STOPPED")
-
-            if self.mixer.is_track_playing("deck2"):
-                self.deck2_status.set("PLAYING")
-            else:
-                self.deck2_status.set("STOPPED")
+            if snapshot is None:
+                snapshot = self._snapshot()
+            tracks = snapshot["tracks"]
+            for deck_name, status_var in self._deck_status_vars.items():
+                playing = deck_name in tracks and tracks[deck_name][1]
+                self._set_if_changed(status_var, "PLAYING" if playing else "STOPPED")
 
     def log_message(self, message):
-        """Add a message to the status log"""
+        """Queue a message for the status log, written on the next idle"""
         timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Write all queued log messages in a single widget update"""
+        self._log_flush_pending = False
+        if not self._log_queue:
+            return
 
-        self.status_text.config(state=tk.NORMAL)
-        self.status_text.insert(tk.END, log_entry)
-        self.status_text.see(tk.END)
-        self.status_text.config(state=tk.DISABLED)
+        self.log_pane.config(state=tk.NORMAL)
+        self.log_pane.insert(tk.END, "".join(self._log_queue))
+        self.log_pane.see(tk.END)
+        self.log_pane.config(state=tk.DISABLED)
+        self._log_queue.clear()
 
     def run(self):
         """Start the GUI application"""
@@ -813,6 +1038,8 @@ Transition: {advice.transition_duration:.1f}s
             self.log_message("Click 'Initialize Mixer' to begin")
             self.root.mainloop()
         finally:
+            self._closing = True
+            self._status_executor.shutdown(wait=True, cancel_futures=True)
             if self.initialized:
                 self.mixer.cleanup()
 
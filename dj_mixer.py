@@ -5,7 +5,7 @@ Supports loading audio files and mixing them across different output devices
 """
 
 import pygame
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -107,6 +107,24 @@ class DJMixer:
         self.crossfader_position = 0.5  # 0.0 = full left, 1.0 = full right
         self.master_volume = 1.0
         self.is_initialized = False
+        # Callbacks by event name: "track_state" (name, playing) and
+        # "track_volume" (name, volume)
+        self._listeners: Dict[str, List[Callable]] = {}
+
+    def add_listener(self, event: str, callback: Callable) -> None:
+        """Call callback whenever the mixer emits event"""
+        self._listeners.setdefault(event, []).append(callback)
+
+    def remove_listener(self, event: str, callback: Callable) -> None:
+        """Stop calling callback for event"""
+        callbacks = self._listeners.get(event)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def _emit(self, event: str, *args) -> None:
+        """Notify the listeners registered for event"""
+        for callback in self._listeners.get(event, ()):
+            callback(*args)
 
     def initialize(self) -> bool:
         """Initialize pygame mixer"""
@@ -150,13 +168,17 @@ class DJMixer:
         if name not in self.tracks:
             print(f"Track '{name}' not found")
             return False
-        return self.tracks[name].play(loops, fade_ms)
+        if not self.tracks[name].play(loops, fade_ms):
+            return False
+        self._emit("track_state", name, True)
+        return True
 
     def stop_track(self, name: str, fade_ms: int = 0) -> bool:
         """Stop a track"""
         if name not in self.tracks:
             return False
         self.tracks[name].stop(fade_ms)
+        self._emit("track_state", name, False)
         return True
 
     def pause_track(self, name: str) -> bool:
@@ -164,6 +186,7 @@ class DJMixer:
         if name not in self.tracks:
             return False
         self.tracks[name].pause()
+        self._emit("track_state", name, False)
         return True
 
     def unpause_track(self, name: str) -> bool:
@@ -171,6 +194,7 @@ class DJMixer:
         if name not in self.tracks:
             return False
         self.tracks[name].unpause()
+        self._emit("track_state", name, True)
         return True
 
     def set_track_volume(self, name: str, volume: float) -> bool:
@@ -180,6 +204,7 @@ class DJMixer:
         if volume < 0.0 or volume > 1.0:
             return False
         self.tracks[name].set_volume(volume)
+        self._emit("track_volume", name, volume)
         return True
 
     def get_track_volume(self, name: str) -> float:
@@ -232,6 +257,15 @@ class DJMixer:
         """Get list of loaded track names"""
         return list(self.tracks.keys())
 
+    def get_track_states(self) -> Dict[str, Tuple[float, bool]]:
+        """Get {track_name: (volume, playing)} for all loaded tracks"""
+        # Copy the items first: the GUI calls this from a worker thread while
+        # the Tk thread may load or unload tracks
+        return {
+            name: (track.get_volume(), track.is_track_playing())
+            for name, track in list(self.tracks.items())
+        }
+
     def cleanup(self) -> None:
         """Clean up resources"""
         for track in self.tracks.values():
@@ -5,7 +5,10 @@ Enhanced DJ Mixer with all advanced features.
 Integrates audio effects, beat detection, MIDI, recording, and more
 """
 
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from dj_mixer import DJMixer, AudioTrack
 from audio_effects import AudioEffects
@@ -88,6 +91,10 @@ class EnhancedDJMixer(DJMixer):
         self.use_asio = use_asio
         self.pyaudio_mixer: Optional[PyAudioMixer] = None
 
+        # Device lists are enumerated once; see refresh_devices()
+        self._audio_devices: Optional[List] = None
+        self._asio_devices: Optional[List] = None
+
         # Advanced features
         self.beat_detector = BeatDetector(sample_rate=frequency)
         self.auto_sync = AutoSync()
@@ -105,6 +112,9 @@ class EnhancedDJMixer(DJMixer):
         # Effects enabled flag
         self.effects_enabled = False
 
+        # Last (timestamp, status) built by get_mixer_status, replaced whole
+        self._status_snapshot: Optional[Tuple[float, dict]] = None
+
     def initialize(self, device_index: Optional[int] = None) -> bool:
         """
         Initialize the mixer (PyAudio or pygame based on configuration)
@@ -112,6 +122,9 @@ class EnhancedDJMixer(DJMixer):
         Args:
             device_index: Specific device index to use (for PyAudio mode)
         """
+        self._audio_devices = None
+        self._asio_devices = None
+
         if self.use_pyaudio:
             # Use PyAudio mixer
             self.pyaudio_mixer = PyAudioMixer(
@@ -187,7 +200,7 @@ class EnhancedDJMixer(DJMixer):
         BEAT_INTERVAL = 60.0 / MOCK_BPM  # 0.46875 seconds per beat
 
         # Generate mock beat positions
-        mock_beat_positions = [i * BEAT_INTERVAL for i in range(8)]
+        mock_beat_positions = np.arange(8) * BEAT_INTERVAL
 
         beat_info = BeatInfo(
             bpm=MOCK_BPM,
@@ -387,35 +400,50 @@ class EnhancedDJMixer(DJMixer):
     def play_track(self, name: str, loops: int = 0, fade_ms: int = 0) -> bool:
         """Play a loaded track (supports both PyAudio and pygame)"""
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.play_track(name, loops)
+            if not self.pyaudio_mixer.play_track(name, loops):
+                return False
+            self._emit("track_state", name, True)
+            return True
         else:
             return super().play_track(name, loops, fade_ms)
 
     def stop_track(self, name: str, fade_ms: int = 0) -> bool:
         """Stop a track (supports both PyAudio and pygame)"""
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.stop_track(name)
+            if not self.pyaudio_mixer.stop_track(name):
+                return False
+            self._emit("track_state", name, False)
+            return True
         else:
             return super().stop_track(name, fade_ms)
 
     def pause_track(self, name: str) -> bool:
         """Pause a track (supports both PyAudio and pygame)"""
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.pause_track(name)
+            if not self.pyaudio_mixer.pause_track(name):
+                return False
+            self._emit("track_state", name, False)
+            return True
         else:
             return super().pause_track(name)
 
     def unpause_track(self, name: str) -> bool:
         """Unpause a track (supports both PyAudio and pygame)"""
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.unpause_track(name)
+            if not self.pyaudio_mixer.unpause_track(name):
+                return False
+            self._emit("track_state", name, True)
+            return True
         else:
             return super().unpause_track(name)
 
     def set_track_volume(self, name: str, volume: float) -> bool:
         """Set track volume (supports both PyAudio and pygame)"""
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.set_track_volume(name, volume)
+            if not self.pyaudio_mixer.set_track_volume(name, volume):
+                return False
+            self._emit("track_volume", name, volume)
+            return True
         else:
             return super().set_track_volume(name, volume)
 
@@ -468,19 +496,75 @@ class EnhancedDJMixer(DJMixer):
         else:
             return super().get_loaded_tracks()
 
-    def get_audio_devices(self) -> List:
-        """Get available audio devices (supports both PyAudio and pygame)"""
+    def get_track_states(self) -> Dict[str, Tuple[float, bool]]:
+        """Get {track_name: (volume, playing)} (supports both PyAudio and pygame)"""
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.get_audio_devices()
+            with self.pyaudio_mixer.lock:
+                return {
+                    name: (track.volume, track.is_playing)
+                    for name, track in self.pyaudio_mixer.tracks.items()
+                }
         else:
-            return super().get_audio_devices()
+            return super().get_track_states()
+
+    def get_audio_devices(self) -> List:
+        """Get available audio devices (supports both PyAudio and pygame)"""
+        if self._audio_devices is None:
+            if self.use_pyaudio and self.pyaudio_mixer:
+                self._audio_devices = self.pyaudio_mixer.get_audio_devices()
+            else:
+                self._audio_devices = super().get_audio_devices()
+        return list(self._audio_devices)
 
     def get_asio_devices(self) -> List:
         """Get ASIO-compatible audio devices (PyAudio only)"""
+        if self._asio_devices is None:
+            if self.use_pyaudio and self.pyaudio_mixer:
+                self._asio_devices = self.pyaudio_mixer.get_asio_devices()
+            else:
+                self._asio_devices = []
+        return list(self._asio_devices)
+
+    def refresh_devices(self) -> None:
+        """Re-enumerate audio devices on the next device query"""
+        self._audio_devices = None
+        self._asio_devices = None
         if self.use_pyaudio and self.pyaudio_mixer:
-            return self.pyaudio_mixer.get_asio_devices()
-        else:
-            return []
+            self.pyaudio_mixer.device_manager.refresh_devices()
+
+    def reset_state(self) -> None:
+        """
+        Return to a freshly initialized state without closing the audio output
+
+        Stops and unloads all tracks and resets volumes, effects, MIDI,
+        recording and playlists so one initialized mixer can be reused.
+        """
+        for name in self.get_loaded_tracks():
+            self.stop_track(name)
+        self.tracks.clear()
+        if self.use_pyaudio and self.pyaudio_mixer:
+            with self.pyaudio_mixer.lock:
+                self.pyaudio_mixer.tracks.clear()
+
+        self.crossfader_position = 0.5
+        self.master_volume = 1.0
+        if self.is_initialized:
+            self.set_crossfader(0.5)
+            self.set_master_volume(1.0)
+
+        if self.recorder.is_recording:
+            self.recorder.stop_recording()
+        self.recorder = AudioRecorder()
+
+        if self.midi_enabled:
+            self.midi_controller.disconnect()
+        self.midi_controller = MockMIDIController()
+        self.midi_enabled = False
+
+        self.playlist_manager = PlaylistManager()
+        self.beat_info.clear()
+        self.effects_enabled = False
+        self._status_snapshot = None
 
     def cleanup(self) -> None:
         """Cleanup mixer resources (supports both PyAudio and pygame)"""
@@ -489,13 +573,34 @@ class EnhancedDJMixer(DJMixer):
         else:
             super().cleanup()
 
-    def get_mixer_status(self) -> dict:
-        """Get comprehensive mixer status"""
+    def get_mixer_status(self, max_age: float = 0.0) -> dict:
+        """
+        Get comprehensive mixer status
+
+        Args:
+            max_age: Reuse the last snapshot if it is younger than this many
+                seconds (for pollers); the snapshot is shared, so treat it
+                as read-only
+
+        Returns:
+            Status dictionary
+        """
+        snapshot = self._status_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < max_age:
+            return snapshot[1]
+
+        status = self._build_mixer_status()
+        self._status_snapshot = (time.monotonic(), status)
+        return status
+
+    def _build_mixer_status(self) -> dict:
+        """Build a fresh mixer status dictionary"""
+        loaded_tracks = self.get_loaded_tracks()
         status = {
             "initialized": self.is_initialized,
             "master_volume": self.get_master_volume(),
             "crossfader": self.get_crossfader(),
-            "loaded_tracks": self.get_loaded_tracks(),
+            "loaded_tracks": loaded_tracks,
             "recording": self.is_recording(),
             "midi_enabled": self.midi_enabled,
             "effects_enabled": self.effects_enabled,
@@ -515,7 +620,7 @@ class EnhancedDJMixer(DJMixer):
                     "channels": self.pyaudio_mixer.output_device.max_output_channels,
                 }
 
-        for track_name in self.get_loaded_tracks():
+        for track_name in loaded_tracks:
             status["tracks"][track_name] = {
                 "volume": self.get_track_volume(track_name),
                 "playing": (
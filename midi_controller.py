@@ -4,10 +4,14 @@ MIDI Controller Support for DJ Mixer
 Handles MIDI input and mapping to mixer controls
 """
 
+from array import array
 from typing import Dict, Callable, Optional, List, Any
 from dataclasses import dataclass
 from enum import Enum
 
+# MIDI control and note numbers are 7-bit
+MIDI_CONTROL_COUNT = 128
+
 
 class MIDIControlType(Enum):
     """Types of MIDI controls"""
@@ -37,6 +41,12 @@ class MIDIController:
     def __init__(self):
         self.mappings: Dict[int, MIDIMapping] = {}
         self.callbacks: Dict[str, Callable] = {}
+        # Per-control handlers resolved from mappings + callbacks, and the
+        # last continuous value seen so unchanged fader/knob input is skipped
+        self._cc_table: List[Optional[Callable[[int], None]]] = [
+            None
+        ] * MIDI_CONTROL_COUNT
+        self._last_values = array("h", [-1] * MIDI_CONTROL_COUNT)
         self.midi_input = None
         self.connected = False
         self.device_name = ""
@@ -128,27 +138,68 @@ class MIDIController:
             channel=channel,
         )
         self.mappings[control_number] = mapping
+        self._update_dispatch(control_number)
 
     def remove_mapping(self, control_number: int) -> bool:
         """Remove a MIDI control mapping"""
         if control_number in self.mappings:
             del self.mappings[control_number]
+            self._update_dispatch(control_number)
             return True
         return False
 
     def register_callback(self, function_name: str, callback: Callable) -> None:
         """Register a callback function for a mixer function"""
         self.callbacks[function_name] = callback
+        self._update_dispatch_for(function_name)
 
     def unregister_callback(self, function_name: str) -> None:
         """Unregister a callback function"""
         if function_name in self.callbacks:
             del self.callbacks[function_name]
+            self._update_dispatch_for(function_name)
+
+    def _update_dispatch_for(self, function_name: str) -> None:
+        """Rebuild dispatch entries for every control mapped to a function"""
+        for control_number, mapping in self.mappings.items():
+            if mapping.function_name == function_name:
+                self._update_dispatch(control_number)
+
+    def _update_dispatch(self, control_number: int) -> None:
+        """Rebuild the dispatch table entry for a control number"""
+        if not 0 <= control_number < MIDI_CONTROL_COUNT:
+            return
+
+        self._last_values[control_number] = -1
+        mapping = self.mappings.get(control_number)
+        callback = self.callbacks.get(mapping.function_name) if mapping else None
+        self._cc_table[control_number] = (
+            self._make_handler(mapping, callback) if callback else None
+        )
+
+    def _make_handler(
+        self, mapping: MIDIMapping, callback: Callable
+    ) -> Optional[Callable[[int], None]]:
+        """Build the value handler for a mapping"""
+        if mapping.control_type in (MIDIControlType.KNOB, MIDIControlType.FADER):
+            control_number = mapping.control_number
+            min_value = mapping.min_value
+            value_range = mapping.max_value - mapping.min_value
+            last_values = self._last_values
 
-    def _normalize_midi_value(self, midi_value: int, mapping: MIDIMapping) -> float:
-        """Normalize MIDI value (0-127) to mapped range"""
-        normalized = midi_value / 127.0
-        return mapping.min_value + normalized * (mapping.max_value - mapping.min_value)
+            def handle_continuous(value: int) -> None:
+                if last_values[control_number] == value:
+                    return
+                last_values[control_number] = value
+                callback(min_value + (value / 127.0) * value_range)
+
+            return handle_continuous
+
+        if mapping.control_type in (MIDIControlType.BUTTON, MIDIControlType.PAD):
+            # Button pressed (value > 0)
+            return lambda value: callback(value > 0)
+
+        return None
 
     def process_message(self, message: Any) -> None:
         """Process incoming MIDI message"""
@@ -163,28 +214,12 @@ class MIDIController:
             else:
                 return
 
-            # Check if we have a mapping for this control
-            if control_number not in self.mappings:
+            if not 0 <= control_number < MIDI_CONTROL_COUNT:
                 return
 
-            mapping = self.mappings[control_number]
-
-            # Get callback function
-            if mapping.function_name not in self.callbacks:
-                return
-
-            callback = self.callbacks[mapping.function_name]
-
-            # Normalize value and call callback
-            if mapping.control_type in [MIDIControlType.KNOB, MIDIControlType.FADER]:
-                normalized_value = self._normalize_midi_value(value, mapping)
-                callback(normalized_value)
-            elif mapping.control_type in [MIDIControlType.BUTTON, MIDIControlType.PAD]:
-                # Button pressed (value > 0)
-                if value > 0:
-                    callback(True)
-                else:
-                    callback(False)
+            handler = self._cc_table[control_number]
+            if handler is not None:
+                handler(value)
 
         except Exception as e:
             print(f"Error processing MIDI message: {e}")
@@ -222,6 +257,7 @@ class MIDIController:
     def clear_mappings(self) -> None:
         """Clear all MIDI mappings"""
         self.mappings.clear()
+        self._cc_table[:] = [None] * MIDI_CONTROL_COUNT
 
     def load_mapping_preset(self, preset_name: str) -> bool:
         """Load a predefined mapping preset"""
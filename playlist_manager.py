@@ -5,13 +5,18 @@ Handles playlist creation, loading, saving, and navigation
 """
 
 import json
-from typing import List, Optional, Dict
+import sys
+import numpy as np
+from typing import Iterable, List, Optional, Dict, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class PlaylistTrack:
     """Represents a track in a playlist"""
 
@@ -29,6 +34,16 @@ class PlaylistTrack:
         if not self.added_date:
             self.added_date = datetime.now().isoformat()
 
+    @classmethod
+    def from_tuple(
+        cls, values: Tuple[str, str, str, float, str, float]
+    ) -> "PlaylistTrack":
+        """Create a track from a (path, title, artist, bpm, key, duration) tuple"""
+        path, title, artist, bpm, key, duration = values
+        return cls(
+            path=path, title=title, artist=artist, bpm=bpm, key=key, duration=duration
+        )
+
 
 class Playlist:
     """Playlist management class"""
@@ -47,6 +62,15 @@ class Playlist:
         self.modified_date = datetime.now().isoformat()
         return True
 
+    def add_tracks_from_tuples(
+        self, rows: Iterable[Tuple[str, str, str, float, str, float]]
+    ) -> List[PlaylistTrack]:
+        """Add tracks from (path, title, artist, bpm, key, duration) tuples"""
+        tracks = [PlaylistTrack.from_tuple(row) for row in rows]
+        self.tracks.extend(tracks)
+        self.modified_date = datetime.now().isoformat()
+        return tracks
+
     def add_track_from_path(self, file_path: str, **metadata) -> bool:
         """Add a track from file path with optional metadata"""
         path = Path(file_path)
@@ -131,9 +155,17 @@ class Playlist:
             self.current_index = 0
         self.modified_date = datetime.now().isoformat()
 
+    def _bpm_array(self) -> np.ndarray:
+        """Gather track BPMs into a contiguous array"""
+        return np.fromiter(
+            (t.bpm for t in self.tracks), dtype=np.float64, count=len(self.tracks)
+        )
+
     def sort_by_bpm(self, ascending: bool = True) -> None:
         """Sort playlist by BPM"""
-        self.tracks.sort(key=lambda t: t.bpm, reverse=not ascending)
+        bpm = self._bpm_array()
+        order = np.argsort(bpm if ascending else -bpm, kind="stable")
+        self.tracks[:] = [self.tracks[i] for i in order]
         self.current_index = 0
         self.modified_date = datetime.now().isoformat()
 
@@ -151,7 +183,9 @@ class Playlist:
 
     def filter_by_bpm(self, min_bpm: float, max_bpm: float) -> List[PlaylistTrack]:
         """Get tracks within BPM range"""
-        return [t for t in self.tracks if min_bpm <= t.bpm <= max_bpm]
+        bpm = self._bpm_array()
+        mask = (bpm >= min_bpm) & (bpm <= max_bpm)
+        return [self.tracks[i] for i in np.flatnonzero(mask)]
 
     def filter_by_key(self, key: str) -> List[PlaylistTrack]:
         """Get tracks in specific key"""
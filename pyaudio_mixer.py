@@ -7,7 +7,7 @@ Provides professional audio interface control with low-latency ASIO support
 
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 from pydub import AudioSegment
@@ -168,6 +168,9 @@ class PyAudioMixer:
         # Audio callback lock
         self.lock = threading.Lock()
 
+        # int32 accumulator reused by the stream callback
+        self._mix_buffer = np.zeros((buffer_size, channels), dtype=np.int32)
+
     def initialize(
         self, device_index: Optional[int] = None, use_asio: bool = False
     ) -> bool:
@@ -250,28 +253,30 @@ class PyAudioMixer:
     def _audio_callback(self, in_data, frame_count, time_info, status) -> tuple:
         """PyAudio stream callback for real-time audio mixing"""
         with self.lock:
-            # Initialize output buffer
-            output = np.zeros((frame_count, self.channels), dtype=np.int16)
+            # Reuse the accumulator; only a change of block size reallocates
+            output = self._mix_buffer
+            if output.shape[0] != frame_count:
+                output = np.zeros((frame_count, self.channels), dtype=np.int32)
+                self._mix_buffer = output
+            else:
+                output.fill(0)
 
-            # Mix all playing tracks
+            # Mix all playing tracks in place
             for track in self.tracks.values():
                 if track.is_playing:
                     chunk = track.get_audio_chunk(frame_count)
                     if chunk is not None:
                         # Add to mix (with clipping prevention)
-                        output = np.clip(
-                            output.astype(np.int32) + chunk.astype(np.int32),
-                            -32768,
-                            32767,
-                        ).astype(np.int16)
+                        np.add(output, chunk, out=output)
+                        np.clip(output, -32768, 32767, out=output)
 
             # Apply master volume
             if self.master_volume != 1.0:
-                output = (output * self.master_volume).astype(np.int16)
+                np.multiply(output, self.master_volume, out=output, casting="unsafe")
 
             import pyaudio
 
-            return (output.tobytes(), pyaudio.paContinue)
+            return (output.astype(np.int16).tobytes(), pyaudio.paContinue)
 
     def load_track(self, name: str, file_path: str) -> bool:
         """Load an audio track"""
@@ -382,7 +387,7 @@ class PyAudioMixer:
         """Get list of loaded track names"""
         return list(self.tracks.keys())
 
-    def get_audio_devices(self) -> List[AudioDevice]:
+    def get_audio_devices(self) -> Sequence[AudioDevice]:
         """Get available audio output devices"""
         return self.device_manager.get_devices(output_only=True)
 
@@ -6,7 +6,8 @@ Handles recording mixer output and exporting to various formats
 
 import wave
 import numpy as np
-from typing import Optional, List
+from collections import deque
+from typing import Deque, Iterable, Optional, List
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
@@ -30,10 +31,12 @@ class AudioRecorder:
     def __init__(self, settings: Optional[RecordingSettings] = None):
         self.settings = settings or RecordingSettings()
         self.is_recording = False
-        self.recorded_data: List[np.ndarray] = []
+        self.recorded_data: Deque[np.ndarray] = deque()
+        self._recorded_size = 0
         self.start_time: Optional[float] = None
         self.duration: float = 0.0
         self.output_file: Optional[str] = None
+        self._stopped = threading.Event()
 
     def start_recording(self, output_file: Optional[str] = None) -> bool:
         """Start recording audio"""
@@ -47,8 +50,10 @@ class AudioRecorder:
             output_file = f"dj_mix_{timestamp}.{self.settings.format}"
 
         self.output_file = output_file
-        self.recorded_data = []
+        self.recorded_data.clear()
+        self._recorded_size = 0
         self.start_time = time.time()
+        self._stopped.clear()
         self.is_recording = True
 
         print(f"Recording started: {self.output_file}")
@@ -62,6 +67,7 @@ class AudioRecorder:
 
         self.is_recording = False
         self.duration = time.time() - self.start_time if self.start_time else 0.0
+        self._stopped.set()
 
         # Save recorded data
         if self.recorded_data and self.output_file:
@@ -90,6 +96,7 @@ class AudioRecorder:
         """Capture audio data during recording"""
         if self.is_recording and len(audio_data) > 0:
             self.recorded_data.append(audio_data.copy())
+            self._recorded_size += len(audio_data)
 
     def save_recording(self, output_file: str) -> bool:
         """Save recorded audio to file"""
@@ -98,19 +105,16 @@ class AudioRecorder:
             return False
 
         try:
-            # Concatenate all recorded chunks
-            full_audio = np.concatenate(self.recorded_data)
-
             # Determine format from extension
             file_path = Path(output_file)
             format_type = file_path.suffix.lower().lstrip(".")
 
             if format_type == "wav":
-                return self._save_wav(output_file, full_audio)
+                return self._save_wav(output_file, self.recorded_data)
             elif format_type == "mp3":
-                return self._save_mp3(output_file, full_audio)
+                return self._save_mp3(output_file, self.recorded_data)
             elif format_type == "ogg":
-                return self._save_ogg(output_file, full_audio)
+                return self._save_ogg(output_file, self.recorded_data)
             else:
                 print(f"Unsupported format: {format_type}")
                 return False
@@ -119,24 +123,23 @@ class AudioRecorder:
             print(f"Error saving recording: {e}")
             return False
 
-    def _save_wav(self, output_file: str, audio_data: np.ndarray) -> bool:
-        """Save audio as WAV file"""
+    def _save_wav(self, output_file: str, audio_data: Iterable[np.ndarray]) -> bool:
+        """Save audio chunks as WAV file"""
         try:
             with wave.open(output_file, "wb") as wav_file:
                 wav_file.setnchannels(self.settings.channels)
                 wav_file.setsampwidth(self.settings.sample_width)
                 wav_file.setframerate(self.settings.sample_rate)
 
-                # Convert to bytes
-                audio_bytes = audio_data.tobytes()
-                wav_file.writeframes(audio_bytes)
+                for chunk in audio_data:
+                    wav_file.writeframesraw(np.ascontiguousarray(chunk))
 
             return True
         except Exception as e:
             print(f"Error saving WAV: {e}")
             return False
 
-    def _save_mp3(self, output_file: str, audio_data: np.ndarray) -> bool:
+    def _save_mp3(self, output_file: str, audio_data: Iterable[np.ndarray]) -> bool:
         """Save audio as MP3 file using pydub"""
         try:
             from pydub import AudioSegment
@@ -162,7 +165,7 @@ class AudioRecorder:
             print(f"Error saving MP3: {e}")
             return False
 
-    def _save_ogg(self, output_file: str, audio_data: np.ndarray) -> bool:
+    def _save_ogg(self, output_file: str, audio_data: Iterable[np.ndarray]) -> bool:
         """Save audio as OGG file using pydub"""
         try:
             from pydub import AudioSegment
@@ -193,6 +196,13 @@ class AudioRecorder:
             return time.time() - self.start_time
         return self.duration
 
+    def wait_for_duration(self, seconds: float) -> float:
+        """Block until the recording reaches a duration or is stopped"""
+        remaining = seconds - self.get_recording_duration()
+        if self.is_recording and remaining > 0:
+            self._stopped.wait(remaining)
+        return self.get_recording_duration()
+
     def get_recording_info(self) -> dict:
         """Get information about current/last recording"""
         return {
@@ -202,12 +212,13 @@ class AudioRecorder:
             "sample_rate": self.settings.sample_rate,
             "channels": self.settings.channels,
             "format": self.settings.format,
-            "data_size": sum(len(d) for d in self.recorded_data),
+            "data_size": self._recorded_size,
         }
 
     def clear_recording(self) -> None:
         """Clear recorded data"""
-        self.recorded_data = []
+        self.recorded_data.clear()
+        self._recorded_size = 0
         self.start_time = None
         self.duration = 0.0
         self.output_file = None
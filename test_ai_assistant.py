@@ -4,6 +4,7 @@ Test AI DJ Assistant functionality
 Tests both mock and real API integration
 """
 
+import asyncio
 import time
 import json
 from ai_dj_assistant import AIDJAssistant, AITrackAnalysis, AIMixingAdvice
@@ -165,6 +166,56 @@ def test_ai_assistant_with_callbacks():
     return True
 
 
+def test_async_track_analysis():
+    """Test batched async analysis and advice in mock mode"""
+    ai = AIDJAssistant()
+    tracks = ["House Track.mp3", "Techno Beat.wav", "Trance Dreams.ogg"]
+
+    analyses = asyncio.run(ai.aanalyze_tracks(tracks))
+    assert len(analyses) == len(tracks)
+    assert all(ai.track_analyses[t] is a for t, a in zip(tracks, analyses))
+
+    advice = asyncio.run(ai.aget_auto_mixing_advice(tracks[0], tracks[1]))
+    assert isinstance(advice, AIMixingAdvice)
+
+
+def test_track_analysis_cache():
+    """Test repeated analysis reuses results until a new file is loaded"""
+    ai = AIDJAssistant()
+
+    first = ai.analyze_track("deck1", "house_track.mp3")
+    assert ai.analyze_track("deck1", "house_track.mp3") is first
+    assert ai.analyze_track("deck1") is first
+    assert ai.analyze_track("deck1", "techno_track.mp3") is not first
+
+
+def test_batch_track_analysis():
+    """Test playlist batch analysis and lenient JSON array parsing"""
+    ai = AIDJAssistant()
+    tracks = ["House Track.mp3", "Techno Beat.wav", "House Track.mp3"]
+
+    analyses = ai.analyze_tracks_batch(tracks)
+    assert len(analyses) == 3
+    assert analyses[0] is analyses[2]
+
+    text = '```json\n[{"tempo": 128}, {"tempo": 1 2}, {"tempo": 90}]\n```'
+    items = AIDJAssistant._parse_json_objects(text)
+    assert items == [{"tempo": 128}, None, {"tempo": 90}]
+
+
+def test_find_best_next_track():
+    """Test vectorized next-track selection over analyzed tracks"""
+    ai = AIDJAssistant()
+    assert ai.find_best_next_track("Unknown") is None
+
+    ai._store_analysis("current", AITrackAnalysis(tempo=128.0, key="C", energy=0.6))
+    ai._store_analysis("clash", AITrackAnalysis(tempo=128.0, key="C#", energy=0.6))
+    ai._store_analysis("match", AITrackAnalysis(tempo=126.0, key="G", energy=0.6))
+    ai._store_analysis("slow", AITrackAnalysis(tempo=90.0, key="G", energy=0.6))
+
+    assert ai.find_best_next_track("current") == "match"
+
+
 def test_key_compatibility():
     """Test harmonic key compatibility logic"""
     print("\n🎼 Testing Key Compatibility Logic")
@@ -192,6 +243,14 @@ def test_key_compatibility():
     return True
 
 
+def test_key_compatibility_not_shared():
+    """Mutating a compatibility result must not affect later calls"""
+    ai = AIDJAssistant()
+    first = ai._check_key_compatibility("C", "G")
+    first["compatibility"] = "Changed"
+    assert ai._check_key_compatibility("C", "G")["compatibility"] == "Excellent"
+
+
 if __name__ == "__main__":
     print("🧪 AI DJ Assistant Test Suite")
     print("=" * 60)
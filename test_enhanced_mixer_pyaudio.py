@@ -4,7 +4,9 @@ Test EnhancedDJMixer with PyAudio/ASIO support
 """
 
 import pytest
+import numpy as np
 from enhanced_mixer import EnhancedDJMixer
+from pyaudio_mixer import PyAudioTrack
 
 
 class TestEnhancedMixerPyAudio:
@@ -78,6 +80,21 @@ class TestEnhancedMixerPyAudio:
 
         mixer.cleanup()
 
+    def test_device_list_cached_until_refresh(self):
+        """Test device lists are cached until refresh_devices"""
+        mixer = EnhancedDJMixer(use_pyaudio=True)
+        mixer.initialize()
+
+        devices = mixer.get_audio_devices()
+        device_manager = mixer.pyaudio_mixer.device_manager
+        device_manager.available_devices = []
+        assert mixer.get_audio_devices() == devices
+
+        mixer.refresh_devices()
+        assert mixer.get_audio_devices() == []
+
+        mixer.cleanup()
+
     def test_mixer_status_with_pyaudio(self):
         """Test mixer status includes PyAudio info"""
         mixer = EnhancedDJMixer(use_pyaudio=True, use_asio=True)
@@ -92,6 +109,39 @@ class TestEnhancedMixerPyAudio:
 
         mixer.cleanup()
 
+    def test_mixer_status_snapshot(self):
+        """Test max_age reuses the last status snapshot"""
+        mixer = EnhancedDJMixer(use_pyaudio=True)
+        mixer.initialize()
+
+        status = mixer.get_mixer_status()
+        mixer.set_crossfader(0.2)
+        assert mixer.get_mixer_status(max_age=60.0) is status
+        assert mixer.get_mixer_status()["crossfader"] == 0.2
+
+        mixer.cleanup()
+
+    def test_reset_state(self):
+        """Test reset_state restores defaults but keeps the mixer initialized"""
+        mixer = EnhancedDJMixer(use_pyaudio=True)
+        mixer.initialize()
+
+        mixer.set_master_volume(0.4)
+        mixer.set_crossfader(0.9)
+        mixer.connect_midi(use_mock=True)
+        mixer.create_playlist("Set")
+
+        mixer.reset_state()
+
+        assert mixer.is_initialized is True
+        assert mixer.get_master_volume() == 1.0
+        assert mixer.get_crossfader() == 0.5
+        assert mixer.midi_enabled is False
+        assert mixer.get_current_playlist() is None
+        assert mixer.get_loaded_tracks() == []
+
+        mixer.cleanup()
+
     def test_playback_controls_pyaudio(self):
         """Test playback controls with PyAudio"""
         mixer = EnhancedDJMixer(use_pyaudio=True)
@@ -107,6 +157,39 @@ class TestEnhancedMixerPyAudio:
 
         mixer.cleanup()
 
+    def test_track_listeners(self):
+        """Test listeners are notified of play state and volume changes"""
+        mixer = EnhancedDJMixer(use_pyaudio=True)
+        mixer.initialize()
+        track = PyAudioTrack("test.wav")
+        track.audio_data = np.zeros((1024, 2), dtype=np.int16)
+        track.is_loaded = True
+        mixer.pyaudio_mixer.tracks["deck1"] = track
+
+        events = []
+
+        def on_state(name, playing):
+            events.append(("state", name, playing))
+
+        mixer.add_listener("track_state", on_state)
+        mixer.add_listener("track_volume", lambda *args: events.append(args))
+
+        assert mixer.play_track("deck1") is True
+        assert mixer.set_track_volume("deck1", 0.5) is True
+        assert mixer.stop_track("deck1") is True
+        assert mixer.play_track("missing") is False
+        assert events == [
+            ("state", "deck1", True),
+            ("deck1", 0.5),
+            ("state", "deck1", False),
+        ]
+
+        mixer.remove_listener("track_state", on_state)
+        mixer.play_track("deck1")
+        assert len(events) == 3
+
+        mixer.cleanup()
+
     def test_cleanup_pyaudio(self):
         """Test cleanup with PyAudio"""
         mixer = EnhancedDJMixer(use_pyaudio=True)
@@ -90,6 +90,72 @@ class TestAudioEffects:
         processed = effects.apply_filter(audio_data)
         assert len(processed) == len(audio_data)
 
+    def test_eq_band_cut(self):
+        """Test cutting the low band removes bass but keeps treble"""
+        t = np.arange(44100) / 44100
+        bass = 10000 * np.sin(2 * np.pi * 60 * t)
+        treble = 10000 * np.sin(2 * np.pi * 12000 * t)
+
+        effects = AudioEffects()
+        effects.set_eq(low=0.0)
+        bass_out = effects.apply_eq(bass)
+        effects.reset()
+        treble_out = effects.apply_eq(treble)
+
+        assert np.max(np.abs(bass_out[22050:])) < 1000
+        assert np.max(np.abs(treble_out[22050:])) > 9000
+
+    def test_filter_state_carries_across_buffers(self):
+        """Test streaming filter output matches filtering in one pass"""
+        audio_data = np.random.uniform(-1000, 1000, 2048)
+
+        streamed = AudioEffects()
+        streamed.set_filter("lowpass", cutoff_freq=1000.0)
+        blocks = [streamed.apply_filter(audio_data[:1024])]
+        blocks.append(streamed.apply_filter(audio_data[1024:]))
+
+        whole = AudioEffects()
+        whole.set_filter("lowpass", cutoff_freq=1000.0)
+        assert np.allclose(np.concatenate(blocks), whole.apply_filter(audio_data))
+
+    def test_apply_reverb_to_audio(self):
+        """Test reverb keeps its delay line position across blocks"""
+        effects = AudioEffects()
+        audio_data = np.random.randint(-1000, 1000, 1024, dtype=np.int16)
+
+        processed = effects.apply_reverb(audio_data)
+        assert len(processed) == len(audio_data)
+        assert processed.dtype == audio_data.dtype
+        assert effects.reverb_buffer_pos == 1024 % effects.reverb_buffer_size
+
+    def test_reverb_float_audio(self):
+        """Test float audio keeps its [-1, 1] scale through the reverb"""
+        t = np.arange(1024) / 44100.0
+        audio_data = (0.5 * np.sin(2 * np.pi * 440.0 * t)).astype(np.float32)
+
+        # The first block is shorter than the delay line, so it is all dry
+        expected = audio_data * AudioEffects().reverb.dry_level
+        for processed in (
+            AudioEffects().apply_reverb(audio_data),
+            AudioEffects().process(audio_data),
+        ):
+            assert processed.dtype == np.float32
+            assert np.abs(processed).max() > 0.3
+            assert np.allclose(processed, expected, atol=1e-3)
+
+    def test_process_bypasses_neutral_effects(self):
+        """Test processing with all effects neutral returns the input"""
+        effects = AudioEffects()
+        effects.set_reverb(wet_level=0.0, dry_level=1.0)
+        audio_data = np.random.randint(-1000, 1000, 1024, dtype=np.int16)
+
+        assert effects.process(audio_data) is audio_data
+
+        effects.set_eq(low=1.5)
+        processed = effects.process(audio_data)
+        assert processed is not audio_data
+        assert processed.dtype == audio_data.dtype
+
     def test_effects_presets(self):
         """Test effects presets"""
         bass_boost = EffectsPresets.bass_boost()
@@ -138,6 +204,41 @@ class TestBeatDetection:
         assert result.bpm > 0
         assert isinstance(result.confidence, float)
 
+    def test_detect_beats_tempo(self):
+        """Test BPM estimate on a synthetic 128 BPM click track"""
+        detector = BeatDetector()
+        audio_data = np.zeros(44100 * 10)
+        for beat in np.arange(0.1, 10.0, 60.0 / 128.0):
+            start = int(beat * 44100)
+            audio_data[start : start + 1000] = 5000 * np.exp(-np.arange(1000) / 200)
+
+        result = detector.detect_beats(audio_data, 10.0)
+        assert abs(result.bpm - 128.0) < 1.0
+
+    def test_detect_beats_cache(self):
+        """Test repeated analysis of the same audio is served from cache"""
+        detector = BeatDetector()
+        audio_data = np.random.uniform(-1000, 1000, 44100)
+
+        result = detector.detect_beats(audio_data, 1.0)
+        cached = detector.detect_beats(audio_data, 1.0)
+        assert cached is not result
+        assert cached.beat_grid is result.beat_grid
+        assert not result.beat_grid.flags.writeable
+        assert not result.beat_positions.flags.writeable
+
+        # Callers get their own BeatInfo, so edits don't reach the cache
+        cached.bpm = 0.0
+        assert detector.detect_beats(audio_data, 1.0).bpm == result.bpm
+
+        # A change between strided samples still misses the cache
+        changed = audio_data.copy()
+        changed[1] += 1.0
+        assert detector.detect_beats(changed, 1.0).beat_grid is not result.beat_grid
+
+        detector.clear_cache()
+        assert detector.detect_beats(audio_data, 1.0).beat_grid is not result.beat_grid
+
     def test_auto_sync_initialization(self):
         """Test auto sync initialization"""
         auto_sync = AutoSync()
@@ -160,6 +261,22 @@ class TestBeatDetection:
         result = auto_sync.calculate_sync_adjustment(80.0, 160.0)
         assert result["sync_possible"] == False
 
+    def test_beat_match_point(self):
+        """Test beat match point follows track1's phase in the measure"""
+        auto_sync = AutoSync()
+        grid1 = [0.5 * i for i in range(16)]
+        grid2 = [0.25 + 0.5 * i for i in range(16)]
+        track1 = BeatInfo(120.0, grid1, grid1, 1.0, 0.0)
+        track2 = BeatInfo(120.0, grid2, grid2, 1.0, 0.25)
+
+        # Next beat at 1.0s is beat 3 of the measure
+        assert auto_sync.get_beat_match_point(track1, track2, 0.9) == grid2[3]
+        # Past the end the last beat is used
+        assert auto_sync.get_beat_match_point(track1, track2, 100.0) == grid2[0]
+
+        timing = auto_sync.suggest_mix_timing(track1, track2, 0.9)
+        assert timing["match_point"] == 1.75
+
 
 class TestPlaylistManagement:
     """Test playlist management module"""
@@ -230,6 +347,21 @@ class TestPlaylistManagement:
         assert playlist.current_index == 0
         assert track.title == "Track 1"
 
+    def test_add_tracks_from_tuples(self):
+        """Test bulk-adding tracks from tuples"""
+        playlist = Playlist()
+        added = playlist.add_tracks_from_tuples(
+            [
+                ("/track1.mp3", "Track 1", "Artist 1", 128.0, "Am", 240.0),
+                ("/track2.mp3", "Track 2", "Artist 2", 135.0, "Dm", 180.0),
+            ]
+        )
+
+        assert len(added) == 2
+        assert playlist.get_track_count() == 2
+        assert playlist.tracks[1].bpm == 135.0
+        assert playlist.get_total_duration() == 420.0
+
     def test_filter_by_bpm(self):
         """Test filtering tracks by BPM"""
         playlist = Playlist()
@@ -359,6 +491,30 @@ class TestMIDIController:
         assert len(called_values) > 0
         assert 0.0 <= called_values[0] <= 1.0
 
+    def test_repeated_control_values_skipped(self):
+        """Test unchanged fader values are not re-dispatched"""
+        controller = MockMIDIController()
+        fader_values = []
+        button_values = []
+
+        controller.add_mapping(1, MIDIControlType.FADER, "volume")
+        controller.add_mapping(16, MIDIControlType.BUTTON, "play")
+        controller.register_callback("volume", fader_values.append)
+        controller.register_callback("play", button_values.append)
+
+        for value in (64, 64, 127, 64):
+            controller.simulate_control_change(1, value)
+        for value in (127, 127):
+            controller.simulate_control_change(16, value)
+
+        assert len(fader_values) == 3
+        assert fader_values[1] == 1.0
+        assert button_values == [True, True]
+
+        controller.remove_mapping(1)
+        controller.simulate_control_change(1, 0)
+        assert len(fader_values) == 3
+
     def test_load_mapping_preset(self):
         """Test loading mapping presets"""
         controller = MockMIDIController()
@@ -405,6 +561,19 @@ class TestRecording:
         assert recorder.resume_recording() == True
         assert recorder.is_recording == True
 
+    def test_wait_for_duration(self):
+        """Test waiting on recording duration"""
+        import threading
+
+        recorder = AudioRecorder()
+        recorder.start_recording("test.wav")
+        assert recorder.wait_for_duration(0.05) >= 0.05
+
+        # Stopping wakes a waiter early
+        threading.Timer(0.05, recorder.stop_recording).start()
+        assert recorder.wait_for_duration(10.0) < 1.0
+        assert recorder.is_recording == False
+
     def test_get_recording_info(self):
         """Test getting recording information"""
         recorder = AudioRecorder()
@@ -455,6 +624,40 @@ class TestWaveformDisplay:
         assert len(mags) > 0
         assert len(freqs) == len(mags)
 
+    def test_generate_spectrum_tone(self):
+        """Test averaged spectrum peaks at the tone frequency"""
+        generator = WaveformGenerator(sample_rate=44100)
+        t = np.arange(44100 * 3) / 44100
+        audio_data = (np.sin(2 * np.pi * 1000 * t) * 10000).astype(np.int16)
+
+        freqs, mags = generator.generate_spectrum(audio_data, frames=None)
+
+        assert len(freqs) == 1025
+        assert abs(freqs[np.argmax(mags)] - 1000) < freqs[1]
+
+    def test_generate_spectrum_centre_window(self):
+        """Test the spectrum only looks at the middle unless asked for more"""
+        generator = WaveformGenerator(sample_rate=44100)
+        t = np.arange(44100) / 44100
+        audio_data = np.zeros(44100 * 3)
+        audio_data[:44100] = np.sin(2 * np.pi * 1000 * t) * 10000
+
+        freqs, mags = generator.generate_spectrum(audio_data)
+        assert mags.max() == 0.0
+
+        freqs, mags = generator.generate_spectrum(audio_data, frames=None)
+        assert abs(freqs[np.argmax(mags)] - 1000) < freqs[1]
+
+    def test_calculate_peaks(self):
+        """Test peak detection"""
+        generator = WaveformGenerator()
+        audio_data = np.zeros(1000, dtype=np.int16)
+        audio_data[[100, 500]] = 8000
+        audio_data[800] = -8000
+        audio_data[300:302] = 8000  # Flat top is not a strict peak
+
+        assert generator.calculate_peaks(audio_data) == [100, 500, 800]
+
     def test_waveform_display_initialization(self):
         """Test waveform display initialization"""
         display = WaveformDisplay(width=800, height=200)
@@ -519,6 +722,7 @@ class TestDeviceRouting:
         devices = manager.get_devices(output_only=True)
         assert len(devices) > 0
         assert all(d.max_output_channels > 0 for d in devices)
+        assert manager.get_devices(output_only=True) is devices
 
     def test_get_default_output(self):
         """Test getting default output device"""
@@ -531,6 +735,29 @@ class TestDeviceRouting:
         assert default is not None
         assert default.is_default_output == True
 
+    def test_get_device_by_index(self):
+        """Test looking up devices by index"""
+        from device_routing import AudioDeviceManager
+
+        manager = AudioDeviceManager()
+        manager.initialize(use_mock=True)
+
+        for device in manager.available_devices:
+            assert manager.get_device_by_index(device.index) is device
+        assert manager.get_device_by_index(99) is None
+
+    def test_get_device_by_name(self):
+        """Test case-insensitive partial name lookup"""
+        from device_routing import AudioDeviceManager
+
+        manager = AudioDeviceManager()
+        manager.initialize(use_mock=True)
+
+        device = manager.get_device_by_name("headphones")
+        assert device is not None
+        assert device.name == "Headphones Output (Mock)"
+        assert manager.get_device_by_name("no such device") is None
+
     def test_add_route(self):
         """Test adding audio route"""
         from device_routing import AudioDeviceManager
@@ -544,6 +771,18 @@ class TestDeviceRouting:
         assert success == True
         assert "deck1" in manager.routes
 
+    def test_add_route_rejects_bad_channels(self):
+        """Test routes with empty or out-of-range channels are rejected"""
+        from device_routing import AudioDeviceManager
+
+        manager = AudioDeviceManager()
+        manager.initialize(use_mock=True)
+
+        device = manager.get_default_output_device()
+        assert manager.add_route("deck1", device.index, []) == False
+        assert manager.add_route("deck1", device.index, [0, 2]) == False
+        assert "deck1" not in manager.routes
+
     def test_remove_route(self):
         """Test removing audio route"""
         from device_routing import AudioDeviceManager
@@ -557,6 +796,19 @@ class TestDeviceRouting:
         assert manager.remove_route("deck1") == True
         assert "deck1" not in manager.routes
 
+    def test_get_all_routes_read_only(self):
+        """Test get_all_routes returns a live read-only view"""
+        from device_routing import AudioDeviceManager
+
+        manager = AudioDeviceManager()
+        manager.initialize(use_mock=True)
+
+        routes = manager.get_all_routes()
+        manager.setup_default_routing()
+        assert "master" in routes
+        with pytest.raises(TypeError):
+            routes["deck1"] = routes["master"]
+
     def test_enable_disable_route(self):
         """Test enabling/disabling routes"""
         from device_routing import AudioDeviceManager
@@ -595,6 +847,50 @@ class TestDeviceRouting:
         assert manager.setup_dj_routing() == True
         assert "master" in manager.routes
         assert "headphone_cue" in manager.routes
+        headphones = manager.get_device_by_name("headphones")
+        assert manager.routes["headphone_cue"].device_index == headphones.index
+
+    def test_routing_devices_from_env(self, monkeypatch):
+        """Test preferred device indices from the environment override the scan"""
+        from device_routing import AudioDeviceManager
+
+        monkeypatch.setenv("DJ_MAIN_DEVICE", "2")
+        monkeypatch.setenv("DJ_HEADPHONE_DEVICE", "3")
+        monkeypatch.setenv("DJ_ZONE3_DEVICE", "99")
+
+        manager = AudioDeviceManager()
+        manager.initialize(use_mock=True)
+
+        assert manager.setup_dj_routing() == True
+        assert manager.routes["master"].device_index == 2
+        assert manager.routes["headphone_cue"].device_index == 3
+
+        # An unknown index falls back to the devices not already chosen
+        assert manager.setup_multi_zone_routing() == True
+        assert manager.routes["master"].device_index == 2
+        assert manager.routes["zone2_deck1"].device_index == 0
+        assert manager.routes["zone3_deck2"].device_index == 1
+
+    def test_routing_partial_env_keeps_devices_distinct(self, monkeypatch):
+        """Test outputs filled from the scan skip devices chosen via env vars"""
+        from device_routing import AudioDeviceManager
+
+        monkeypatch.setenv("DJ_ZONE3_DEVICE", "0")
+        monkeypatch.setenv("DJ_HEADPHONE_DEVICE", "0")
+
+        manager = AudioDeviceManager()
+        manager.initialize(use_mock=True)
+
+        assert manager.setup_multi_zone_routing() == True
+        zones = [
+            manager.routes[name].device_index
+            for name in ("master", "zone2_deck1", "zone3_deck2")
+        ]
+        assert zones == [1, 2, 0]
+
+        assert manager.setup_dj_routing() == True
+        assert manager.routes["headphone_cue"].device_index == 0
+        assert manager.routes["master"].device_index != 0
 
     def test_get_asio_devices(self):
         """Test getting ASIO devices"""
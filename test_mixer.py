@@ -5,7 +5,7 @@ Useful for testing the interface and logic without requiring actual audio device
 """
 
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -227,6 +227,13 @@ class MockDJMixer:
         """Get list of loaded track names"""
         return list(self.tracks.keys())
 
+    def get_track_states(self) -> Dict[str, Tuple[float, bool]]:
+        """Get {track_name: (volume, playing)} for all loaded tracks"""
+        return {
+            name: (track.get_volume(), track.is_track_playing())
+            for name, track in list(self.tracks.items())
+        }
+
     def get_track_status(self, name: str) -> dict:
         """Get status information for a specific track"""
         if name not in self.tracks:
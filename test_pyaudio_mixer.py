@@ -246,6 +246,27 @@ class TestPyAudioMixer:
 
         mixer.cleanup()
 
+    def test_audio_callback_mixes_in_place(self, monkeypatch):
+        """Test the stream callback clips the mix and reuses its buffer"""
+        import sys
+        import types
+
+        monkeypatch.setitem(sys.modules, "pyaudio", types.SimpleNamespace(paContinue=0))
+        mixer = PyAudioMixer(use_mock=True)
+        for name, level in (("deck1", 30000), ("deck2", 10000)):
+            track = PyAudioTrack(f"{name}.wav")
+            track.audio_data = np.full((2048, 2), level, dtype=np.int16)
+            track.is_loaded = True
+            track.play()
+            mixer.tracks[name] = track
+        mixer.master_volume = 0.5
+
+        buffer = mixer._mix_buffer
+        data, _ = mixer._audio_callback(None, 512, None, None)
+        assert np.all(np.frombuffer(data, dtype=np.int16) == 16383)
+        mixer._audio_callback(None, 512, None, None)
+        assert mixer._mix_buffer is buffer
+
     def test_cleanup(self):
         """Test cleanup"""
         mixer = PyAudioMixer(use_mock=True)
@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from test_mixer import MockDJMixer
+from dj_cli import DJMixerCLI
 
 
 class TestDJMixer:
@@ -145,6 +146,21 @@ class TestDJMixer:
         assert status["crossfader_position"] == 0.3
         assert status["is_initialized"] == True
 
+    def test_track_states(self):
+        """Test per-track (volume, playing) states in one call"""
+        self.mixer.initialize()
+        assert self.mixer.get_track_states() == {}
+
+        self.mixer.load_track("deck1", "test_track.mp3")
+        self.mixer.load_track("deck2", "test_track2.mp3")
+        self.mixer.play_track("deck1")
+        self.mixer.set_track_volume("deck2", 0.4)
+
+        assert self.mixer.get_track_states() == {
+            "deck1": (1.0, True),
+            "deck2": (0.4, False),
+        }
+
     def test_error_handling(self):
         """Test error handling for invalid operations"""
         # Test operations before initialization
@@ -198,6 +214,65 @@ class TestMockAudioTrack:
         assert track.is_playing == False
 
 
+class TestDJMixerCLI:
+    """Test command dispatch and argument parsing in the DJ Mixer CLI"""
+
+    def setup_method(self):
+        """Set up a CLI driving the mock mixer"""
+        self.cli = DJMixerCLI()
+        self.cli.mixer = MockDJMixer()
+        self.cli.mixer.initialize()
+        self.cli.initialized = True
+        self.cli.onecmd("load deck1 house track.mp3")
+        self.cli.onecmd("load deck2 techno.wav")
+
+    def test_play_defaults_to_last_track(self):
+        """Test play with no argument uses the last track"""
+        assert self.cli.onecmd("play") is None
+        assert self.cli.mixer.is_track_playing("deck2") == True
+        assert self.cli.mixer.is_track_playing("deck1") == False
+
+    def test_play_without_any_track(self, capsys):
+        """Test play with no argument and no previous track prints usage"""
+        self.cli._last_track = None
+        self.cli.onecmd("play")
+        assert "Usage: play" in capsys.readouterr().out
+
+    def test_volume_arguments(self):
+        """Test volume with a level only and with a track name"""
+        self.cli.onecmd("volume 0.4")
+        assert self.cli.mixer.get_track_volume("deck2") == 0.4
+
+        self.cli.onecmd("volume deck1  0.3")
+        assert self.cli.mixer.get_track_volume("deck1") == 0.3
+
+        # deck1 is now the last track
+        self.cli.onecmd("volume 0.6")
+        assert self.cli.mixer.get_track_volume("deck1") == 0.6
+
+    def test_unknown_command(self, capsys):
+        """Test unknown commands fall through to the default handler"""
+        self.cli.stdout = sys.stdout  # cmd.Cmd writes errors to its own stream
+        assert self.cli.onecmd("scratch deck1") is None
+        assert "Unknown syntax: scratch deck1" in capsys.readouterr().out
+
+    def test_blank_line_repeats_last_command(self):
+        """Test an empty line repeats the previous command"""
+        self.cli.onecmd("volume deck1 0.4")
+        self.cli.mixer.set_track_volume("deck1", 1.0)
+
+        self.cli.onecmd("")
+        assert self.cli.lastcmd == "volume deck1 0.4"
+        assert self.cli.mixer.get_track_volume("deck1") == 0.4
+
+    def test_eof_quits(self, capsys):
+        """Test EOF quits without becoming the repeatable command"""
+        self.cli.onecmd("status")
+        assert self.cli.onecmd("EOF") == True
+        assert self.cli.lastcmd == ""
+        assert "Goodbye" in capsys.readouterr().out
+
+
 def test_main_functionality():
     """Integration test for main mixer functionality"""
     mixer = MockDJMixer()
@@ -5,15 +5,22 @@ Provides waveform visualization and analysis
 """
 
 import numpy as np
-from typing import Optional, Tuple, List
+import scipy.fft as sfft
+from scipy.signal import find_peaks
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Optional, Tuple, List
 from pathlib import Path
 
+# Frames per rfft batch when averaging the spectrum
+SPECTRUM_BLOCK_FRAMES = 64
+
 
 class WaveformGenerator:
     """Generates waveform data for visualization"""
 
     def __init__(self, sample_rate: int = 44100):
         self.sample_rate = sample_rate
+        self._spectrum_plans: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
 
     def generate_waveform(
         self, audio_data: np.ndarray, width: int = 1000
@@ -44,18 +51,13 @@ class WaveformGenerator:
             samples_per_pixel = 1
             width = len(audio_mono)
 
-        # Generate min/max values for each pixel
-        min_values = np.zeros(width)
-        max_values = np.zeros(width)
-
-        for i in range(width):
-            start = i * samples_per_pixel
-            end = min(start + samples_per_pixel, len(audio_mono))
-
-            if start < len(audio_mono):
-                segment = audio_mono[start:end]
-                min_values[i] = np.min(segment)
-                max_values[i] = np.max(segment)
+        # Min/max per pixel in one reduction over a (width, bucket) view;
+        # trailing samples that don't fill a bucket are dropped
+        buckets = audio_mono[: width * samples_per_pixel].reshape(
+            width, samples_per_pixel
+        )
+        min_values = buckets.min(axis=1).astype(np.float64)
+        max_values = buckets.max(axis=1).astype(np.float64)
 
         return min_values, max_values
 
@@ -96,14 +98,19 @@ class WaveformGenerator:
             return np.array([]), np.array([])
 
     def generate_spectrum(
-        self, audio_data: np.ndarray, fft_size: int = 2048
+        self,
+        audio_data: np.ndarray,
+        fft_size: int = 2048,
+        frames: Optional[int] = 1,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generate frequency spectrum data
+        Generate frequency spectrum data, averaged over Hann-windowed
+        frames with 50% overlap centred on the middle of the audio
 
         Args:
             audio_data: Audio samples
             fft_size: FFT window size
+            frames: Number of frames to average (None for the whole track)
 
         Returns:
             Tuple of (frequencies, magnitudes) arrays
@@ -117,28 +124,45 @@ class WaveformGenerator:
         else:
             audio_mono = audio_data
 
-        # Apply window
-        window = np.hanning(fft_size)
-
-        # Take middle section if audio is longer than fft_size
-        if len(audio_mono) > fft_size:
-            start = (len(audio_mono) - fft_size) // 2
-            audio_segment = audio_mono[start : start + fft_size]
-        else:
-            # Pad with zeros if shorter
-            audio_segment = np.pad(audio_mono, (0, fft_size - len(audio_mono)))
-
-        # Apply window and compute FFT
-        windowed = audio_segment * window
-        spectrum = np.fft.rfft(windowed)
-
-        # Calculate magnitude
-        magnitude = np.abs(spectrum)
-
-        # Calculate frequencies
-        frequencies = np.fft.rfftfreq(fft_size, 1.0 / self.sample_rate)
-
-        return frequencies, magnitude
+        window, frequencies = self._get_spectrum_plan(fft_size)
+
+        # Pad with zeros if shorter than one frame
+        if len(audio_mono) < fft_size:
+            audio_mono = np.pad(audio_mono, (0, fft_size - len(audio_mono)))
+
+        # Take the middle section spanned by the requested frames
+        hop = fft_size // 2
+        span = len(audio_mono)
+        if frames is not None:
+            span = min(span, fft_size + hop * (max(frames, 1) - 1))
+        start = (len(audio_mono) - span) // 2
+        audio_segment = audio_mono[start : start + span]
+
+        frame_view = sliding_window_view(audio_segment, fft_size)[::hop]
+
+        # Average magnitudes a block of frames at a time to bound memory use
+        magnitude = np.zeros(len(frequencies))
+        for first in range(0, len(frame_view), SPECTRUM_BLOCK_FRAMES):
+            block = frame_view[first : first + SPECTRUM_BLOCK_FRAMES].astype(np.float32)
+            block *= window
+            spectrum = sfft.rfft(block, axis=1, workers=-1)
+            magnitude += np.abs(spectrum).sum(axis=0)
+        magnitude /= len(frame_view)
+
+        return frequencies, magnitude.astype(np.float32)
+
+    def _get_spectrum_plan(self, fft_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the cached (window, frequencies) pair for an FFT size"""
+        plan = self._spectrum_plans.get(fft_size)
+        if plan is None:
+            plan = (
+                np.hanning(fft_size).astype(np.float32),
+                sfft.rfftfreq(fft_size, 1.0 / self.sample_rate),
+            )
+            for arr in plan:
+                arr.flags.writeable = False
+            self._spectrum_plans[fft_size] = plan
+        return plan
 
     def calculate_peaks(
         self, audio_data: np.ndarray, threshold: Optional[float] = None
@@ -162,21 +186,17 @@ class WaveformGenerator:
         else:
             audio_mono = audio_data
 
+        magnitude = np.abs(audio_mono.astype(np.float64))
+
         # Calculate threshold if not provided
         if threshold is None:
-            threshold = np.mean(np.abs(audio_mono)) + np.std(np.abs(audio_mono))
-
-        # Find peaks
-        peaks = []
-        for i in range(1, len(audio_mono) - 1):
-            if (
-                abs(audio_mono[i]) > threshold
-                and abs(audio_mono[i]) > abs(audio_mono[i - 1])
-                and abs(audio_mono[i]) > abs(audio_mono[i + 1])
-            ):
-                peaks.append(i)
-
-        return peaks
+            threshold = np.mean(magnitude) + np.std(magnitude)
+
+        # Strict single-sample local maxima of the magnitude above threshold
+        peaks, _ = find_peaks(magnitude, height=threshold, plateau_size=(1, 1))
+        peaks = peaks[magnitude[peaks] > threshold]
+
+        return peaks.tolist()
 
 
 class WaveformDisplay:
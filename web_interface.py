@@ -13,6 +13,9 @@ import threading
 import time
 from pathlib import Path
 
+# Seconds a status snapshot may be reused across polls and broadcasts
+STATUS_MAX_AGE = 0.5
+
 
 class DJMixerWebServer:
     """Web server for DJ Mixer with REST API and WebSocket support"""
@@ -59,21 +62,7 @@ class DJMixerWebServer:
         def get_status():
             """Get mixer status"""
             try:
-                status = {
-                    "initialized": self.mixer.is_initialized,
-                    "master_volume": self.mixer.get_master_volume(),
-                    "crossfader": self.mixer.get_crossfader(),
-                    "loaded_tracks": self.mixer.get_loaded_tracks(),
-                    "tracks": {},
-                }
-
-                for track_name in self.mixer.get_loaded_tracks():
-                    status["tracks"][track_name] = {
-                        "volume": self.mixer.get_track_volume(track_name),
-                        "playing": self.mixer.is_track_playing(track_name),
-                    }
-
-                return jsonify(status)
+                return jsonify(self._get_status())
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
 
@@ -190,24 +179,34 @@ class DJMixerWebServer:
             """Handle status request from client"""
             self._broadcast_status()
 
-    def _broadcast_status(self):
-        """Broadcast current status to all connected clients"""
-        try:
-            status = {
-                "initialized": self.mixer.is_initialized,
-                "master_volume": self.mixer.get_master_volume(),
-                "crossfader": self.mixer.get_crossfader(),
-                "loaded_tracks": self.mixer.get_loaded_tracks(),
-                "tracks": {},
+    def _get_status(self) -> dict:
+        """Build the status payload, reusing a recent snapshot when possible"""
+        # Every client polls each second on top of the broadcast loop, so
+        # mixers that keep a status snapshot rebuild it at most once per
+        # STATUS_MAX_AGE
+        if hasattr(self.mixer, "get_mixer_status"):
+            return self.mixer.get_mixer_status(max_age=STATUS_MAX_AGE)
+
+        status = {
+            "initialized": self.mixer.is_initialized,
+            "master_volume": self.mixer.get_master_volume(),
+            "crossfader": self.mixer.get_crossfader(),
+            "loaded_tracks": self.mixer.get_loaded_tracks(),
+            "tracks": {},
+        }
+
+        for track_name in status["loaded_tracks"]:
+            status["tracks"][track_name] = {
+                "volume": self.mixer.get_track_volume(track_name),
+                "playing": self.mixer.is_track_playing(track_name),
             }
 
-            for track_name in self.mixer.get_loaded_tracks():
-                status["tracks"][track_name] = {
-                    "volume": self.mixer.get_track_volume(track_name),
-                    "playing": self.mixer.is_track_playing(track_name),
-                }
+        return status
 
-            self.socketio.emit("status_update", status)
+    def _broadcast_status(self):
+        """Broadcast current status to all connected clients"""
+        try:
+            self.socketio.emit("status_update", self._get_status())
         except Exception as e:
             print(f"Error broadcasting status: {e}")
 